@@ -0,0 +1,43 @@
+"""
+Benchmark printing torrent tables in a terminal
+
+The table is printed to /dev/null with a fake terminal size, so columns are
+fitted into the terminal like `stig ls` does.
+
+Usage: python3 benchmarks/cli_table.py
+"""
+
+import contextlib
+import os
+from types import SimpleNamespace
+
+import resources_bench as rsrc
+
+from stig.client.aiotransmission.torrent import Torrent
+from stig.commands.cli import _table
+from stig.views.torrent import COLUMNS
+
+SIZES = (1000, 10000, 50000)
+ORDER = ('size', 'downloaded', 'uploaded', 'ratio', 'seeds', 'peers', 'status',
+         'eta', '%downloaded', 'rate-down', 'rate-up', 'added', 'name')
+TERMSIZES = ((80, 50), (200, 50))
+
+
+def print_table(torrents):
+    with open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            _table.print_table(torrents, list(ORDER), COLUMNS)
+
+
+def main():
+    for count in SIZES:
+        torrents = [Torrent(raw) for raw in rsrc.fake_raw_torrents(count)]
+        print('%d torrents:' % count)
+        for columns, lines in TERMSIZES:
+            _table.TERMSIZE = SimpleNamespace(columns=columns, lines=lines)
+            rsrc.report('  %d columns' % (columns,),
+                        rsrc.measure(print_table, torrents, repeat=3), count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark splitting command lines and filter expressions into tokens
+
+Typing a command is simulated by tokenizing every prefix of a command line,
+like the TUI's completer does for each keystroke.  Creating filters tokenizes
+filter chains and each filter expression; the cache of parsed filters is
+cleared before each filter is created unless it is measured explicitly.  The
+previous tokenizer, which creates a Char instance for each character, is also
+measured.
+
+Usage: python3 benchmarks/cliparser.py
+"""
+
+import resources_bench as rsrc
+
+from stig.client.filters import TorrentFilter
+from stig.client.filters import base as filters_base
+from stig.utils import cliparser
+
+CMDLINES = (
+    'ls',
+    'ls active&tracker~example.org --sort !rate-down,name --columns name,size,ratio',
+    "move 'name~Some Torrent with spaces' /srv/torrents/some\\ path/to\\ files",
+)
+FILTERS = (
+    'active',
+    'downloading&name~ubuntu|uploading&!private',
+    'tracker~example.org&size>1G&ratio<=2&name=~"^Some.Torrent"',
+)
+
+
+def legacy_tokenize(cmdline, maxdelims=None, **kwargs):
+    # Tokenize from Char instances like cliparser.tokenize() used to
+    tokens = []
+    token = []
+    chars = tuple(cliparser._parse(cmdline, **kwargs))
+    maxdelims = float('inf') if maxdelims is None else maxdelims
+    for i,char in enumerate(chars):
+        curdelims = int(len(tokens) / 2)
+        if char.is_delim and char.is_special and curdelims < maxdelims:
+            prev_char = chars[i - 1] if i > 0 else cliparser.Char('')
+            if not prev_char.is_delim or not prev_char.is_special:
+                if token:
+                    tokens.append(''.join(token))
+                token.clear()
+                token[:] = char
+            else:
+                token.append(char)
+            if ''.join(token) == char.delim:
+                if token:
+                    tokens.append(''.join(token))
+                    token.clear()
+            continue
+        token.append(char)
+    if token or not tokens:
+        tokens.append(''.join(token))
+    return tokens
+
+
+def type_cmdline(tokenize, cmdline):
+    for i in range(len(cmdline) + 1):
+        tokenize(cmdline[:i])
+
+
+def make_filters(filter_str, count=100, cached=False):
+    for _ in range(count):
+        if not cached:
+            filters_base.cache_clear()
+        TorrentFilter(filter_str)
+
+
+def main():
+    tokenize = cliparser.tokenize
+    for cmdline in CMDLINES:
+        assert tokenize(cmdline) == legacy_tokenize(cmdline), cmdline
+        count = len(cmdline) + 1
+        print('Typing %d characters: %s' % (len(cmdline), cmdline))
+        rsrc.report('  legacy', rsrc.measure(type_cmdline, legacy_tokenize, cmdline), count)
+        rsrc.report('  single pass', rsrc.measure(type_cmdline, tokenize, cmdline), count)
+
+    for filter_str in FILTERS:
+        print('Creating 100 filters: %s' % (filter_str,))
+        cliparser.tokenize = legacy_tokenize
+        try:
+            rsrc.report('  legacy', rsrc.measure(make_filters, filter_str), 100)
+        finally:
+            cliparser.tokenize = tokenize
+        rsrc.report('  single pass', rsrc.measure(make_filters, filter_str), 100)
+        rsrc.report('  cached', rsrc.measure(make_filters, filter_str, cached=True), 100)
+
+
+if __name__ == '__main__':
+    main()
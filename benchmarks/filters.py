@@ -0,0 +1,90 @@
+"""
+Benchmark compiled filter chains against matching each filter separately
+
+If NumPy is installed, vectorized filtering is also measured.
+
+Usage: python3 benchmarks/filters.py
+"""
+
+import random
+
+import resources_bench as rsrc
+
+from stig.client import vectorized
+from stig.client.aiotransmission.torrent import Torrent
+from stig.client.filters import FileFilter, PeerFilter, TorrentFilter
+from stig.client.filters.base import COMPARATIVE
+from stig.client.ttypes import TorrentFile, TorrentPeer
+
+COUNT = 10000
+
+TORRENT_FILTERS = ('foo', 'downloading', 'size>10G', 'ratio>1&seeds<5|path~linux',
+                   '!complete&rate-down>100k|uploading&peers>10')
+FILE_FILTERS = ('mkv', 'size>1G', 'wanted&%downloaded<50|priority=high')
+PEER_FILTERS = ('client~transmission', 'downloaded>1G', 'uploading|%downloaded>=50&port<10000')
+
+
+def fake_files(count, rng):
+    return [TorrentFile(tid=1, id=(1, i), name='file%d.%s' % (i, rng.choice(('mkv', 'iso', 'txt'))),
+                        path='Some.Torrent.Name', location='/srv/torrents/movies',
+                        size_total=rng.randint(1e3, 10e9), size_downloaded=rng.randint(0, 1e3),
+                        is_wanted=rng.choice((True, False)),
+                        priority=rng.choice(('low', 'normal', 'high')))
+            for i in range(count)]
+
+
+def fake_peers(count, rng):
+    return [TorrentPeer(tid=1, tname='Some.Torrent.Name', tsize=10e9,
+                        ip='10.0.%d.%d' % (i // 250, i % 250 + 1), port=rng.randint(1024, 65535),
+                        client=rng.choice(('Transmission 2.94', 'qBittorrent 4.1.5')),
+                        downloaded=rng.randint(0, 10e9), pdownloaded=rng.random() * 100,
+                        rate_up=rng.choice((0, rng.randint(0, 1e6))), rate_down=rng.randint(0, 1e6))
+            for i in range(count)]
+
+
+def legacy_match(fchain):
+    """Return function that matches filters like FilterChain did before it was compiled"""
+    def make_matcher(f):
+        fspec = f._get_filter_spec(f._name)
+        if fspec.type is COMPARATIVE and f._op is not None and f._user_value is not None:
+            op = f.OPERATORS[f._op]
+            user_value = f._validate_user_value(f._name, f._op, f._user_value)
+            vm, invert = fspec.value_matcher, f._invert
+            return lambda obj: bool(vm(obj, op, user_value)) ^ invert
+        else:
+            return f.match
+    chains = tuple(tuple(make_matcher(f) for f in AND_chain)
+                   for AND_chain in fchain._filterchains)
+    return lambda obj: any(all(m(obj) for m in AND_chain) for AND_chain in chains)
+
+
+def run(filtercls, filter_strs, objects):
+    numpy_available = vectorized.numpy is not None
+    for filter_str in filter_strs:
+        fchain = filtercls(filter_str)
+        legacy = legacy_match(fchain)
+        vectorized.use(False)
+        assert list(filter(legacy, objects)) == list(fchain.apply(objects)), filter_str
+        rsrc.report('  %s (legacy)' % filter_str,
+                    rsrc.measure(lambda: list(filter(legacy, objects))), len(objects))
+        rsrc.report('  %s (compiled)' % filter_str,
+                    rsrc.measure(lambda: list(fchain.apply(objects))), len(objects))
+        if numpy_available:
+            vectorized.use(True)
+            assert list(filter(legacy, objects)) == list(fchain.apply(objects)), filter_str
+            rsrc.report('  %s (numpy)' % filter_str,
+                        rsrc.measure(lambda: list(fchain.apply(objects))), len(objects))
+
+
+def main():
+    rng = random.Random(0)
+    print('%d torrents:' % COUNT)
+    run(TorrentFilter, TORRENT_FILTERS, [Torrent(rt) for rt in rsrc.fake_raw_torrents(COUNT)])
+    print('%d files:' % COUNT)
+    run(FileFilter, FILE_FILTERS, fake_files(COUNT, rng))
+    print('%d peers:' % COUNT)
+    run(PeerFilter, PEER_FILTERS, fake_peers(COUNT, rng))
+
+
+if __name__ == '__main__':
+    main()
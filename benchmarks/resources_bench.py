@@ -0,0 +1,103 @@
+"""Helpers for benchmarks: fake Transmission RPC data and simple timing"""
+
+import os
+import random
+import sys
+import time
+
+# Make the stig package importable when running from a source checkout
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+SIZES = (100, 1000, 10000)
+
+
+def fake_raw_tracker(rng, tid, i):
+    return {
+        'id': i, 'tier': i,
+        'announce': 'http://tracker%d.example.org:%d/announce' % (tid % 50, 6969 + i),
+        'scrape': 'http://tracker%d.example.org:%d/scrape' % (tid % 50, 6969 + i),
+        'announceState': rng.randint(0, 3), 'scrapeState': rng.randint(0, 3),
+        'hasAnnounced': True, 'hasScraped': True,
+        'lastAnnounceResult': rng.choice(('Success', 'Success', 'Connection failed')),
+        'lastScrapeResult': 'Success', 'lastAnnounceSucceeded': True,
+        'lastAnnounceTime': 1500000000 + rng.randint(0, 1e6),
+        'lastScrapeTime': 1500000000 + rng.randint(0, 1e6),
+        'nextAnnounceTime': 1500000000 + rng.randint(1e6, 2e6),
+        'nextScrapeTime': 1500000000 + rng.randint(1e6, 2e6),
+        'downloadCount': rng.randint(0, 5000), 'leecherCount': rng.randint(0, 100),
+        'seederCount': rng.randint(0, 1000),
+    }
+
+
+def fake_raw_peer(rng):
+    return {
+        'address': '10.%d.%d.%d' % (rng.randint(0, 255), rng.randint(0, 255), rng.randint(1, 254)),
+        'port': rng.randint(1024, 65535), 'clientName': rng.choice(('Transmission 2.94', 'qBittorrent 4.1.5')),
+        'progress': rng.random(), 'rateToPeer': rng.randint(0, 1e6), 'rateToClient': rng.randint(0, 1e6),
+    }
+
+
+def fake_raw_torrent(rng, tid, files=3, peers=2, trackers=2):
+    """Return dictionary with all RPC fields stig uses for one torrent"""
+    size = rng.randint(1e6, 50e9)
+    done = rng.choice((1, 1, 1, rng.random()))
+    have = int(size * done)
+    return {
+        'id': tid, 'hashString': '%040x' % rng.getrandbits(160),
+        'name': 'Some.Torrent.Name.%d.%s' % (tid, rng.choice(('mkv', 'iso', 'tar.gz'))),
+        'uploadRatio': round(rng.random() * 10, 4), 'status': rng.choice((0, 4, 6, 6, 6)),
+        'percentDone': done, 'metadataPercentComplete': 1,
+        'rateDownload': rng.choice((0, 0, 0, rng.randint(0, 1e7))),
+        'rateUpload': rng.choice((0, 0, rng.randint(0, 1e7))),
+        'peersConnected': rng.randint(0, 50), 'isPrivate': rng.choice((True, False)),
+        'downloadDir': '/srv/torrents/%s' % rng.choice(('movies', 'linux', 'music')),
+        'comment': 'Created for benchmarking', 'creator': 'mktorrent 1.1',
+        'magnetLink': 'magnet:?xt=urn:btih:%040x' % tid, 'pieceCount': size // 2**20 + 1,
+        'pieceSize': 2**20, 'totalSize': size, 'sizeWhenDone': size, 'leftUntilDone': size - have,
+        'uploadedEver': rng.randint(0, 3 * size), 'downloadedEver': have, 'corruptEver': 0,
+        'recheckProgress': 0, 'haveValid': have, 'haveUnchecked': 0,
+        'desiredAvailable': size - have, 'peersSendingToUs': rng.randint(0, 10),
+        'peersGettingFromUs': rng.randint(0, 10), 'eta': rng.choice((-1, -2, rng.randint(0, 1e5))),
+        'secondsSeeding': rng.randint(0, 1e7), 'secondsDownloading': rng.randint(0, 1e6),
+        'dateCreated': 1400000000 + tid, 'addedDate': 1500000000 + tid,
+        'startDate': 1500000000 + tid, 'activityDate': 1500000000 + rng.randint(0, 1e7),
+        'doneDate': 1500000000 + tid, 'manualAnnounceTime': -1,
+        'downloadLimited': False, 'downloadLimit': 100, 'uploadLimited': False, 'uploadLimit': 100,
+        'error': 0, 'errorString': '',
+        'trackerStats': [fake_raw_tracker(rng, tid, i) for i in range(trackers)],
+        'peers': [fake_raw_peer(rng) for _ in range(peers)],
+        'files': [{'name': 'Some.Torrent.Name.%d/file%d' % (tid, i),
+                   'length': size // files, 'bytesCompleted': have // files}
+                  for i in range(files)],
+        'fileStats': [{'bytesCompleted': have // files, 'wanted': True, 'priority': 0}
+                      for i in range(files)],
+    }
+
+
+def fake_raw_torrents(count, seed=0, **kwargs):
+    """Return list of `count` raw torrents (same `seed` produces same list)"""
+    rng = random.Random(seed)
+    return [fake_raw_torrent(rng, tid, **kwargs) for tid in range(1, count + 1)]
+
+
+def fake_torrent_get_response(count, seed=0, **kwargs):
+    """Return complete 'torrent-get' response with `count` torrents"""
+    return {'result': 'success',
+            'arguments': {'torrents': fake_raw_torrents(count, seed=seed, **kwargs)}}
+
+
+def measure(func, *args, repeat=5, **kwargs):
+    """Return fastest run time of `func` in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(name, seconds, count=None):
+    if count:
+        print('%-45s %10.3f ms  %8.2f µs/item' % (name, seconds * 1e3, seconds / count * 1e6))
+    else:
+        print('%-45s %10.3f ms' % (name, seconds * 1e3))
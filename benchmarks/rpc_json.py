@@ -0,0 +1,55 @@
+"""
+Benchmark decoding of 'torrent-get' responses with all available JSON libraries
+
+Usage: python3 benchmarks/rpc_json.py [RESPONSE.json ...]
+
+Without arguments, fake responses with 100, 1,000 and 10,000 torrents are
+decoded.  Recorded responses (e.g. captured with tcpdump or a proxy) can be
+given as file paths.
+"""
+
+import importlib
+import json
+import sys
+
+import resources_bench as rsrc
+
+from stig.utils import jsoncodec
+
+
+def payloads(paths):
+    if paths:
+        for path in paths:
+            with open(path, 'rb') as f:
+                yield path, f.read()
+    else:
+        for size in rsrc.SIZES:
+            yield ('%d torrents' % size,
+                   json.dumps(rsrc.fake_torrent_get_response(size)).encode('utf-8'))
+
+
+def main(paths):
+    backends = []
+    for name in jsoncodec.BACKENDS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            print('Not available: %s' % name)
+        else:
+            backends.append(name)
+
+    orig_backend = jsoncodec.backend()
+    try:
+        for label, payload in payloads(paths):
+            count = len(json.loads(payload)['arguments']['torrents'])
+            print('%s (%.1f MB):' % (label, len(payload) / 1e6))
+            for name in backends:
+                jsoncodec.use(name)
+                rsrc.report('  loads() with %s' % name,
+                            rsrc.measure(jsoncodec.loads, payload), count)
+    finally:
+        jsoncodec.use(orig_backend)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,73 @@
+"""
+Benchmark sorting by a composite key against sorting by each key separately
+
+Torrents are wrapped in objects that provide them as a `data` property, like
+the TUI's list item widgets.  If NumPy is installed, vectorized sorting is also
+measured.
+
+Usage: python3 benchmarks/sorters.py
+"""
+
+import resources_bench as rsrc
+
+from stig.client import vectorized
+from stig.client.aiotransmission.torrent import Torrent
+from stig.client.sorters import TorrentSorter
+
+SORTS = (('name',), ('!size',), ('ratio', '!rate-up'), ('!%downloaded', 'path', 'size'))
+
+
+class FakeWidget():
+    def __init__(self, data):
+        self._data = data
+
+    @property
+    def data(self):
+        return self._data
+
+
+def item_getter(widget):
+    return widget.data
+
+
+def legacy_sort(sorter, items):
+    # Sort by each key separately like SorterBase.apply() used to
+    for keyfunc, reverse in sorter._sortkeys:
+        items = sorted(items, key=lambda item: keyfunc(item_getter(item)), reverse=reverse)
+    return items
+
+
+def single_pass_sort(sortstrings, items):
+    # New sorter for each call so the result isn't cached
+    return TorrentSorter(sortstrings).apply(items, item_getter=item_getter)
+
+
+def main():
+    numpy_available = vectorized.numpy is not None
+    for count in rsrc.SIZES:
+        widgets = [FakeWidget(Torrent(rt)) for rt in rsrc.fake_raw_torrents(count)]
+        print('%d torrents:' % count)
+        for sortstrings in SORTS:
+            sorter = TorrentSorter(sortstrings)
+            vectorized.use(False)
+            exp = legacy_sort(sorter, widgets)
+            assert single_pass_sort(sortstrings, widgets) == exp, sortstrings
+            rsrc.report('  %s (legacy)' % (sorter,),
+                        rsrc.measure(legacy_sort, sorter, widgets), count)
+            rsrc.report('  %s (single pass)' % (sorter,),
+                        rsrc.measure(single_pass_sort, sortstrings, widgets), count)
+            if numpy_available:
+                vectorized.use(True)
+                assert single_pass_sort(sortstrings, widgets) == exp, sortstrings
+                rsrc.report('  %s (numpy)' % (sorter,),
+                            rsrc.measure(single_pass_sort, sortstrings, widgets), count)
+
+            # Sort the same items again with unchanged sort keys
+            items = list(exp)
+            sorter.apply(items, inplace=True, item_getter=item_getter)
+            rsrc.report('  %s (unchanged)' % (sorter,),
+                        rsrc.measure(sorter.apply, items, True, item_getter), count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark updating cached torrents with realistic churn
+
+Usage: python3 benchmarks/torrent_cache.py [PERCENT_CHANGED]
+
+Each cached torrent has the values of typical list columns cached.  Every
+update contains fast-changing fields for all torrents, but only
+PERCENT_CHANGED (default: 10) percent of them have different values.
+"""
+
+import random
+import sys
+import time
+
+import resources_bench as rsrc
+
+from stig.client.aiotransmission.api_torrent import _TorrentCache
+from stig.client.aiotransmission.torrent import SLOW_FIELDS
+
+# Keys of the default torrent list columns
+KEYS = ('name', 'ratio', 'status', 'rate-down', 'rate-up', '%downloaded',
+        'size-final', 'timespan-eta', 'peers-connected', 'path')
+
+CHANGING_FIELDS = ('rateDownload', 'rateUpload', 'percentDone', 'peersConnected',
+                   'eta', 'uploadedEver', 'activityDate')
+
+ROUNDS = 10
+
+
+def fake_updates(raw_torrents, percent_changed, rng):
+    fast_fields = [f for f in raw_torrents[0] if f not in SLOW_FIELDS]
+    updates = []
+    for rt in raw_torrents:
+        update = {f: rt[f] for f in fast_fields}
+        if rng.random() * 100 < percent_changed:
+            for field in rng.sample(CHANGING_FIELDS, 3):
+                update[field] = update[field] + 1
+        updates.append(update)
+    return updates
+
+
+def populate(cache):
+    for torrent in cache.get():
+        for key in KEYS:
+            torrent[key]
+
+
+def run(count, percent_changed):
+    rng = random.Random(0)
+    raw_torrents = rsrc.fake_raw_torrents(count)
+    cache = _TorrentCache()
+    cache.update(raw_torrents)
+    best = float('inf')
+    for _ in range(ROUNDS):
+        updates = fake_updates(raw_torrents, percent_changed, rng)
+        populate(cache)
+        start = time.perf_counter()
+        cache.update(updates)
+        best = min(best, time.perf_counter() - start)
+        raw_torrents = updates
+    return best
+
+
+def main(percent_changed):
+    for count in rsrc.SIZES:
+        rsrc.report('%d torrents, %d%% changed' % (count, percent_changed),
+                    run(count, percent_changed), count)
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,102 @@
+"""
+Benchmark rendering a torrent list with a secondary filter
+
+Each run creates a new TorrentListWidget with a secondary filter, gives it
+torrents and renders it once, like opening a new tab.  The previous way of
+hiding filtered torrents is also measured.
+
+Usage: python3 benchmarks/tui_lists.py
+"""
+
+import logging
+import types
+
+import resources_bench as rsrc
+
+# LogWidget needs a root handler when stig.tui is imported
+logging.basicConfig(level=logging.WARNING)
+
+from stig.client.aiotransmission.torrent import Torrent  # noqa: E402 isort:skip
+from stig.client.sorters import TorrentSorter  # noqa: E402 isort:skip
+from stig.tui.keymap import KeyMap  # noqa: E402 isort:skip
+from stig.tui.views import base  # noqa: E402 isort:skip
+from stig.tui.views.torrent_list import TorrentListWidget  # noqa: E402 isort:skip
+
+SIZE = (120, 40)
+FILTERS = ('name~iso', '!complete')
+COLUMNS = ('marked', 'name', 'size', 'ratio', 'rate-up', 'rate-down', 'status')
+
+
+class FakeBottombarItem():
+    def update(self, *args, **kwargs):
+        pass
+
+
+class FakeBottombar():
+    marked = FakeBottombarItem()
+
+
+class FakeRequestPool():
+    def requested_keys(self, *args, **kwargs):
+        return set()
+
+    def register(self, *args, **kwargs):
+        pass
+
+    def remove(self, *args, **kwargs):
+        pass
+
+    def poll(self):
+        pass
+
+
+class FakeAPI():
+    treqpool = FakeRequestPool()
+
+
+base.bottombar = FakeBottombar()
+
+
+def legacy_hide_or_unhide_widgets(self):
+    # Hide filtered widgets like ListWidgetBase._hide_or_unhide_widgets() used to
+    walker = self._listbox.body
+    existing_widgets = self._existing_widgets
+    hidden_ids = tuple(w.id for w in self._limit_items(existing_widgets))
+    for w in existing_widgets:
+        widget_is_visible = w in walker
+        hide_widget = w.id in hidden_ids
+        if hide_widget and widget_is_visible:
+            walker.remove(w)
+            self._hidden_widgets.add(w)
+            self._sort_keys.pop(w, None)
+        elif not hide_widget and not widget_is_visible:
+            walker.append(w)
+            self._unsorted_widgets.add(w)
+
+
+def open_tab(raw_torrents, filter_str, legacy=False):
+    tlist = TorrentListWidget(FakeAPI(), KeyMap(), sort=TorrentSorter(('name',)), columns=COLUMNS)
+    if legacy:
+        tlist._hide_or_unhide_widgets = types.MethodType(legacy_hide_or_unhide_widgets, tlist)
+    tlist.secondary_filter = filter_str
+    tlist._handle_torrents([Torrent(raw) for raw in raw_torrents])
+    tlist.render(SIZE)
+    return tlist
+
+
+def main():
+    for count in rsrc.SIZES:
+        raw_torrents = rsrc.fake_raw_torrents(count)
+        print('%d torrents:' % count)
+        for filter_str in FILTERS:
+            exp = [w.id for w in open_tab(raw_torrents, filter_str, legacy=True)._listbox.body]
+            assert [w.id for w in open_tab(raw_torrents, filter_str)._listbox.body] == exp
+            rsrc.report('  %s (legacy)' % (filter_str,),
+                        rsrc.measure(open_tab, raw_torrents, filter_str, legacy=True, repeat=1),
+                        count)
+            rsrc.report('  %s' % (filter_str,),
+                        rsrc.measure(open_tab, raw_torrents, filter_str), count)
+
+
+if __name__ == '__main__':
+    main()
@@ -54,6 +54,8 @@ setup(
     extras_require = {
         'setproctitle': ['setproctitle'],
         'proxy': ['aiohttp-socks'],
+        'json': ['orjson'],
+        'numpy': ['numpy'],
     },
     tests_require = [
         'pytest>=5,<6',
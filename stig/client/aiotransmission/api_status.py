@@ -53,6 +53,19 @@ class StatusAPI():
         self._poller_stats.interval = interval
         self._poller_tcount.interval = interval
 
+    @property
+    def max_interval(self):
+        return self._poller_stats.max_interval
+
+    @max_interval.setter
+    def max_interval(self, max_interval):
+        self._poller_stats.max_interval = max_interval
+        self._poller_tcount.max_interval = max_interval
+
+    def reset_interval(self):
+        self._poller_stats.reset_interval()
+        self._poller_tcount.reset_interval()
+
 
     def __init__(self, srvapi, interval=1):
         self._session_stats_updated = False
@@ -63,6 +76,10 @@ class StatusAPI():
 
         self._poller_stats = RequestPoller(srvapi.rpc.session_stats,
                                            interval=interval)
+        # Cumulative counters (e.g. 'secondsActive') change even if the
+        # daemon is idle
+        self._poller_stats.fingerprint = lambda stats: stats and {
+            k:v for k,v in stats.items() if not isinstance(v, dict)}
         self._poller_stats.on_response(self._handle_session_stats)
         self._poller_stats.on_error(lambda e: log.debug('Ignoring exception: %r', e),
                                     autoremove=False)
@@ -72,6 +89,7 @@ class StatusAPI():
         self._poller_tcount = RequestPoller(srvapi.torrent.torrents,
                                             keys=('rate-down', 'rate-up', 'status'),
                                             interval=interval)
+        self._poller_tcount.fingerprint = lambda response: srvapi.torrent.generation
         self._poller_tcount.on_response(self._handle_torrent_list)
 
     def _reset_session_stats(self):
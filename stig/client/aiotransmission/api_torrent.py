@@ -23,7 +23,7 @@ from ..constants import MAX_TORRENT_FILE_SIZE
 from ..filters import FileFilter, TorrentFilter
 from ..utils import (URL, Bandwidth, Bool, BoolOrBandwidth, Response, SizeInBytes,
                      SmartCmpPath)
-from .torrent import Torrent, TorrentFields
+from .torrent import SLOW_FIELDS, Torrent, TorrentFields
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -32,20 +32,27 @@ log = make_logger(__name__)
 class _TorrentCache():
     def __init__(self, raw_torrents=()):
         self._tdict = {}  # Map torrent IDs to Torrent objects
+        self._refreshed = {}  # Map torrent IDs to when slow-changing fields were requested
+        self.generation = 0  # Increased when any cached value changes
 
     def update(self, raw_torrents):
         # import time ; start = time.time()
         tdict = self._tdict
+        changed = False
         for rt in raw_torrents:
             tid = rt['id']
             if tid in tdict:
                 # Update existing torrent
                 # log.debug('Updating torrent #%d, %d keys: %s', tid, len(rt), tuple(rt))
-                tdict[tid].update(rt)
+                if tdict[tid].update(rt):
+                    changed = True
             else:
                 # Add new torrent
                 # log.debug('Adding torrent #%d, %d keys: %s', tid, len(rt), tuple(rt))
                 tdict[tid] = Torrent(rt)
+                changed = True
+        if changed:
+            self.generation += 1
         # log.debug('Updated %d cached with %d new torrents in %.3fms',
         #           len(tdict), len(raw_torrents), (time.time()-start)*1000)
 
@@ -56,16 +63,81 @@ class _TorrentCache():
         removed_tids = known_tids.difference(existing_tids)
         if removed_tids:
             log.debug('Clearing cached torrents: %r', removed_tids)
+            self.generation += 1
         for tid in removed_tids:
             del tdict[tid]
+            self._refreshed.pop(tid, None)
+
+    def remove(self, tids):
+        """Remove torrents with IDs in `tids`"""
+        tdict = self._tdict
+        removed_tids = set(tids).intersection(tdict)
+        if removed_tids:
+            log.debug('Removing cached torrents: %r', removed_tids)
+            self.generation += 1
+        for tid in removed_tids:
+            del tdict[tid]
+            self._refreshed.pop(tid, None)
+
+    def lacking(self, tids, fields, max_age=None):
+        """
+        Return IDs from `tids` of torrents that are missing any RPC field in `fields`
+
+        Torrents that are still downloading metadata are also included because their
+        slow-changing fields (e.g. 'name' and 'totalSize') are not final yet.
+
+        If `max_age` is not None, torrents that were not passed to `refreshed` in
+        the last `max_age` seconds are also included.
+        """
+        tdict = self._tdict
+        refreshed = self._refreshed
+        oldest = None if max_age is None else time.monotonic() - max_age
+        lacking_tids = []
+        for tid in tids:
+            raw = tdict[tid]._raw
+            if raw.get('metadataPercentComplete', 1) < 1 or any(f not in raw for f in fields):
+                lacking_tids.append(tid)
+            elif oldest is not None and refreshed.get(tid, oldest) <= oldest:
+                lacking_tids.append(tid)
+        return lacking_tids
+
+    def refreshed(self, tids):
+        """Remember that slow-changing fields of torrents with IDs in `tids` were just requested"""
+        now = time.monotonic()
+        refreshed = self._refreshed
+        for tid in tids:
+            refreshed[tid] = now
+
+    def expire(self, tids):
+        """Forget when slow-changing fields of torrents with IDs in `tids` were requested"""
+        refreshed = self._refreshed
+        for tid in tids:
+            refreshed.pop(tid, None)
 
     def get(self, *ids):
-        """Return tuple of Torrent objects"""
+        """Return tuple of Torrent objects (all cached torrents if no `ids` are given)"""
         if ids:
-            return tuple(t for tid,t in self._tdict.items() if tid in ids)
+            return self.lookup(ids)[0]
         else:
             return tuple(self._tdict.values())
 
+    def lookup(self, ids):
+        """
+        Return tuple of Torrent objects with IDs in `ids` and tuple of IDs that are not cached
+
+        Torrents are returned in the order of `ids` without duplicates.
+        """
+        tdict = self._tdict
+        tlist = []
+        missing = []
+        for tid in dict.fromkeys(ids):
+            torrent = tdict.get(tid)
+            if torrent is None:
+                missing.append(tid)
+            else:
+                tlist.append(torrent)
+        return tuple(tlist), tuple(missing)
+
     def __len__(self):
         return len(self._tdict)
 
@@ -78,13 +150,58 @@ class _TorrentCache():
 class TorrentAPI(TorrentAPIBase):
     """High-level abstraction of the Transmission RPC protocol"""
 
-    def __init__(self, rpc):
+    def __init__(self, rpc, resync_interval=60, slow_fields_interval=60):
         self.rpc = rpc
         self._tcache = _TorrentCache()
+        self.resync_interval = resync_interval
+        self.slow_fields_interval = slow_fields_interval
+        self._reset_poll_state()
 
     def clearcache(self):
         """Remove all torrents from cache"""
         self._tcache.purge(existing_tids=())
+        self._reset_poll_state()
+
+    def _reset_poll_state(self):
+        # RPC fields of all torrents in the cache that were requested with
+        # the last full resync and when that resync happened
+        self._synced_fields = frozenset()
+        self._last_resync = None
+
+    @property
+    def generation(self):
+        """Number that is increased whenever any cached torrent changes"""
+        return self._tcache.generation
+
+    @property
+    def resync_interval(self):
+        """
+        Maximum number of seconds between requests for all torrents
+
+        Incremental requests (see `torrents`) only get recently active
+        torrents.  Every `resync_interval` seconds, all torrents are requested
+        so that values of inactive torrents can't go stale.
+        """
+        return self._resync_interval
+
+    @resync_interval.setter
+    def resync_interval(self, seconds):
+        self._resync_interval = float(seconds)
+
+    @property
+    def slow_fields_interval(self):
+        """
+        Maximum number of seconds between requests for slow-changing fields
+
+        If `split_fields` is passed to `torrents`, slow-changing RPC fields
+        (e.g. 'name' or 'totalSize') are only requested for new torrents and
+        for each torrent every `slow_fields_interval` seconds.
+        """
+        return self._slow_fields_interval
+
+    @slow_fields_interval.setter
+    def slow_fields_interval(self, seconds):
+        self._slow_fields_interval = float(seconds)
 
     @staticmethod
     async def _request(method, *args, **kwargs):
@@ -254,6 +371,82 @@ class TorrentAPI(TorrentAPIBase):
             log.debug('Requested %d torrents in %.3fms', len(raw_tlist), (time() - start) * 1e3)
             return Response(success=True, raw_torrents=raw_tlist)
 
+    async def _request_torrents_incremental(self, fields):
+        """
+        Make 'torrent-get' RPC request for recently active torrents
+
+        If any of `fields` weren't requested for all torrents by the previous
+        call or if the previous resync was more than `resync_interval` seconds
+        ago, request all torrents instead.  Removed torrents are purged from the
+        cache.
+
+        Return the same Response object as `_request_torrents`
+        """
+        now = time.monotonic()
+        if (self._last_resync is None or
+            now - self._last_resync >= self.resync_interval or
+            not self._synced_fields.issuperset(fields)):
+            log.debug('Resyncing all torrents with fields: %s', fields)
+            response = await self._request_torrents(fields)
+            if response.success:
+                self._synced_fields = frozenset(fields)
+                self._last_resync = now
+            return response
+
+        start = time.time()
+        if 'id' not in fields:
+            fields = ('id',) + tuple(fields)
+        try:
+            result = await self.rpc.torrent_get(fields=fields, ids='recently-active')
+        except ClientError as e:
+            return Response(success=False, raw_torrents=(), errors=(str(e),))
+        else:
+            raw_tlist = result['torrents']
+            removed_tids = result.get('removed', ())
+            self._tcache.update(raw_tlist)
+            self._tcache.remove(removed_tids)
+            log.debug('Requested %d recently active torrents (%d removed) in %.3fms',
+                      len(raw_tlist), len(removed_tids), (time.time() - start) * 1e3)
+            return Response(success=True, raw_torrents=raw_tlist)
+
+    async def _request_torrents_split(self, fields, ids=None, incremental=False):
+        """
+        Make 'torrent-get' RPC request without slow-changing fields if possible
+
+        Slow-changing fields (see SLOW_FIELDS) are only requested for torrents
+        that don't have them cached yet, that are still downloading metadata or
+        that didn't get them in the last `slow_fields_interval` seconds.
+
+        Return the same Response object as `_request_torrents`
+        """
+        slow_fields = SLOW_FIELDS.intersection(fields)
+        if slow_fields and len(self._tcache) > 0:
+            request_fields = tuple(f for f in fields if f not in slow_fields)
+            request_fields += ('metadataPercentComplete',)
+        else:
+            # Every torrent needs all fields
+            request_fields = fields
+
+        if incremental and ids is None:
+            response = await self._request_torrents_incremental(request_fields)
+        else:
+            response = await self._request_torrents(request_fields, ids)
+
+        if response.success and slow_fields:
+            tids = (t['id'] for t in response.raw_torrents)
+            if request_fields is fields:
+                self._tcache.refreshed(tids)
+            else:
+                tids = self._tcache.lacking(tids, slow_fields, max_age=self.slow_fields_interval)
+                if tids:
+                    log.debug('Requesting slow-changing fields for %d torrents: %s',
+                              len(tids), slow_fields)
+                    slow_response = await self._request_torrents(tuple(slow_fields), tids)
+                    if not slow_response.success:
+                        return Response(success=False, raw_torrents=(), errors=slow_response.errors)
+                    self._tcache.refreshed(tids)
+        return response
+
     def _get_torrents_from_cache(self, ids):
         """
         Get torrents from internal cache without making a request
@@ -270,27 +463,30 @@ class TorrentAPI(TorrentAPIBase):
             # No torrents requested
             tlist = ()
         else:
-            tlist = self._tcache.get(*ids)
+            tlist, missing_ids = self._tcache.lookup(ids)
 
             # Provide error for requested IDs that don't exist
-            existing_ids = tuple(t['id'] for t in tlist)
-            for tid in ids:
-                if tid not in existing_ids:
-                    errors.append('No torrent with ID: %d' % tid)
+            for tid in missing_ids:
+                errors.append('No torrent with ID: %d' % tid)
 
         # Success if we found any torrents or no torrents were requested
         success = len(tlist) > 0 or not ids
         log.debug('Got %d cached torrents in %.3fms', len(tlist), (time() - start) * 1e3)
         return Response(success=success, torrents=tlist, errors=errors)
 
-    async def _get_torrents_by_ids(self, keys, ids=None, from_cache=False):
+    async def _get_torrents_by_ids(self, keys, ids=None, from_cache=False, incremental=False,
+                                   split_fields=False):
         """
         Return a Response object with 'torrents' set to a tuple of Torrents
 
-        keys:       'ALL' for all supported Torrent keys or a sequence of key
-                    strings (see TorrentBase.TYPES for available keys)
-        ids:        None for all torrents or a sequence of wanted IDs
-        from_cache: Whether to try to get the torrents from a previous request
+        keys:         'ALL' for all supported Torrent keys or a sequence of key
+                      strings (see TorrentBase.TYPES for available keys)
+        ids:          None for all torrents or a sequence of wanted IDs
+        from_cache:   Whether to try to get the torrents from a previous request
+        incremental:  Whether to request only recently active torrents if `ids`
+                      is None (see `_request_torrents_incremental`)
+        split_fields: Whether to request slow-changing fields only if they are
+                      not cached (see `_request_torrents_split`)
         """
         if keys == 'ALL':
             fields = TorrentFields(keys)
@@ -313,24 +509,34 @@ class TorrentAPI(TorrentAPIBase):
             else:
                 log.debug('Some fields are missing from torrent - enforcing request')
 
-        response = await self._request_torrents(fields, ids)
+        if split_fields:
+            response = await self._request_torrents_split(fields, ids, incremental=incremental)
+        elif incremental and ids is None:
+            response = await self._request_torrents_incremental(fields)
+        else:
+            response = await self._request_torrents(fields, ids)
         if not response.success:
             return Response(success=False, torrents=(), errors=response.errors)
         else:
             return self._get_torrents_from_cache(ids)
 
-    async def _get_torrents_by_filter(self, keys, tfilter=None, from_cache=False):
+    async def _get_torrents_by_filter(self, keys, tfilter=None, from_cache=False,
+                                      incremental=False, split_fields=False):
         """
         Return a Response object with 'torrents' set to a tuple of Torrents
 
-        keys:       See _get_torrents_by_ids
-        tfilter:    A TorrentFilter instance or None to get all torrents
-        from_cache: Whether to try to get the torrents from a previous request
+        keys:         See _get_torrents_by_ids
+        tfilter:      A TorrentFilter instance or None to get all torrents
+        from_cache:   Whether to try to get the torrents from a previous request
+        incremental:  See _get_torrents_by_ids
+        split_fields: See _get_torrents_by_ids
         """
         if tfilter is None:
             log.debug('Looking for all torrents with keys: %s', keys)
             # No filter specified - just return all torrents with the specified keys
-            return await self._get_torrents_by_ids(keys=keys, from_cache=from_cache)
+            return await self._get_torrents_by_ids(keys=keys, from_cache=from_cache,
+                                                   incremental=incremental,
+                                                   split_fields=split_fields)
         else:
             log.debug('Looking for %s torrents with keys: %s', tfilter, keys)
             if isinstance(tfilter, str):
@@ -338,10 +544,25 @@ class TorrentAPI(TorrentAPIBase):
 
             tlist = ()
 
+            if incremental:
+                # Every cached torrent is kept up to date, so we can request all
+                # wanted keys for all torrents and filter them locally.
+                if keys != 'ALL':
+                    keys = tuple(keys) + tuple(tfilter.needed_keys)
+                response = await self._get_torrents_by_ids(keys=keys, from_cache=from_cache,
+                                                           incremental=True,
+                                                           split_fields=split_fields)
+                if not response.success:
+                    return Response(success=False, torrents=(), errors=response.errors)
+                else:
+                    tlist = tuple(tfilter.apply(response.torrents))
+                    return self._filtered_torrents_response(tfilter, tlist)
+
             # Request all torrents with the keys needed to filter them
             log.debug('Requesting full list with filter keys: %s', tfilter.needed_keys)
             response = await self._get_torrents_by_ids(keys=tfilter.needed_keys,
-                                                       from_cache=from_cache)
+                                                       from_cache=from_cache,
+                                                       split_fields=split_fields)
             if not response.success:
                 return Response(success=False, torrents=(), errors=response.errors)
             else:
@@ -351,29 +572,42 @@ class TorrentAPI(TorrentAPIBase):
                 if len(wanted_ids) > 0:
                     # Get only wanted torrents with all wanted keys
                     response = await self._get_torrents_by_ids(keys, wanted_ids,
-                                                               from_cache=from_cache)
+                                                               from_cache=from_cache,
+                                                               split_fields=split_fields)
                     if not response.success:
                         return Response(success=False, torrents=(), errors=response.errors)
                     else:
                         tlist = tuple(response.torrents)
 
-            success = len(tlist) > 0
-            msgs = errors = ()
-            if not success:
-                errors = ('No matching torrents: %s' % (tfilter,),)
-            else:
-                msgs = ('Found %d %s torrent%s' %
-                        (len(tlist), tfilter, '' if len(tlist) == 1 else 's'),)
-            return Response(success=success, torrents=tlist, msgs=msgs, errors=errors)
+            return self._filtered_torrents_response(tfilter, tlist)
+
+    @staticmethod
+    def _filtered_torrents_response(tfilter, tlist):
+        success = len(tlist) > 0
+        msgs = errors = ()
+        if not success:
+            errors = ('No matching torrents: %s' % (tfilter,),)
+        else:
+            msgs = ('Found %d %s torrent%s' %
+                    (len(tlist), tfilter, '' if len(tlist) == 1 else 's'),)
+        return Response(success=success, torrents=tlist, msgs=msgs, errors=errors)
 
-    async def torrents(self, torrents=None, keys='ALL', from_cache=False):
+    async def torrents(self, torrents=None, keys='ALL', from_cache=False, incremental=False,
+                       split_fields=False):
         """
         Get torrents
 
-        torrents:   Sequence of torrent IDs, TorrentFilter object (or its string
-                    representation) or None for all torrents
-        keys:       tuple of Torrent keys to fetch or 'ALL' for all torrents
-        from_cache: Whether to try to get the torrents from a previous request
+        torrents:     Sequence of torrent IDs, TorrentFilter object (or its string
+                      representation) or None for all torrents
+        keys:         tuple of Torrent keys to fetch or 'ALL' for all torrents
+        from_cache:   Whether to try to get the torrents from a previous request
+        incremental:  Whether to only request torrents that were recently active
+                      and get the others from cache; all torrents are requested
+                      if `keys` changed or after `resync_interval` seconds (this
+                      is ignored if `torrents` is a sequence of IDs)
+        split_fields: Whether to request slow-changing values (e.g. name or
+                      size) only for new torrents and every
+                      `slow_fields_interval` seconds
 
         Return Response with the following properties:
             torrents: Tuple of Torrent objects with requested torrents
@@ -382,14 +616,19 @@ class TorrentAPI(TorrentAPIBase):
             errors:   List of error messages
         """
         if torrents is None:
-            return await self._get_torrents_by_ids(keys, from_cache=from_cache)
+            return await self._get_torrents_by_ids(keys, from_cache=from_cache,
+                                                   incremental=incremental,
+                                                   split_fields=split_fields)
         elif isinstance(torrents, (str, TorrentFilter)):
             return await self._get_torrents_by_filter(keys, tfilter=torrents,
-                                                      from_cache=from_cache)
+                                                      from_cache=from_cache,
+                                                      incremental=incremental,
+                                                      split_fields=split_fields)
         elif (isinstance(torrents, abc.Sequence) and
               all(isinstance(id, int) for id in torrents)):
             return await self._get_torrents_by_ids(keys, ids=torrents,
-                                                   from_cache=from_cache)
+                                                   from_cache=from_cache,
+                                                   split_fields=split_fields)
         else:
             raise ValueError("Invalid 'torrents' argument: %r" % (torrents,))
 
@@ -716,6 +955,8 @@ class TorrentAPI(TorrentAPIBase):
         else:
             # Preserve info messages for final response
             msgs = response.msgs
+            # Names and file paths are slow-changing fields
+            self._tcache.expire((torrent['id'],))
 
         # Fetch new torrent data and return final response
         response = await self._get_torrents_by_ids(ids=(tid,),
@@ -994,6 +1235,8 @@ class TorrentAPI(TorrentAPIBase):
             errors.extend(response.errors)
             return Response(success=False, torrents=(), msgs=msgs, errors=errors)
         else:
+            # Tracker lists are slow-changing fields
+            self._tcache.expire(t['id'] for t in response.torrents)
             return Response(success=True, torrents=response.torrents, msgs=msgs, errors=errors)
 
     async def tracker_remove(self, torrents, urls, partial_match=False):
@@ -1061,6 +1304,8 @@ class TorrentAPI(TorrentAPIBase):
                                                       method_args={'trackerRemove': trkids})
                 if not response.success:
                     return Response(success=False, torrents=(), errors=response.errors)
+            # Tracker lists are slow-changing fields
+            self._tcache.expire(remove_ids)
 
         # Get new torrent list with newly added trackers
         response = await self.torrents(tuple(remove_ids), keys=('id', 'name', 'trackers'))
@@ -12,11 +12,11 @@
 """Low-level communication with the Transmission daemon"""
 
 import asyncio
-import json
 
 import async_timeout
 from blinker import Signal
 
+from ...utils import jsoncodec
 from ..errors import AuthError, ClientError, ConnectionError, RPCError, TimeoutError
 from ..utils import URL
 
@@ -29,6 +29,15 @@ CSRF_ERROR_CODE = 409
 CSRF_HEADER = 'X-Transmission-Session-Id'
 TIMEOUT = 10
 
+# Responses with more bytes are decoded in chunks of DECODE_CHUNK_SIZE characters
+# so they don't block the event loop (e.g. 'torrent-get' responses with
+# thousands of torrents)
+DECODE_IN_CHUNKS_THRESHOLD = 256 * 1024
+DECODE_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of requests that are sent concurrently over pooled connections
+MAX_CONCURRENT_REQUESTS = 4
+
 
 class TransmissionRPC():
     """
@@ -51,9 +60,10 @@ class TransmissionRPC():
         self.proxy = proxy
         self._headers = {'content-type': 'application/json'}
         self._session = None
+        self._session_users = {}  # Map sessions to number of requests using them
         self._enabled_event = asyncio.Event()
         self.enabled = enabled
-        self._request_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         self._connecting_lock = asyncio.Lock()
         self._connection_tested = False
         self._connection_exception = None
@@ -342,12 +352,14 @@ class TransmissionRPC():
             if self._connector is not None:
                 session_args['connector'] = self._connector
                 session_args['connector_owner'] = False
+            else:
+                session_args['connector'] = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS)
             self._session = aiohttp.ClientSession(**session_args)
 
             # Check if connection works
             log.debug('Testing connection to %s', self.url)
             try:
-                test_request = json.dumps({'method':'session-get'})
+                test_request = jsoncodec.dumps({'method':'session-get'})
                 info = await self._send_request(test_request)
             except ClientError as e:
                 self._connection_exception = e
@@ -366,6 +378,20 @@ class TransmissionRPC():
 
             log.debug('Releasing connect() lock')
 
+    async def _autoconnect(self, method):
+        if self._connecting_lock.locked():
+            # Another request is already connecting - wait for it instead of
+            # starting a new connection attempt that would close this one
+            log.debug('Waiting for ongoing connection attempt for %r', method)
+            async with self._connecting_lock:
+                pass
+            if self.connected:
+                return
+            elif self._connection_exception is not None:
+                raise self._connection_exception
+        log.debug('Autoconnecting for %r', method)
+        await self.connect()
+
     async def disconnect(self, reason=None):
         """
         Disconnect if connected
@@ -379,9 +405,10 @@ class TransmissionRPC():
             self._on_disconnected.send(self)
 
     async def _reset(self):
-        if self._session is not None:
-            await self._session.close()
-        self._session = None
+        session, self._session = self._session, None
+        # Sessions that are used by requests are closed when the last request is done
+        if session is not None and session not in self._session_users:
+            await session.close()
         self._version = None
         self._rpcversion = None
         self._rpcversionmin = None
@@ -392,7 +419,9 @@ class TransmissionRPC():
             response = await self._session.post(self.url, data=data, headers=self._headers)
 
             if response.status == CSRF_ERROR_CODE:
-                # Send request again with CSRF header
+                # Send request again with CSRF header.  Concurrent requests may
+                # all get here, but there is no await between reading and
+                # setting the header, so they can't interfere with each other.
                 self._headers[CSRF_HEADER] = response.headers[CSRF_HEADER]
                 log.debug('Setting CSRF header: %s = %s',
                           CSRF_HEADER, response.headers[CSRF_HEADER])
@@ -406,13 +435,31 @@ class TransmissionRPC():
                 raise AuthError(self.url)
 
             else:
+                body = await response.read()
                 try:
-                    answer = await response.json()
-                except json.JSONDecodeError as e:
-                    raise RPCError('Server sent malformed JSON: %s: %s' % (e, await response.text()))
+                    answer = await self._decode(body)
+                except ValueError as e:
+                    raise RPCError('Server sent malformed JSON: %s: %s' %
+                                   (e, body.decode('utf-8', errors='replace')))
                 else:
                     return answer
 
+    @staticmethod
+    async def _decode(body):
+        if len(body) >= DECODE_IN_CHUNKS_THRESHOLD:
+            # Decoding in a worker thread doesn't help because JSON decoders
+            # hold the GIL until they are done
+            log.debug('Decoding %d bytes in chunks', len(body))
+            decoder = jsoncodec.iterloads(body, chunk_size=DECODE_CHUNK_SIZE)
+            while True:
+                try:
+                    next(decoder)
+                except StopIteration as e:
+                    return e.value
+                await asyncio.sleep(0)
+        else:
+            return jsoncodec.loads(body)
+
     async def _send_request(self, post_data):
         """
         Send RPC POST request to daemon
@@ -420,7 +467,9 @@ class TransmissionRPC():
         post_data: Any valid RPC request as JSON string
 
         If applicable, returns response['arguments']['torrents'] or
-        response['arguments'], otherwise response.
+        response['arguments'], otherwise response.  If response['arguments']
+        contains 'removed' (see 'recently-active' in the RPC spec),
+        response['arguments'] is returned.
 
         Raises ClientError.
         """
@@ -459,10 +508,13 @@ class TransmissionRPC():
                 raise RPCError(answer['result'].capitalize())
             else:
                 if 'arguments' in answer:
-                    if 'torrents' in answer['arguments']:
-                        return answer['arguments']['torrents']
+                    arguments = answer['arguments']
+                    # 'torrent-get' with ids='recently-active' also reports the
+                    # IDs of removed torrents, so we must return both lists.
+                    if 'torrents' in arguments and 'removed' not in arguments:
+                        return arguments['torrents']
                     else:
-                        return answer['arguments']
+                        return arguments
                 return answer
 
     def __getattr__(self, method):
@@ -481,31 +533,42 @@ class TransmissionRPC():
         async def request(arguments=None, **kwargs):
             arguments = arguments or {}
 
-            async with self._request_lock:
+            async with self._request_semaphore:
+                # Concurrent requests share one connection attempt
                 if not self.connected:
-                    log.debug('Autoconnecting for %r', method)
-                    await self.connect()
+                    await self._autoconnect(method)
 
                 arguments.update(**kwargs)
                 data = {'method'    : method.replace('_', '-'),
                         'arguments' : arguments}
                 try:
-                    rpc_request = json.dumps(data)
+                    rpc_request = jsoncodec.dumps(data)
                 except Exception as e:
                     raise RuntimeError('Invalid JSON data: %s: %r' % (e, data)) from None
 
+                session = self._session
+                session_users = self._session_users
+                session_users[session] = session_users.get(session, 0) + 1
                 try:
                     return await self._send_request(rpc_request)
                 except ClientError as e:
                     log.debug('Caught ClientError in %r request: %r', method, e)
 
                     # RPCError does not mean host is unreachable, there was just a
-                    # misunderstanding, so we're still connected.
-                    if not isinstance(e, RPCError) and self.connected:
+                    # misunderstanding, so we're still connected.  Concurrent
+                    # requests may fail for the same reason, but only the first
+                    # one disconnects from the session they used.
+                    if not isinstance(e, RPCError) and session is self._session:
                         await self.disconnect(str(e))
 
                     self._on_error.send(self, error=e)
                     raise
+                finally:
+                    session_users[session] -= 1
+                    if session_users[session] <= 0:
+                        del session_users[session]
+                        if session is not self._session:
+                            await session.close()
 
         request.__name__ = method
         request.__qualname__ = method
@@ -432,6 +432,23 @@ DEPENDENCIES = {
 }
 
 
+# Map RPC field names to tuples of abstracted keys that depend on them
+_DEPENDENTS = {}
+for _key, _fields in DEPENDENCIES.items():
+    for _field in _fields:
+        _DEPENDENTS[_field] = _DEPENDENTS.get(_field, ()) + (_key,)
+del _key, _fields, _field
+
+
+# RPC fields that never or rarely change and can be requested less often than
+# the others (e.g. only for new torrents)
+SLOW_FIELDS = frozenset((
+    'name', 'hashString', 'comment', 'creator', 'magnetLink', 'isPrivate',
+    'pieceCount', 'pieceSize', 'dateCreated', 'addedDate', 'totalSize',
+    'trackers',
+))
+
+
 class Torrent(base.TorrentBase):
     """
     Information about a torrent as a mapping
@@ -481,30 +498,39 @@ class Torrent(base.TorrentBase):
         self._cache = {}
 
     def update(self, raw_torrent):
+        """
+        Update raw values and remove cached values that depend on them
+
+        Return whether any raw value changed.
+        """
         cache = self._cache
         raw_old = self._raw
-
-        # Remove cached values if their original/raw value(s) differ
-        for k in tuple(cache):
-            # Each key depends on one or more RPC field
-            fields = DEPENDENCIES[k]
-            for field in fields:
-                new_value = raw_torrent.get(field)
-                old_value = raw_old.get(field)
-                if new_value is not None and new_value != old_value:
-                    # log.debug('Invalidating cached %s/%s: %r -> %r', k, field, old_value, new_value)
-                    # New and previous value differ - if we are dealing with
-                    # more complex data structures (e.g. a file tree), use the
-                    # update() method to update the object in cache instead of
-                    # removing it from the cache.
-                    value = cache[k]
-                    if hasattr(value, 'update') and all(field in raw_torrent for field in fields):
-                        value.update(raw_torrent)
-                    del cache[k]
-                    break
+        dependents = _DEPENDENTS
+        changed = False
+
+        # Only look at fields that arrived and changed
+        for field, new_value in raw_torrent.items():
+            if raw_old.get(field) == new_value:
+                continue
+            changed = True
+            if cache and new_value is not None:
+                for k in dependents.get(field, ()):
+                    if k in cache:
+                        # log.debug('Invalidating cached %s/%s: %r -> %r', k, field,
+                        #           raw_old.get(field), new_value)
+                        # New and previous value differ - if we are dealing with
+                        # more complex data structures (e.g. a file tree), use the
+                        # update() method to update the object in cache instead of
+                        # removing it from the cache.
+                        value = cache[k]
+                        if hasattr(value, 'update') and all(f in raw_torrent for f in DEPENDENCIES[k]):
+                            value.update(raw_torrent)
+                        del cache[k]
 
         # Now we can forget the old values
-        raw_old.update(raw_torrent)
+        if changed:
+            raw_old.update(raw_torrent)
+        return changed
 
     def __getitem__(self, key):
         cache = self._cache
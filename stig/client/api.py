@@ -48,6 +48,7 @@ class API():
         self._pollers = []
         self._manage_pollers_interval = SleepUneasy()
         self.interval = interval
+        self._max_interval = None
 
     @property
     def rpc(self):
@@ -65,6 +66,25 @@ class API():
         for poller in self._existing_pollers:
             poller.interval = self._interval
 
+    @property
+    def max_interval(self):
+        """
+        Maximum delay between polls if nothing changes or None
+
+        See `RequestPoller.max_interval`.
+        """
+        return self._max_interval
+
+    @max_interval.setter
+    def max_interval(self, max_interval):
+        self._max_interval = float(max_interval) if max_interval else None
+        for poller in self._existing_pollers:
+            poller.max_interval = self._max_interval
+
+    def reset_intervals(self):
+        """Make all pollers that have slowed down go back to `interval`"""
+        for poller in self._existing_pollers:
+            poller.reset_interval()
 
     def created(self, prop):
         """Whether property `prop` was created"""
@@ -80,7 +100,9 @@ class API():
     def status(self):
         """StatusAPI singleton"""
         log.debug('Creating StatusAPI singleton')
-        return StatusAPI(self, interval=self._interval)
+        status = StatusAPI(self, interval=self._interval)
+        status.max_interval = self._max_interval
+        return status
 
     @cached_property
     def freespace(self):
@@ -96,13 +118,17 @@ class API():
     def settings(self):
         """SettingsAPI singleton"""
         log.debug('Creating SettingsAPI singleton')
-        return SettingsAPI(self, interval=self._interval)
+        settings = SettingsAPI(self, interval=self._interval)
+        settings.max_interval = self._max_interval
+        return settings
 
     @cached_property(after_creation=lambda self: setattr(self, 'treqpool_created', True))
     def treqpool(self):
         """TorrentRequestPool singleton"""
         log.debug('Creating TorrentRequestPool singleton')
-        return TorrentRequestPool(self, interval=self._interval)
+        treqpool = TorrentRequestPool(self, interval=self._interval)
+        treqpool.max_interval = self._max_interval
+        return treqpool
 
 
     def create_poller(self, *args, interval=None, **kwargs):
@@ -116,12 +142,26 @@ class API():
         The RequestPoller instance is treated like all other pollers, i.e. it
         is polled when `poll` is called, its interval is changed when
         `interval` is set, etc.
+
+        If the request is `TorrentAPI.torrents` with no other arguments than
+        `torrents` and `keys`, it is merged into the `treqpool` request and a
+        PooledPoller is returned.
         """
-        poller = RequestPoller(*args, interval=self.interval, **kwargs)
+        if self._is_poolable(*args, **kwargs):
+            poller = self.treqpool.create_poller(*args[1:], **kwargs)
+        else:
+            poller = RequestPoller(*args, interval=self.interval, **kwargs)
+            poller.max_interval = self._max_interval
         self._pollers.append(poller)
         self.manage_pollers_now()
         return poller
 
+    def _is_poolable(self, request=None, *args, **kwargs):
+        return (self.created('torrent') and
+                request == self.torrent.torrents and
+                len(args) <= 1 and
+                set(kwargs).issubset(('keys',) if args else ('torrents', 'keys')))
+
     async def _manage_pollers(self):
         def is_needed(poller):
             # Whether anyone is still interested in the poller
@@ -9,12 +9,15 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
+import collections
 import itertools
 import operator
 import re
 from collections import abc
 
 from ...utils import cliparser
+from .. import vectorized
+from ..utils import SmartCmpStr, Timestamp
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -24,6 +27,69 @@ BOOLEAN = 'boolean'
 COMPARATIVE = 'comparative'
 
 
+_Pattern = type(re.compile(''))
+
+# Operators that also work on NumPy arrays
+_VECTOR_OPERATORS = ('=', '>', '<', '>=', '<=')
+
+# Unbound `str` methods that skip SmartCmpStr's comparison logic
+_STR_OPERATORS = {
+    operator.__eq__: str.__eq__, operator.__contains__: str.__contains__,
+    operator.__gt__: str.__gt__, operator.__lt__: str.__lt__,
+    operator.__ge__: str.__ge__, operator.__le__: str.__le__,
+}
+
+def _compile_value_matcher(value_getter, op, user_value):
+    """
+    Return function that takes an item and returns whether its value(s) match
+
+    This does the same as the default `value_matcher` of CmpFilterSpec, but
+    SmartCmpStr comparisons are resolved once instead of for every item.
+    """
+    vg = value_getter
+    Iterator = abc.Iterator
+    if isinstance(user_value, _Pattern):
+        # Regular expression was compiled by Filter._validate_user_value()
+        search = user_value.search
+
+        def matcher(item):
+            item_value = vg(item)
+            if isinstance(item_value, str):
+                return search(item_value)
+            elif isinstance(item_value, Iterator):
+                return any(op(ival, user_value) for ival in item_value)
+            else:
+                return search(str(item_value))
+        return matcher
+
+    str_op = _STR_OPERATORS.get(op)
+    if str_op is None or not isinstance(user_value, str):
+        def matcher(item):
+            item_value = vg(item)
+            if isinstance(item_value, Iterator):
+                return any(op(ival, user_value) for ival in item_value)
+            else:
+                return op(item_value, user_value)
+        return matcher
+
+    # SmartCmpStr compares case-insensitively if the other string is all lower case
+    user_str = str(user_value)
+    casefold = user_str == user_str.casefold()
+
+    def matcher(item):
+        item_value = vg(item)
+        if isinstance(item_value, SmartCmpStr):
+            if casefold:
+                return op(item_value.casefold(), user_str)
+            else:
+                return str_op(item_value, user_str)
+        elif isinstance(item_value, Iterator):
+            return any(op(ival, user_value) for ival in item_value)
+        else:
+            return op(item_value, user_value)
+    return matcher
+
+
 class BoolFilterSpec():
     """Boolean filter specification"""
 
@@ -76,6 +142,7 @@ class CmpFilterSpec():
         else:
             raise TypeError('Missing argument with needed_keys=%r: value_getter', self.needed_keys)
 
+        self._default_value_matcher = value_matcher is None
         if value_matcher is None:
             def value_matcher(item, op, user_value, vg=self.value_getter):
                 item_value = vg(item)
@@ -102,6 +169,9 @@ class CmpFilterSpec():
         elif user_value is None:
             # Operator with no value matches everything
             return (None, (), False)
+        elif self._default_value_matcher:
+            return (_compile_value_matcher(self.value_getter, operator, user_value),
+                    self.needed_keys, invert)
         else:
             def f(obj, vm=self.value_matcher, op=operator, val=user_value):
                 return vm(obj, op, val)
@@ -134,6 +204,73 @@ class FilterSpecDict(abc.Mapping):
         return '%s(%r)' % (type(self).__name__, self._dct)
 
 
+CacheInfo = collections.namedtuple('CacheInfo', ('hits', 'misses', 'maxsize', 'currsize'))
+
+class _ParsedCache():
+    """
+    Map keys made by Filter._cache_key() to the attributes of a parsed filter
+
+    Filters and filter chains are immutable after they are parsed, so instances
+    that are created from the same string can share their parsed state.  The
+    least recently used items are discarded when there are more than `maxsize`.
+
+    Filters with a Timestamp value (e.g. "added>14:00") are not cached because
+    the value depends on the time they were parsed.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._items = collections.OrderedDict()
+
+    def get(self, key):
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        else:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def add(self, keys, value):
+        for key in keys:
+            self._items[key] = value
+            self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+        self.hits = self.misses = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._items))
+
+    def __repr__(self):
+        lookups = self.hits + self.misses
+        hitrate = self.hits / lookups * 100 if lookups else 0
+        return '<%s hits=%d, misses=%d (%.0f%% hits), size=%d/%d>' % (
+            type(self).__name__, self.hits, self.misses, hitrate, len(self._items), self.maxsize)
+
+_parsed = _ParsedCache(maxsize=1000)
+
+def cache_info():
+    """
+    Return usage of the cache that is shared by all Filter and FilterChain
+    instances
+
+    The return value is a namedtuple with the fields `hits`, `misses`, `maxsize`
+    and `currsize`, like `functools.lru_cache` provides.
+    """
+    return _parsed.info()
+
+def cache_clear():
+    """Remove all parsed filters from the cache and reset its statistics"""
+    _parsed.clear()
+
+
 class Filter():
     """Match sequences of objects against a single filter"""
 
@@ -141,7 +278,7 @@ class Filter():
         '='  : operator.__eq__, '~'  : operator.__contains__,
         '>'  : operator.__gt__, '<'  : operator.__lt__,
         '>=' : operator.__ge__, '<=' : operator.__le__,
-        '=~' : lambda a, b: re.search(b, a),
+        '=~' : lambda a, b: b.search(a if isinstance(a, str) else str(a)),
     }
     INVERT_CHAR = '!'
     POSSIBLE_OPERATORS = tuple(itertools.chain.from_iterable((op, '!' + op)
@@ -191,7 +328,7 @@ class Filter():
     @classmethod
     def _make_filter(cls, name, op, user_value, invert):
         """
-        Return filter function, needed keys and invert
+        Return filter function, needed keys, invert and validated user value
 
         Filter function takes a value and returns whether it matches
         `user_value`.
@@ -207,9 +344,11 @@ class Filter():
 
         fspec = cls._get_filter_spec(name)
         if fspec.type is BOOLEAN:
-            return (fspec.filter_function, fspec.needed_keys, invert)
+            return (fspec.filter_function, fspec.needed_keys, invert, user_value)
         elif fspec.type is COMPARATIVE:
-            return fspec.make_filter(cls.OPERATORS.get(op), user_value, invert)
+            filter_func, needed_keys, invert = fspec.make_filter(cls.OPERATORS.get(op),
+                                                                 user_value, invert)
+            return (filter_func, needed_keys, invert, user_value)
 
     @classmethod
     def _validate_user_value(cls, name, op, user_value):
@@ -241,6 +380,10 @@ class Filter():
             else:
                 raise ValueError('No filter expression given')
 
+        # In case of regex operator, compile user_value
+        if op == '=~':
+            return cls._compile_regex(name, fspec, user_value)
+
         # Convert user_value to proper type
         if type(user_value) is not fspec.value_type:
             log.debug('  Converting %r to %r', user_value, fspec.value_type)
@@ -249,23 +392,35 @@ class Filter():
             except ValueError:
                 raise ValueError('Invalid value for filter %r: %r' % (name, user_value))
 
-        # In case of regex operator, compile user_value
-        if op == '=~':
-            try:
-                user_value = re.compile(user_value)
-            except re.error as e:
-                raise ValueError('Invalid regular expression: %s: %s' % (str(e).capitalize(), user_value))
-        else:
-            # Test if target_type supports operator
-            try:
-                log.debug('Trying %r(%r [%r], %r [%r])',
-                          cls.OPERATORS[op], user_value, type(user_value), user_value, type(user_value))
-                cls.OPERATORS[op](user_value, user_value)
-            except TypeError:
-                raise ValueError('Invalid operator for filter %r: %s' % (name, op))
+        # Test if target_type supports operator
+        try:
+            log.debug('Trying %r(%r [%r], %r [%r])',
+                      cls.OPERATORS[op], user_value, type(user_value), user_value, type(user_value))
+            cls.OPERATORS[op](user_value, user_value)
+        except TypeError:
+            raise ValueError('Invalid operator for filter %r: %s' % (name, op))
 
         return user_value
 
+    @staticmethod
+    def _compile_regex(name, fspec, user_value):
+        """
+        Return compiled regular expression for filter `name`
+
+        Raise ValueError if `user_value` is not a valid regular expression or if
+        the filter can't match against strings
+        """
+        # Non-string values are matched by their string representation, which
+        # only the default value_matcher knows about
+        value_type = fspec.value_type
+        is_str_type = isinstance(value_type, type) and issubclass(value_type, str)
+        if not is_str_type and not fspec._default_value_matcher:
+            raise ValueError('Invalid operator for filter %r: =~' % (name,))
+        try:
+            return re.compile(str(user_value))
+        except re.error as e:
+            raise ValueError('Invalid regular expression: %s: %s' % (str(e).capitalize(), user_value))
+
     @classmethod
     def _parse_inverter(cls, string, invert):
         if not string:
@@ -285,7 +440,27 @@ class Filter():
             # Return string unchanged
             return string, invert
 
+    @classmethod
+    def _cache_key(cls, string):
+        # Include class attributes that change how `string` is parsed
+        return (cls, cls.DEFAULT_FILTER, cls.DEFAULT_OPERATOR, string)
+
+    _STATE = ('_filter_func', '_needed_keys', '_name', '_invert', '_op', '_user_value', '_hash',
+              '_is_cacheable')
+
     def __init__(self, filter_str=''):
+        key = self._cache_key(filter_str)
+        state = _parsed.get(key)
+        if state is None:
+            self._parse(filter_str)
+            if self._is_cacheable:
+                state = tuple(getattr(self, attr) for attr in self._STATE)
+                _parsed.add((key, self._cache_key(str(self))), state)
+        else:
+            for attr,value in zip(self._STATE, state):
+                setattr(self, attr, value)
+
+    def _parse(self, filter_str):
         # name: Name of filter (user-readable string)
         # invert: Whether to invert filter (bool)
         # op: Comparison operator as string (see OPERATORS)
@@ -333,7 +508,7 @@ class Filter():
         try:
             log.debug('  Getting filter spec: name=%r, op=%r, user_value=%r', name, op, user_value)
             # Get filter spec by `name`
-            filter_func, needed_keys, invert = self._make_filter(name, op, user_value, invert)
+            filter_func, needed_keys, invert, value = self._make_filter(name, op, user_value, invert)
         except ValueError:
             # Filter spec lookup failed
             if self.DEFAULT_FILTER and user_value is op is None:
@@ -343,7 +518,8 @@ class Filter():
                 name, op, user_value = self.DEFAULT_FILTER, self.DEFAULT_OPERATOR, name
                 log.debug('  Using name as value for default filter: name=%r, op=%r, user_value=%r',
                           name, op, user_value)
-                filter_func, needed_keys, invert = self._make_filter(name, op, user_value, invert)
+                filter_func, needed_keys, invert, value = self._make_filter(name, op, user_value,
+                                                                            invert)
             else:
                 # No DEFAULT_FILTER is set, so we can't default to it
                 raise
@@ -354,6 +530,9 @@ class Filter():
         self._needed_keys = needed_keys
         self._name, self._invert, self._op, self._user_value = name, invert, op, user_value
         self._hash = hash((name, invert, op, user_value))
+        # Partial dates and times (e.g. "14:00") are resolved against the
+        # current time when the user value is converted
+        self._is_cacheable = not isinstance(value, Timestamp)
 
     def apply(self, objs, invert=False, key=None):
         """Yield matching objects or `key` of each matching object"""
@@ -389,6 +568,26 @@ class Filter():
         else:
             return bool(is_wanted(obj)) ^ self._invert
 
+    def _vector_comparison(self):
+        """
+        Return `(value_getter, operator, user_value)` if this filter compares
+        plain numbers with the default value matcher, None otherwise
+        """
+        try:
+            return self._vector_comparison_cache
+        except AttributeError:
+            pass
+        result = None
+        if self._filter_func is not None and self._op in _VECTOR_OPERATORS and self._user_value is not None:
+            fspec = self._get_filter_spec(self._name)
+            value_type = fspec.value_type
+            if (fspec.type is COMPARATIVE and fspec._default_value_matcher and
+                isinstance(value_type, type) and vectorized._is_plain_number_type(value_type)):
+                user_value = self._validate_user_value(self._name, self._op, self._user_value)
+                result = (fspec.value_getter, self.OPERATORS[self._op], float(user_value))
+        self._vector_comparison_cache = result
+        return result
+
     def __str__(self):
         if self._name is None:
             return self.DEFAULT_FILTER or ''
@@ -438,6 +637,47 @@ class Filter():
         return self._hash
 
 
+def _compile_filter(f):
+    # Return function that returns a truthy value if `f` matches or True/False
+    # if `f` matches everything/nothing
+    func = f._filter_func
+    if func is None:
+        return not f._invert
+    elif f._invert:
+        return lambda obj: not func(obj)
+    else:
+        return func
+
+
+def _combine(preds, all_):
+    # Combine functions with AND (`all_` is True) or OR into one function
+    if not preds:
+        # No AND'ed function failed / no OR'ed function succeeded
+        return all_
+    elif len(preds) == 1:
+        return preds[0]
+    elif len(preds) == 2:
+        a, b = preds
+        if all_:
+            return lambda obj: a(obj) and b(obj)
+        else:
+            return lambda obj: a(obj) or b(obj)
+    elif all_:
+        def pred(obj):
+            for p in preds:
+                if not p(obj):
+                    return False
+            return True
+        return pred
+    else:
+        def pred(obj):
+            for p in preds:
+                if p(obj):
+                    return True
+            return False
+        return pred
+
+
 # The filter specs are specified on the Filter subclasses in each module, but we
 # only want to export the classes derived from FilterChain, so this metalcass
 # grabs attributes that are missing from FilterChain from it's 'filterclass'
@@ -458,16 +698,32 @@ class FilterChain(metaclass=_forward_attrs):
         if not isinstance(self.filterclass, type) or not issubclass(self.filterclass, Filter):
             raise RuntimeError('Attribute "filterclass" must be set to a Filter subclass')
 
-        if isinstance(filters, str):  # Because str is also instance of abc.Sequence
+        if type(filters) is type(self):
+            # Share parsed filters without parsing the string representation
+            self._filterchains, self._predicate = filters._filterchains, filters._predicate
+            return
+        elif isinstance(filters, str):  # Because str is also instance of abc.Sequence
             pass
         elif isinstance(filters, abc.Sequence) and all(isinstance(f, str) for f in filters):
             filters = '|'.join(filters)
         elif isinstance(filters, (type(self), self.filterclass)):
             filters = str(filters)
-        elif not isinstance(filters, str):
+        else:
             raise ValueError('Filters must be string or sequence of strings, not %s: %r'
                              % (type(filters).__name__, filters))
 
+        key = (type(self),) + self.filterclass._cache_key(filters)
+        state = _parsed.get(key)
+        if state is None:
+            self._parse(filters)
+            if all(f._is_cacheable for chain in self._filterchains for f in chain):
+                _parsed.add((key, (type(self),) + self.filterclass._cache_key(str(self))),
+                            (self._filterchains, self._predicate))
+        else:
+            self._filterchains, self._predicate = state
+        log.debug('Parsed filter cache: %r', _parsed)
+
+    def _parse(self, filters):
         self._filterchains = ()
 
         # Split `filters` at boolean operators
@@ -512,27 +768,94 @@ class FilterChain(metaclass=_forward_attrs):
             log.debug('Chained %r and %r to %r', filters, ops, fchain)
             self._filterchains = tuple(tuple(x) for x in fchain)
 
+        self._predicate = self._compile(self._filterchains)
+
+    @staticmethod
+    def _compile(chains):
+        """
+        Combine filters into a single function that takes an object and returns
+        whether it matches
+
+        Return True or False instead of a function if every object matches or
+        nothing matches.
+        """
+        # All filters in an AND_chain must match for the AND_chain to
+        # match.  At least one AND_chain must match.
+        OR_preds = []
+        for AND_chain in chains:
+            AND_preds = []
+            for f in AND_chain:
+                pred = _compile_filter(f)
+                if pred is False:
+                    AND_preds = False
+                    break
+                elif pred is not True:
+                    AND_preds.append(pred)
+            if AND_preds is False:
+                continue
+            pred = _combine(AND_preds, all_=True)
+            if pred is True:
+                return True
+            OR_preds.append(pred)
+        if not chains:
+            return True
+        return _combine(OR_preds, all_=False)
+
     def apply(self, objects):
         """Yield matching objects from iterable `objects`"""
-        chains = self._filterchains
-        if chains:
-            for obj in objects:
-                if any(all(f.match(obj) for f in AND_chain)
-                       for AND_chain in chains):
-                    yield obj
-        else:
+        predicate = self._predicate
+        if predicate is True:
             yield from objects
+        elif predicate is not False:
+            if (isinstance(objects, abc.Sequence) and vectorized.enabled(len(objects))
+                and any(f._vector_comparison() is not None
+                        for AND_chain in self._filterchains for f in AND_chain)):
+                yield from self._apply_vectorized(objects)
+            else:
+                yield from filter(predicate, objects)
+
+    def _apply_vectorized(self, items):
+        # Numeric comparisons are done on arrays, other filters are only
+        # called for items that are not decided yet.
+        numpy = vectorized.numpy
+        columns = {}  # Map value getters to arrays
+        matches = numpy.zeros(len(items), dtype=bool)
+        for AND_chain in self._filterchains:
+            AND_matches = ~matches
+            python_filters = []
+            for f in AND_chain:
+                comparison = f._vector_comparison()
+                if comparison is None:
+                    python_filters.append(f)
+                    continue
+                value_getter, op, user_value = comparison
+                if value_getter not in columns:
+                    columns[value_getter] = vectorized.number_column([value_getter(item) for item in items])
+                column = columns[value_getter]
+                if column is None:
+                    python_filters.append(f)
+                    continue
+                f_matches = op(column, user_value)
+                AND_matches &= ~f_matches if f._invert else f_matches
+
+            preds = [_compile_filter(f) for f in python_filters]
+            if False in preds:
+                continue
+            pred = _combine([p for p in preds if p is not True], all_=True)
+            if pred is not True:
+                indexes = numpy.flatnonzero(AND_matches)
+                candidates = [items[i] for i in indexes.tolist()]
+                AND_matches[indexes] = vectorized.mask(candidates, pred)
+            matches |= AND_matches
+        return vectorized.select(items, matches)
 
     def match(self, obj):
         """Whether `obj` matches this filter chain"""
-        # All filters in an AND_chain must match for the AND_chain to
-        # match.  At least one AND_chain must match.
-        chains = self._filterchains
-        if not chains:
-            return True
+        predicate = self._predicate
+        if predicate is True or predicate is False:
+            return predicate
         else:
-            return any(all(f.match(obj) for f in AND_chain)
-                       for AND_chain in chains)
+            return bool(predicate(obj))
 
     @property
     def needed_keys(self):
@@ -554,6 +877,9 @@ class FilterChain(metaclass=_forward_attrs):
             other_fc_sets = set(frozenset(x) for x in other._filterchains)
             return self_fc_sets == other_fc_sets
 
+    def __hash__(self):
+        return hash(frozenset(frozenset(x) for x in self._filterchains))
+
     def __str__(self):
         if len(self._filterchains) < 1:
             return ''
@@ -49,12 +49,25 @@ class RequestPoller():
     interval: Delay between calls
 
     Any other positional or keyword arguments are passed to `request`.
+
+    Requests are made at multiples of `interval` on the event loop's clock, so
+    pollers with the same interval make their requests at the same time
+    instead of sending them out of phase.
+
+    If `max_interval` is set, the interval is doubled (up to `max_interval`)
+    every time a response is the same as the previous one and reset when it
+    changes.  Responses are compared by their `fingerprint`.
     """
     def __init__(self, request, *args, interval=1, **kwargs):
         self._on_response = blinker.Signal()
         self._on_error = blinker.Signal()
         self._prev_error = None
         self._interval = interval
+        self._current_interval = interval
+        self._max_interval = None
+        self._background = False
+        self._prev_fingerprint = None
+        self.fingerprint = lambda response: response
         self._poll_task = None
         self._poll_loop_task = None
         self._sleep = SleepUneasy()
@@ -99,7 +112,7 @@ class RequestPoller():
                 self._poll_task = None
                 self._skip_ongoing_request = False
 
-            await self._sleep.sleep(self._interval)
+            await self._sleep.sleep(self._current_interval)
 
     async def _do_poll(self):
         """
@@ -117,10 +130,41 @@ class RequestPoller():
                 response = await self._request()
             except errors.ClientError as e:
                 # Report error but keep trying to connect
+                self._current_interval = self._interval
                 self._run_callbacks(error=e)
             else:
+                self._adapt_interval(response)
                 self._run_callbacks(response=response)
 
+    @property
+    def _adaptive(self):
+        return self._max_interval is not None and self._max_interval > self._interval
+
+    def _adapt_interval(self, response):
+        if not self._adaptive:
+            self._current_interval = self._interval
+            return
+        fingerprint = self.fingerprint(response)
+        if self._background:
+            self._current_interval = self._max_interval
+        elif fingerprint != self._prev_fingerprint:
+            self._current_interval = self._interval
+        else:
+            self._current_interval = min(self._current_interval * 2, self._max_interval)
+        self._prev_fingerprint = fingerprint
+        log.debug('Next poll in %.1fs: %s', self._current_interval, self._debug_info['request'])
+
+    def reset_interval(self):
+        """
+        Go back to `interval` if polling has slowed down (see `max_interval`)
+
+        If the poller is sleeping longer than `interval`, poll immediately.
+        """
+        if self._current_interval > self._interval:
+            log.debug('Resetting interval to %.1fs: %s', self._interval, self._debug_info['request'])
+            self._current_interval = self._interval
+            self.poll()
+
     def _run_callbacks(self, response=None, error=None):
         if self._skip_ongoing_request:
             log.debug('Request was skipped - not running callbacks: %s', self)
@@ -167,8 +211,9 @@ class RequestPoller():
         """
         Poll immediately instead of waiting for next interval
 
-        This also resets the interval - the next request is made `interval`
-        seconds after this method is called.
+        The following requests are still made at multiples of `interval` on
+        the event loop's clock (see PerfectInterval), so the next one may be
+        made less than `interval` seconds after this method is called.
 
         Do nothing if this poller is not started.
         """
@@ -242,9 +287,45 @@ class RequestPoller():
     @interval.setter
     def interval(self, interval):
         self._interval = float(interval)
+        self._current_interval = self._interval
         if self.running:
             self.poll()
 
+    @property
+    def max_interval(self):
+        """
+        Maximum seconds between polls while responses don't change or None
+
+        If this is None or not larger than `interval`, polling never slows
+        down.
+        """
+        return self._max_interval
+
+    @max_interval.setter
+    def max_interval(self, max_interval):
+        self._max_interval = float(max_interval) if max_interval is not None else None
+        if not self._adaptive:
+            self.reset_interval()
+
+    @property
+    def background(self):
+        """
+        Whether nobody is looking at the responses right now
+
+        Background pollers poll every `max_interval` seconds.  Unsetting this
+        calls `reset_interval`.
+        """
+        return self._background
+
+    @background.setter
+    def background(self, background):
+        self._background = bool(background)
+        if self._background:
+            if self._adaptive:
+                self._current_interval = self._max_interval
+        else:
+            self.reset_interval()
+
     def __repr__(self):
         if hasattr(self, '_debug_info'):
             return '<%s %s, callbacks=%s, error_callbacks=%s>' % (
@@ -9,7 +9,9 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
-from functools import partial
+import functools
+
+from .. import vectorized
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -21,20 +23,72 @@ class SortSpec():
         self.description = description
         self.aliases = aliases
 
-    def __call__(self, items, reverse=False, inplace=False, item_getter=lambda item: item):
-        if not items:
-            return items
 
-        for keyfunc in self._keyfuncs:
-            def key_getter(item):
-                return keyfunc(item_getter(item))
+class _Ascending():
+    # Sort key that is only compared with `<`, even for equality, because tuple
+    # comparison uses `==` and some values (e.g. Status) don't define it
+    # consistently with `<`
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __eq__(self, other):
+        return not (self.value < other.value or other.value < self.value)
+
+
+class _Descending(_Ascending):
+    __slots__ = ()
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+@functools.lru_cache(maxsize=None)
+def _plain_type(type_):
+    # Return int, float or str if `type_` compares like it, None otherwise
+    for plain in (int, float, str):
+        if issubclass(type_, plain):
+            if type_.__lt__ is plain.__lt__ and type_.__eq__ is plain.__eq__:
+                return plain
+            break
+    return None
+
+
+def _tuple_column(values, descending):
+    # Return `values` so they sort correctly in ascending order as part of a tuple
+    plain_types = {_plain_type(type_) for type_ in set(map(type, values))}
+    if None in plain_types:
+        wrapper = _Descending if descending else _Ascending
+        return [wrapper(value) for value in values]
+    elif not descending:
+        return values
+    elif str in plain_types:
+        return [_Descending(value) for value in values]
+    else:
+        return [-value for value in values]
 
-            if inplace:
-                items[:] = sorted(items, key=key_getter, reverse=reverse)
-            else:
-                items = sorted(items, key=key_getter, reverse=reverse)
 
-        return items
+def _composite_keys(columns, reverses):
+    """
+    Return list of sort keys and whether to sort them in reverse
+
+    columns: Sequence of lists with one value per item for each sort key in the
+             order they are applied (i.e. the last one is the primary key)
+    reverses: Sequence of booleans that specify the sort direction of each
+              column
+    """
+    if len(columns) == 1:
+        return columns[0], reverses[0]
+
+    # Sort in reverse if all keys are reversed so we don't have to invert each key
+    reverse = all(reverses)
+    keys = zip(*(_tuple_column(column, rev != reverse)
+                 for column, rev in zip(reversed(columns), reversed(reverses))))
+    return list(keys), reverse
 
 
 class _SorterBaseMeta(type):
@@ -60,7 +114,7 @@ class SorterBase(metaclass=_SorterBaseMeta):
 
     def __init__(self, sortstrings=()):
         sortspecs = []
-        sortfuncs = []
+        reverses = []  # Sort direction of each sortspec
         strings = []   # String representations of sortspecs
 
         # Go through items in reverse because we want to deduplicate sort orders
@@ -80,9 +134,8 @@ class SorterBase(metaclass=_SorterBaseMeta):
             else:
                 sortspec = self.SORTSPECS[sortspecname]
                 if sortspec not in sortspecs:
-                    sortfunc = partial(sortspec, reverse=reverse)
                     sortspecs.insert(0, sortspec)
-                    sortfuncs.insert(0, sortfunc)
+                    reverses.insert(0, reverse)
                     strings.insert(0, (self.INVERT_CHARS[0] if reverse else '') + sortspecname)
         self._strings = tuple(strings)
 
@@ -90,11 +143,62 @@ class SorterBase(metaclass=_SorterBaseMeta):
         if self.DEFAULT_SORT is not None:
             default_sortspec = self.SORTSPECS[self.DEFAULT_SORT]
             if default_sortspec not in sortspecs:
-                sortfuncs.insert(0, default_sortspec)
                 sortspecs.insert(0, default_sortspec)
+                reverses.insert(0, False)
 
         self._sortspecs = sortspecs
-        self._sortfuncs = sortfuncs
+
+        # Key functions and their sort direction in the order they are applied
+        self._sortkeys = tuple((keyfunc, reverse)
+                               for sortspec, reverse in zip(sortspecs, reverses)
+                               for keyfunc in sortspec._keyfuncs)
+
+        # IDs of the sorted items and their wrapped sort keys (see
+        # _tuple_column()) from the previous apply() call
+        self._previous = ([], [])
+
+    def _get_order(self, items, item_getter):
+        """
+        Return list of indexes of `items` in sorted order or None if `items` are
+        already sorted
+
+        If `items` are in the order of the previous call's result and they still
+        have the same sort keys, they are not sorted again.
+        """
+        objs = [item_getter(item) for item in items]
+        columns = [[keyfunc(obj) for obj in objs] for keyfunc, _ in self._sortkeys]
+
+        # Compare wrapped keys because `==` is not consistent with `<` for some
+        # values.  Items are compared by ID so we don't keep them alive.
+        ids = [id(item) for item in items]
+        wrapped = [_tuple_column(column, reverse)
+                   for column, (_, reverse) in zip(columns, self._sortkeys)]
+        if self._previous == (ids, wrapped):
+            return None
+
+        reverses = [reverse for _, reverse in self._sortkeys]
+        order = None
+        if len(columns) >= vectorized.MIN_SORT_KEYS and vectorized.enabled(len(items)):
+            order = vectorized.sort_indexes(tuple(zip(columns, reverses)))
+        if order is None:
+            keys, reverse = _composite_keys(columns, reverses)
+            order = sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+
+        self._previous = ([ids[i] for i in order],
+                          [[column[i] for i in order] for column in wrapped])
+        if order != list(range(len(items))):
+            return order
+
+    def keys(self, objs):
+        """
+        Return list of sort keys of sequence `objs`
+
+        Objects sorted by their keys in ascending order are in the same order as
+        sorted by apply(), except for objects with equal keys.
+        """
+        columns = [_tuple_column([keyfunc(obj) for obj in objs], reverse)
+                   for keyfunc, reverse in reversed(self._sortkeys)]
+        return list(zip(*columns))
 
     def apply(self, items, inplace=False, item_getter=lambda item: item):
         """
@@ -110,8 +214,13 @@ class SorterBase(metaclass=_SorterBaseMeta):
         import time
         start_time = time.monotonic()
 
-        for sorter in self._sortfuncs:
-            items = sorter(items, inplace=inplace, item_getter=item_getter)
+        if not inplace:
+            items = list(items)
+
+        if items and self._sortkeys:
+            order = self._get_order(items, item_getter)
+            if order is not None:
+                items[:] = [items[i] for i in order]
 
         log.debug('-> Sorted %d items by %s in %.3fms',
                   len(items), self, (time.monotonic() - start_time) * 1e3)
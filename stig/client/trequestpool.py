@@ -9,11 +9,14 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
+import asyncio
 import operator
+from collections import abc
 from functools import reduce
 
 import blinker
 
+from .filters.torrent import TorrentFilter
 from .poll import RequestPoller
 
 from ..logging import make_logger  # isort:skip
@@ -28,14 +31,58 @@ class TorrentRequestPool(RequestPoller):
     needed keys for TorrentFilter from all subscribers.
 
     After the combined torrents have arrived, split it back up by using each
-    subscriber's filter and provide it to its callbacks as tuples.
+    subscriber's filter and provide it to its callbacks as tuples.  Each
+    distinct filter is applied only once, and subscribers with equal filters
+    get the same tuple.
+
+    Custom pollers of `TorrentAPI.torrents` requests (see `create_poller`) are
+    polled together with the subscribers.  Pollers that want the same keys are
+    merged into one request.
+
+    Subscribers and custom pollers in the background (see `set_background` and
+    `PooledPoller.background`) are left out of the request until `max_interval`
+    seconds have passed.
     """
-    def __init__(self, srvapi, interval=1):
+    def __init__(self, srvapi, interval=1, incremental=False, split_fields=False):
         self._api = srvapi.torrent
         self._tfilters = {}
         self._keys = {}
+        self._background_subscribers = {}  # Map background subscribers to time of last poll
+        self._pollers = []
+        self._incremental = bool(incremental)
+        self._split_fields = bool(split_fields)
         super().__init__(request=None, interval=interval)
-        self.on_response(self._handle_torrent_list)
+        self.fingerprint = lambda responses: self._api.generation
+        self.on_response(self._handle_responses)
+        self.on_error(self._handle_error, autoremove=False)
+
+    @property
+    def incremental(self):
+        """
+        Whether to request only recently active torrents
+
+        See the `incremental` argument of `TorrentAPI.torrents`.
+        """
+        return self._incremental
+
+    @incremental.setter
+    def incremental(self, incremental):
+        self._incremental = bool(incremental)
+        self._combine_requests()
+
+    @property
+    def split_fields(self):
+        """
+        Whether to request slow-changing values less often
+
+        See the `split_fields` argument of `TorrentAPI.torrents`.
+        """
+        return self._split_fields
+
+    @split_fields.setter
+    def split_fields(self, split_fields):
+        self._split_fields = bool(split_fields)
+        self._combine_requests()
 
     def register(self, sid, callback, keys=(), tfilter=None):
         """Add new request to request pool
@@ -67,35 +114,161 @@ class TorrentRequestPool(RequestPoller):
 
     def _combine_requests(self):
         """Create single request that combines keys and filters of all subscribers"""
-        if not self.has_subscribers:
+        if not self._tfilters and not self._pollers:
             # Don't request anything
             log.debug('No subscribers - setting request to None')
             self.set_request(None)
         else:
-            kwargs = {}
+            kwargs = self._combine_subscribers(self._tfilters)
+            self.set_request(self._request_all, kwargs)
+
+    def _combine_subscribers(self, events):
+        # Return keyword arguments for `TorrentAPI.torrents` that get the
+        # torrents for all subscribers in `events` or None if `events` is empty
+        if not events:
+            return None
+        kwargs = {}
+
+        all_filters = tuple(self._tfilters[event] for event in events)
+        if None in all_filters:
+            # At least one subscriber wants all torrents
+            kwargs['torrents'] = None
+        else:
+            # Equal filters don't need to be combined
+            kwargs['torrents'] = reduce(operator.__or__, dict.fromkeys(all_filters))
+
+        # Combine keys of all requests
+        kwargs['keys'] = reduce(lambda a,b: {*a,*b}, (self._keys[event] for event in events))
 
-            all_filters = tuple(self._tfilters.values())
-            if not all_filters or None in all_filters:
-                # No subscribers or at least one subscriber wants all torrents
-                kwargs['torrents'] = None
+        # Filters also need certain keys
+        for f in all_filters:
+            if f is not None:
+                kwargs['keys'].update(f.needed_keys)
+
+        if self._incremental:
+            kwargs['incremental'] = True
+        if self._split_fields:
+            kwargs['split_fields'] = True
+
+        log.debug('Combined filters: %s', kwargs['torrents'])
+        log.debug('Combined keys: %s', kwargs['keys'])
+        return kwargs
+
+    def set_background(self, sid, background):
+        """
+        Set whether nobody is looking at the torrents of subscriber `sid`
+
+        Background subscribers only get torrents every `max_interval` seconds.
+        Moving a subscriber to the foreground polls immediately.
+        """
+        event = blinker.signal(sid)
+        if event not in self._tfilters:
+            return
+        if background:
+            self._background_subscribers.setdefault(event, None)
+        elif event in self._background_subscribers:
+            del self._background_subscribers[event]
+            # Don't make the user wait for fresh data
+            self.poll()
+
+    def _subscriber_is_due(self, event, now):
+        # Background subscribers are only included in the request every
+        # `max_interval` seconds
+        if event not in self._background_subscribers or not self._adaptive:
+            return True
+        last_poll = self._background_subscribers[event]
+        if last_poll is None or now - last_poll >= self.max_interval:
+            self._background_subscribers[event] = now
+            return True
+        return False
+
+    def _combine_pollers(self, pollers):
+        # Map (keys, kind of torrents argument) to pollers
+        groups = {}
+        for poller in pollers:
+            keys = poller.keys if poller.keys == 'ALL' else frozenset(poller.keys)
+            if poller.torrents is None:
+                kind = 'all'
+            elif isinstance(poller.torrents, TorrentFilter):
+                kind = 'filter'
+            else:
+                kind = 'ids'
+            groups.setdefault((keys, kind), []).append(poller)
+
+        # Combine `torrents` arguments of each group into one
+        combined = []
+        for (_, kind),pollers in groups.items():
+            keys = pollers[0].keys
+            if kind == 'all':
+                torrents = None
+            elif kind == 'filter':
+                torrents = reduce(operator.__or__, (p.torrents for p in pollers))
+            else:
+                torrents = tuple(dict.fromkeys(tid for p in pollers for tid in p.torrents))
+            log.debug('Merged %d pollers: torrents=%s, keys=%s', len(pollers), torrents, keys)
+            combined.append((torrents, keys, tuple(pollers)))
+        return tuple(combined)
+
+    async def _request_all(self, kwargs):
+        """
+        Make all requests concurrently
+
+        Return a 3-tuple: The response for the subscribers (or None if no
+        subscribers are due), the subscribers that are due and a dictionary that
+        maps polled custom pollers to their response
+        """
+        now = asyncio.get_event_loop().time()
+        due_events = tuple(event for event in self._tfilters
+                           if self._subscriber_is_due(event, now))
+        if kwargs is not None and len(due_events) < len(self._tfilters):
+            kwargs = self._combine_subscribers(due_events)
+        due_pollers = [p for p in self._pollers if p._is_due(now)]
+        groups = self._combine_pollers(due_pollers)
+        requests = [self._api.torrents(torrents, keys=keys) for torrents,keys,_ in groups]
+        if kwargs is not None:
+            requests.append(self._api.torrents(**kwargs))
+        responses = await asyncio.gather(*requests)
+        subscribers_response = responses.pop() if kwargs is not None else None
+
+        poller_responses = {}
+        for (torrents,keys,pollers),response in zip(groups, responses):
+            if len(pollers) == 1 or not response.success:
+                for poller in pollers:
+                    poller_responses[poller] = response
             else:
-                kwargs['torrents'] = reduce(operator.__or__, all_filters)
+                # Split merged response by getting each poller's torrents from
+                # the cache we just updated
+                for poller in pollers:
+                    poller_responses[poller] = await self._api.torrents(
+                        poller.torrents, keys=poller.keys, from_cache=True)
+        return subscribers_response, due_events, poller_responses
 
-            # Combine keys of all requests
-            kwargs['keys'] = reduce(lambda a,b: {*a,*b}, self._keys.values())
+    def _handle_responses(self, responses):
+        # If the request failed, responses is None.
+        if responses is None:
+            subscribers_response, due_events, poller_responses = None, tuple(self._tfilters), {}
+        else:
+            subscribers_response, due_events, poller_responses = responses
 
-            # Filters also need certain keys
-            for f in all_filters:
-                if f is not None:
-                    kwargs['keys'].update(f.needed_keys)
+        if due_events:
+            self._handle_torrent_list(subscribers_response, due_events)
+
+        if responses is None:
+            for poller in self._pollers:
+                poller._on_response.send(None)
+        else:
+            for poller,response in poller_responses.items():
+                poller._on_response.send(response)
 
-            log.debug('Combined filters: %s', kwargs['torrents'])
-            log.debug('Combined keys: %s', kwargs['keys'])
-            self.set_request(self._api.torrents, **kwargs)
+    def _handle_error(self, error):
+        for poller in self._pollers:
+            poller._on_error.send(error)
 
-    def _handle_torrent_list(self, response):
+    def _handle_torrent_list(self, response, events):
         # If the request failed, response is None and tlist is empty.
         tlist = response.torrents if response is not None else ()
+        tfilters = {event:self._tfilters[event] for event in events
+                    if event in self._tfilters}
 
         dead_subscribers = []
 
@@ -107,34 +280,64 @@ class TorrentRequestPool(RequestPoller):
                 event.send(tlist)
 
         log.debug('Processing %d torrents for %d subscribers',
-                  len(tlist), len(self._tfilters))
-        if len(self._tfilters) == 1:
+                  len(tlist), len(tfilters))
+        if len(tfilters) == 1:
             # If there's only one subscriber, there's no need to filter the
             # torrents again.
-            event = next(iter(self._tfilters))
+            event = next(iter(tfilters))
             send(event, tlist)
         else:
             # More than 1 subscriber means we have to filter the torrents
-            # again for each one.
-            for event,filter in self._tfilters.items():
-                if filter is None:
-                    # Subscriber wants all torrents
-                    this_tlist = tlist
-                else:
-                    # Subscriber wants filtered torrents
-                    this_tlist = filter.apply(tlist)
+            # again for each one.  Subscribers that want all torrents get them
+            # unfiltered and equal filters are applied only once.
+            tlists = {None: tlist}
+            for event,filter in tfilters.items():
+                this_tlist = tlists.get(filter)
+                if this_tlist is None:
+                    this_tlist = tlists[filter] = tuple(filter.apply(tlist))
                 send(event, this_tlist)
 
         # Remove dead subscribers
         for eventname in dead_subscribers:
             self.remove(eventname)
 
+    def create_poller(self, torrents=None, keys='ALL'):
+        """
+        Return PooledPoller for `TorrentAPI.torrents` request
+
+        torrents: None, TorrentFilter (or its string representation) or
+                  sequence of torrent IDs
+        keys: Wanted Torrent keys or 'ALL'
+        """
+        if isinstance(torrents, str):
+            torrents = TorrentFilter(torrents)
+        elif torrents is not None and not isinstance(torrents, TorrentFilter):
+            if not (isinstance(torrents, abc.Sequence) and
+                    all(isinstance(tid, int) for tid in torrents)):
+                raise ValueError("Invalid 'torrents' argument: %r" % (torrents,))
+        if keys != 'ALL':
+            keys = tuple(keys)
+        return PooledPoller(self, torrents, keys)
+
+    def _add_poller(self, poller):
+        if poller not in self._pollers:
+            log.debug('Adding poller: %r', poller)
+            self._pollers.append(poller)
+            self._combine_requests()
+
+    def _remove_poller(self, poller):
+        if poller in self._pollers:
+            log.debug('Removing poller: %r', poller)
+            self._pollers.remove(poller)
+            self._combine_requests()
+
     def remove(self, sid):
         """Unsubscribe previously registered subscriber"""
         log.debug('Removing subscriber: %s', sid)
         event = blinker.signal(sid)
         del self._keys[event]
         del self._tfilters[event]
+        self._background_subscribers.pop(event, None)
         self._combine_requests()
 
     @property
@@ -149,3 +352,123 @@ class TorrentRequestPool(RequestPoller):
             return self._keys[event]
         except KeyError:
             return ()
+
+
+class PooledPoller():
+    """
+    Poll `TorrentAPI.torrents` as part of a TorrentRequestPool
+
+    This class provides the same interface as RequestPoller, but requests are
+    made by the pool, which merges them with other requests.  Use
+    `TorrentRequestPool.create_poller` to get an instance.
+    """
+    def __init__(self, pool, torrents, keys):
+        self._pool = pool
+        self._torrents = torrents
+        self._keys = keys
+        self._running = False
+        self._background = False
+        self._last_poll = None
+        self._on_response = blinker.Signal()
+        self._on_error = blinker.Signal()
+
+    @property
+    def torrents(self):
+        """`torrents` argument for `TorrentAPI.torrents`"""
+        return self._torrents
+
+    @property
+    def keys(self):
+        """`keys` argument for `TorrentAPI.torrents`"""
+        return self._keys
+
+    async def start(self):
+        """Add this poller to the pool and make sure the pool is polling"""
+        self._running = True
+        self._pool._add_poller(self)
+        if not self._pool.running:
+            await self._pool.start()
+
+    async def stop(self):
+        """Remove this poller from the pool"""
+        if self._running:
+            self._running = False
+            self._pool._remove_poller(self)
+            self._on_response.send(None)
+
+    @property
+    def running(self):
+        """Whether this poller is part of the pool's requests"""
+        return self._running
+
+    def _is_due(self, now):
+        # Background pollers are only included in the pool's request every
+        # `max_interval` seconds
+        if (not self._background or not self._pool._adaptive or self._last_poll is None or
+            now - self._last_poll >= self._pool.max_interval):
+            self._last_poll = now
+            return True
+        return False
+
+    def poll(self):
+        """Make the pool poll immediately"""
+        if self._running:
+            self._pool.poll()
+
+    @property
+    def interval(self):
+        """Seconds between polls (this is the pool's interval)"""
+        return self._pool.interval
+
+    @interval.setter
+    def interval(self, interval):
+        # The pool's interval is managed by its owner
+        pass
+
+    @property
+    def max_interval(self):
+        """Maximum seconds between polls (this is the pool's `max_interval`)"""
+        return self._pool.max_interval
+
+    @max_interval.setter
+    def max_interval(self, max_interval):
+        # The pool's maximum interval is managed by its owner
+        pass
+
+    @property
+    def background(self):
+        """
+        Whether nobody is looking at the responses right now
+
+        Background pollers are only polled every `max_interval` seconds.
+        """
+        return self._background
+
+    @background.setter
+    def background(self, background):
+        was_background = self._background
+        self._background = bool(background)
+        if was_background and not self._background:
+            # Don't make the user wait for fresh data
+            self.poll()
+
+    def reset_interval(self):
+        """Make the pool go back to its base interval"""
+        self._pool.reset_interval()
+
+    def on_response(self, callback, autoremove=True):
+        """See `RequestPoller.on_response`"""
+        self._on_response.connect(callback, weak=autoremove)
+
+    def on_error(self, callback, autoremove=True):
+        """See `RequestPoller.on_error`"""
+        self._on_error.connect(callback, weak=autoremove)
+
+    @property
+    def has_callbacks(self):
+        """Whether anyone is interested in response to callback"""
+        return (bool(self._on_response.receivers) or
+                bool(self._on_error.receivers))
+
+    def __repr__(self):
+        return '<%s torrents=%s, keys=%s>' % (type(self).__name__, self._torrents, self._keys)
@@ -550,22 +550,18 @@ class Timestamp(float):
 
 
 class PerfectInterval():
-    """Remove processing time from intervals"""
+    """
+    Remove processing time from intervals
 
-    def __init__(self):
-        self._last_timestamp = 0
+    Intervals end at multiples of `seconds` on the event loop's clock, so
+    different instances with the same interval end at the same time.
+    """
 
     def __call__(self, seconds):
+        if seconds <= 0:
+            return 0
         now = asyncio.get_event_loop().time()
-        if self._last_timestamp <= 0:
-            self._last_timestamp = int(now)
-            return seconds
-        else:
-            expected = self._last_timestamp + seconds
-            diff = now - expected
-            interval = max(seconds - diff, 0)
-            self._last_timestamp = expected
-            return interval
+        return seconds - (now % seconds)
 
 
 class SleepUneasy():
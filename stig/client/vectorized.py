@@ -0,0 +1,116 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Optional NumPy-backed filtering and sorting
+
+If NumPy is installed, FilterChain and SorterBase use it for long lists of
+items.  Values are collected into arrays once and compared and sorted in
+bulk.  Anything that can't be vectorized is handled in pure Python.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..logging import make_logger  # isort:skip
+log = make_logger(__name__)
+
+
+# Shorter lists are faster to filter and sort in pure Python
+MIN_ITEMS = 500
+
+# Sorting by fewer keys is faster with consecutive sorted() calls
+MIN_SORT_KEYS = 3
+
+_enabled = numpy is not None
+
+
+def use(enable):
+    """
+    Enable or disable vectorized filtering and sorting
+
+    Raise ValueError if NumPy is not installed and `enable` is True.
+    """
+    global _enabled
+    if enable and numpy is None:
+        raise ValueError('NumPy is not installed')
+    _enabled = bool(enable)
+
+
+def enabled(count=None):
+    """
+    Whether vectorized filtering and sorting is enabled
+
+    If `count` is given, also return False if there are less than `MIN_ITEMS`
+    items.
+    """
+    return _enabled and (count is None or count >= MIN_ITEMS)
+
+
+_NUMBER_COMPARISONS = (int.__lt__, float.__lt__)
+
+def _is_plain_number_type(type_):
+    # Number types with custom comparison (e.g. Timestamp) can't be vectorized
+    return issubclass(type_, (int, float)) and type_.__lt__ in _NUMBER_COMPARISONS
+
+
+def number_column(values):
+    """
+    Return float array of `values` or None if any value is not a plain number
+
+    `values` must be a sequence.
+    """
+    if all(_is_plain_number_type(t) for t in set(map(type, values))):
+        return numpy.array(values, dtype=float)
+
+
+def _sort_column(values):
+    # Return array that sorts like `values` or None
+    types = set(map(type, values))
+    if all(_is_plain_number_type(t) for t in types):
+        return numpy.array(values, dtype=float)
+    elif types == {str}:
+        # Replace strings with their rank so they can be reversed by negation
+        ranks = {string: rank for rank, string in enumerate(sorted(set(values)))}
+        return numpy.fromiter(map(ranks.__getitem__, values), dtype=numpy.intp, count=len(values))
+
+
+def mask(items, predicate):
+    """Return boolean array that is True for each item in `items` that `predicate` matches"""
+    return numpy.fromiter((bool(predicate(item)) for item in items), dtype=bool, count=len(items))
+
+
+def sort_indexes(keys):
+    """
+    Return list of indexes that sorts items by `keys` or None
+
+    keys: Sequence of `(values, reverse)` tuples in the order they would be
+          applied by consecutive stable sorts (i.e. the last key is the primary
+          key); `values` must have the same length for each key
+
+    None is returned if any `values` contain something other than plain numbers
+    or plain strings.
+    """
+    columns = []
+    for values, reverse in keys:
+        column = _sort_column(values)
+        if column is None:
+            return None
+        columns.append(-column if reverse else column)
+    # numpy.lexsort() uses the last key as the primary key and is stable
+    return numpy.lexsort(columns).tolist()
+
+
+def select(items, mask):
+    """Return list of items in `items` where `mask` is True"""
+    return [items[i] for i in numpy.flatnonzero(mask).tolist()]
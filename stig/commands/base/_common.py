@@ -10,6 +10,9 @@
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
 
+FORMATS = ('json', 'jsonl', 'csv')
+
+
 def make_X_FILTER_spec(filtername, or_focused=False, more_text='', **kwargs):
     spec = {'names': (filtername.upper() + ' FILTER',),
             'description': ('%s filter expression (see %s FILTERS section in `help filters`)' %
@@ -22,17 +25,35 @@ def make_X_FILTER_spec(filtername, or_focused=False, more_text='', **kwargs):
     return spec
 
 
-def make_SCRIPTING_doc(cmdname):
-    return (("If invoked as a command line argument and the output does not "
-             "go to a TTY (i.e. the terminal size can't be determined), "
-             "the output is optimized for scripting.  Numbers are "
-             "unformatted, columns are separated by a horizontal tab "
-             "character ('\\t') and headers are not printed."),
-            "",
-            ("To enforce human-readable, formatted output, set the environment "
-             "variables COLUMNS and LINES."),
-            "",
-            "\t$ \tCOLUMNS=80 LINES=24 {{__appname__}} {CMDNAME} | less -R".format(CMDNAME=cmdname))
+def make_FORMAT_spec():
+    return {'names': ('--format', '-f'),
+            'choices': FORMATS,
+            'description': ('Print values for scripting as %s '
+                            '(see SCRIPTING section); ignored in the TUI'
+                            % ', '.join(FORMATS))}
+
+
+def make_SCRIPTING_doc(cmdname, format_option=False):
+    doc = (("If invoked as a command line argument and the output does not "
+            "go to a TTY (i.e. the terminal size can't be determined), "
+            "the output is optimized for scripting.  Numbers are "
+            "unformatted, columns are separated by a horizontal tab "
+            "character ('\\t') and headers are not printed."),
+           "",
+           ("To enforce human-readable, formatted output, set the environment "
+            "variables COLUMNS and LINES."),
+           "",
+           "\t$ \tCOLUMNS=80 LINES=24 {{__appname__}} {CMDNAME} | less -R".format(CMDNAME=cmdname))
+    if format_option:
+        doc += ("",
+                ("The --format option prints the values that the selected columns "
+                 "are made of as a JSON array (json), one JSON object per line "
+                 "(jsonl) or CSV with a header row (csv), even if the output goes "
+                 "to a TTY.  Fields are named after the keys the values are taken "
+                 "from and each record is printed as soon as it is available."),
+                "",
+                "\t$ \t{{__appname__}} {CMDNAME} --format jsonl".format(CMDNAME=cmdname))
+    return doc
 
 
 def make_SORT_ORDERS_doc(sortercls, option, setting, append=()):
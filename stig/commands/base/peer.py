@@ -16,8 +16,8 @@ from ... import objects
 from ...completion import candidates
 from .. import CmdError, CommandMeta
 from . import _mixin as mixin
-from ._common import (make_COLUMNS_doc, make_SCRIPTING_doc, make_SORT_ORDERS_doc,
-                      make_X_FILTER_spec)
+from ._common import (FORMATS, make_COLUMNS_doc, make_FORMAT_spec, make_SCRIPTING_doc,
+                      make_SORT_ORDERS_doc, make_X_FILTER_spec)
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -49,6 +49,8 @@ class ListPeersCmdbase(mixin.get_peer_sorter, mixin.get_peer_columns,
          'default_description': "current value of 'columns.peers' setting",
          'description': ('Comma-separated list of column names '
                          "(see COLUMNS section)")},
+
+        make_FORMAT_spec(),
     )
 
     from ...client.sorters import PeerSorter
@@ -59,10 +61,10 @@ class ListPeersCmdbase(mixin.get_peer_sorter, mixin.get_peer_columns,
             'The "torrent" column is added automatically if multiple '
             'torrents could be listed potentially.')),
         'SORT ORDERS': make_SORT_ORDERS_doc(PeerSorter, '--sort', 'sort.peers'),
-        'SCRIPTING': make_SCRIPTING_doc(name),
+        'SCRIPTING': make_SCRIPTING_doc(name, format_option=True),
     }
 
-    async def run(self, TORRENT_FILTER, PEER_FILTER, sort, columns):
+    async def run(self, TORRENT_FILTER, PEER_FILTER, sort, columns, format):
         columns = objects.localcfg['columns.peers'] if columns is None else columns
         sort = objects.localcfg['sort.peers'] if sort is None else sort
         try:
@@ -84,15 +86,16 @@ class ListPeersCmdbase(mixin.get_peer_sorter, mixin.get_peer_columns,
         log.debug('Listing %s peers of %s torrents', pfilter, tfilter)
 
         if asyncio.iscoroutinefunction(self.make_peer_list):
-            await self.make_peer_list(tfilter, pfilter, sort, columns)
+            await self.make_peer_list(tfilter, pfilter, sort, columns, format)
         else:
-            self.make_peer_list(tfilter, pfilter, sort, columns)
+            self.make_peer_list(tfilter, pfilter, sort, columns, format)
 
     @classmethod
     def completion_candidates_posargs(cls, args):
         """Complete positional arguments"""
         posargs = args.posargs({('--columns', '-c'): 1,
-                                ('--sort', '-s'): 1})
+                                ('--sort', '-s'): 1,
+                                ('--format', '-f'): 1})
         if posargs.curarg_index == 1:
             return candidates.torrent_filter(args.curarg)
         elif posargs.curarg_index == 2:
@@ -106,3 +109,5 @@ class ListPeersCmdbase(mixin.get_peer_sorter, mixin.get_peer_columns,
             return candidates.column_names('peers')
         elif option == '--sort':
             return candidates.sort_orders('PeerSorter')
+        elif option == '--format':
+            return candidates.Candidates(FORMATS, label='Format')
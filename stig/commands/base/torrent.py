@@ -17,8 +17,8 @@ from ...completion import candidates
 from ...utils.cliparser import Arg
 from .. import CmdError, CommandMeta
 from . import _mixin as mixin
-from ._common import (make_COLUMNS_doc, make_SCRIPTING_doc, make_SORT_ORDERS_doc,
-                      make_X_FILTER_spec)
+from ._common import (FORMATS, make_COLUMNS_doc, make_FORMAT_spec, make_SCRIPTING_doc,
+                      make_SORT_ORDERS_doc, make_X_FILTER_spec)
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -145,6 +145,8 @@ class ListTorrentsCmdbase(mixin.get_torrent_sorter, mixin.get_torrent_columns,
          'default_description': "current value of 'columns.torrents' setting",
          'description': ('Comma-separated list of column names '
                          "(see COLUMNS section)")},
+
+        make_FORMAT_spec(),
     )
 
     from ...client.sorters import TorrentSorter
@@ -152,10 +154,10 @@ class ListTorrentsCmdbase(mixin.get_torrent_sorter, mixin.get_torrent_columns,
     more_sections = {
         'COLUMNS': make_COLUMNS_doc(COLUMNS, '--columns', 'columns.torrents'),
         'SORT ORDERS': make_SORT_ORDERS_doc(TorrentSorter, '--sort', 'sort.torrents'),
-        'SCRIPTING': make_SCRIPTING_doc(name),
+        'SCRIPTING': make_SCRIPTING_doc(name, format_option=True),
     }
 
-    async def run(self, TORRENT_FILTER, sort, columns):
+    async def run(self, TORRENT_FILTER, sort, columns, format):
         sort = objects.localcfg['sort.torrents'] if sort is None else sort
         columns = objects.localcfg['columns.torrents'] if columns is None else columns
         try:
@@ -169,9 +171,9 @@ class ListTorrentsCmdbase(mixin.get_torrent_sorter, mixin.get_torrent_columns,
         else:
             log.debug('Listing %s torrents sorted by %s', tfilter, sort)
             if asyncio.iscoroutinefunction(self.make_torrent_list):
-                await self.make_torrent_list(tfilter, sort, columns)
+                await self.make_torrent_list(tfilter, sort, columns, format)
             else:
-                self.make_torrent_list(tfilter, sort, columns)
+                self.make_torrent_list(tfilter, sort, columns, format)
 
     @classmethod
     def completion_candidates_posargs(cls, args):
@@ -185,6 +187,8 @@ class ListTorrentsCmdbase(mixin.get_torrent_sorter, mixin.get_torrent_columns,
             return candidates.sort_orders('TorrentSorter')
         elif option == '--columns':
             return candidates.column_names('torrents')
+        elif option == '--format':
+            return candidates.Candidates(FORMATS, label='Format')
 
 
 class TorrentMagnetURICmdbase(metaclass=CommandMeta):
@@ -16,8 +16,8 @@ from ... import objects
 from ...completion import candidates
 from .. import CmdError, CommandMeta
 from . import _mixin as mixin
-from ._common import (make_COLUMNS_doc, make_SCRIPTING_doc, make_SORT_ORDERS_doc,
-                      make_X_FILTER_spec)
+from ._common import (FORMATS, make_COLUMNS_doc, make_FORMAT_spec, make_SCRIPTING_doc,
+                      make_SORT_ORDERS_doc, make_X_FILTER_spec)
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -48,6 +48,8 @@ class ListTrackersCmdbase(mixin.get_tracker_sorter, mixin.get_tracker_columns,
          'default_description': "current value of 'columns.trackers' setting",
          'description': ('Comma-separated list of column names '
                          "(see COLUMNS section)")},
+
+        make_FORMAT_spec(),
     )
 
     from ...client.sorters import TrackerSorter
@@ -58,10 +60,10 @@ class ListTrackersCmdbase(mixin.get_tracker_sorter, mixin.get_tracker_columns,
             'The "torrent" column is added automatically if multiple '
             'torrents could be listed potentially.')),
         'SORT ORDERS': make_SORT_ORDERS_doc(TrackerSorter, '--sort', 'sort.trackers'),
-        'SCRIPTING': make_SCRIPTING_doc(name),
+        'SCRIPTING': make_SCRIPTING_doc(name, format_option=True),
     }
 
-    async def run(self, TORRENT_FILTER, TRACKER_FILTER, sort, columns):
+    async def run(self, TORRENT_FILTER, TRACKER_FILTER, sort, columns, format):
         columns = objects.localcfg['columns.trackers'] if columns is None else columns
         sort = objects.localcfg['sort.trackers'] if sort is None else sort
         try:
@@ -83,15 +85,16 @@ class ListTrackersCmdbase(mixin.get_tracker_sorter, mixin.get_tracker_columns,
         log.debug('Listing %s trackers of %s torrents', trkfilter, torfilter)
 
         if asyncio.iscoroutinefunction(self.make_tracker_list):
-            await self.make_tracker_list(torfilter, trkfilter, sort, columns)
+            await self.make_tracker_list(torfilter, trkfilter, sort, columns, format)
         else:
-            self.make_tracker_list(torfilter, trkfilter, sort, columns)
+            self.make_tracker_list(torfilter, trkfilter, sort, columns, format)
 
     @classmethod
     def completion_candidates_posargs(cls, args):
         """Complete positional arguments"""
         posargs = args.posargs({('--columns', '-c'): 1,
-                                ('--sort', '-s'): 1})
+                                ('--sort', '-s'): 1,
+                                ('--format', '-f'): 1})
         if posargs.curarg_index == 1:
             return candidates.torrent_filter(args.curarg)
         elif posargs.curarg_index == 2:
@@ -105,6 +108,8 @@ class ListTrackersCmdbase(mixin.get_tracker_sorter, mixin.get_tracker_columns,
             return candidates.column_names('trackers')
         elif option == '--sort':
             return candidates.sort_orders('TrackerSorter')
+        elif option == '--format':
+            return candidates.Candidates(FORMATS, label='Format')
 
 
 class AnnounceCmdbase(metaclass=CommandMeta):
@@ -9,8 +9,13 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
+import csv
+import json
+import math
 import re
+import sys
 import textwrap
+from collections import abc
 from shutil import get_terminal_size
 from types import SimpleNamespace
 
@@ -31,29 +36,34 @@ def _wrapped(line, width):
     else:
         yield from textwrap.wrap(line, width=width, break_on_hyphens=False)
 
-def _get_cell_lines(cell):
+def _get_cli_string(cell):
+    return normalize_unicode(str(cell.get_cli_value()))
+
+def _get_cell_lines(cell, line, width):
     # Return string of single cell correctly cropped/padded and aligned
-    line = normalize_unicode(str(cell.get_cli_value()))
-    width = cell.width
-    if isinstance(width, int):
-        if cell.wrap == 'clip':
-            return (crop_and_align(line, width, cell.align,
-                                   has_wide_chars=cell.may_have_wide_chars),)
-        else:
-            return tuple(stralign(line, width=width)
-                         for line in _wrapped(line, width))
+    if cell.wrap == 'clip':
+        return (crop_and_align(line, width, cell.align,
+                               has_wide_chars=cell.may_have_wide_chars),)
     else:
-        return (line,)
+        return tuple(stralign(line, width=width)
+                     for line in _wrapped(line, width))
 
-def _assemble_row(table, line_index, pretty=True):
+def _assemble_row(table, line_index):
     # Concatenate all cells in a row with delimiters
     # Return a list of lines (cells may have multiple lines)
+    cells = table.rows[line_index]
+    strings = table.strings[line_index]
     row = []
-    for cell in table.rows[line_index]:
-        if pretty:
-            row.append(_get_cell_lines(cell))
+    for colindex,colname in zip(table.colindexes, table.colorder):
+        cell = cells[colindex]
+        width = table.colwidths[colname]
+        if width < table.maxcolwidths[colname]:
+            # Values may depend on the width (e.g. shortened paths)
+            cell.width = width
+            line = _get_cli_string(cell)
         else:
-            row.append((str(cell.get_raw_value()),))
+            line = strings[colindex]
+        row.append(_get_cell_lines(cell, line, width))
 
     lines_count = max(len(cell) for cell in row)
     lines = []
@@ -72,8 +82,8 @@ def _assemble_row(table, line_index, pretty=True):
 
 def _assemble_headers(table):
     # Concatenate all column headers with delimiters
-    # This must be called after shrink_and_expand_to_fit() so we can
-    # grab the final column widths from the first row.
+    # This must be called after _fit_table_into_terminal() so we can
+    # grab the final column widths.
     headers = []
     for colname in table.colorder:
         width = table.colwidths[colname]
@@ -90,12 +100,6 @@ def _get_header_width(table, colname):
     return strwidth(' '.join((header.get('left', ''),
                               header.get('right', ''))).strip())
 
-def _get_colwidth(table, colindex):
-    # Return width of widest cell in column
-    rows = (normalize_unicode(str(row[colindex].get_cli_value()))
-            for row in table.rows)
-    return max(strwidth(row) for row in rows)
-
 def _column_has_variable_width(table, colname):
     # Whether column has fixed or variable width
     return not isinstance(table.colspecs[colname].width, int)
@@ -108,39 +112,36 @@ def _column_is_shrinkable(table, colname):
     # Whether the current width of column is larger than its minimum width
     return table.colwidths[colname] > table.colspecs[colname].min_width
 
-def _set_colwidth(table, colindex, width):
-    # Set width of all cells in a column
-    colname = table.colorder[colindex]
-    table.colwidths[colname] = width
-    for row in table.rows:
-        row[colindex].width = width
-
-def _set_maxcolwidth(table, colindex, maxwidth):
-    # Set maximum width a column can make use of (no cell needs more horizontal
-    # space than `maxwidth`)
-    colname = table.colorder[colindex]
-    table.maxcolwidths[colname] = maxwidth
-
 def _get_excess_width(table):
     # Return width by which table must be narrowed to fit in max_width
-    first_line = _assemble_row(table, 0)[0]
-    return strwidth(first_line) - table.max_width
+    delimiters_width = strwidth(table.delimiter) * (len(table.colorder) - 1)
+    return (sum(table.colwidths[colname] for colname in table.colorder)
+            + delimiters_width - table.max_width)
 
 def _remove_column(table, colindex):
-    # Delete column from internal structures
+    # Delete column from internal structures; cells stay in table.rows but
+    # aren't displayed anymore
     del table.colwidths[table.colorder[colindex]]
     del table.colorder[colindex]
-    for row in table.rows:
-        del row[colindex]
+    del table.colindexes[colindex]
 
 def _shrink_to_widest_value(table):
-    # Reduce width of columns where header and all values are narrower than the
-    # current width
-    for colindex,colname in enumerate(table.colorder):
-        max_value_width = max(_get_header_width(table, colname),
-                              _get_colwidth(table, colindex))
-        _set_colwidth(table, colindex, max_value_width)
-        _set_maxcolwidth(table, colindex, max_value_width)
+    # Render every cell once and reduce width of each column to its header or
+    # its widest value, whichever is wider
+    table.strings = []
+    value_widths = [0] * len(table.colorder)
+    for row in table.rows:
+        strings = [_get_cli_string(cell) for cell in row]
+        for colindex,string in enumerate(strings):
+            width = strwidth(string)
+            if width > value_widths[colindex]:
+                value_widths[colindex] = width
+        table.strings.append(strings)
+
+    for colname,value_width in zip(table.colorder, value_widths):
+        max_value_width = max(_get_header_width(table, colname), value_width)
+        table.colwidths[colname] = max_value_width
+        table.maxcolwidths[colname] = max_value_width
 
 def _shrink_variable_width_columns(table):
     # Reduce width of columns that haven't reached their min_size yet
@@ -161,15 +162,14 @@ def _shrink_variable_width_columns(table):
             shrink_amount = max(1, min(excess, widest0_width - widest1_width))
         elif len(candidates) >= 1:
             # Only one column left to shrink
-            widest0_name = candidates[0][0]
-            shrink_amount = 1
+            widest0_name, widest0_width = candidates[0]
+            shrink_amount = min(excess, widest0_width - table.colspecs[widest0_name].min_width)
         else:
             # No shrinkable columns
             break
 
-        new_width = table.colwidths[widest0_name] - shrink_amount
-        _set_colwidth(table, table.colorder.index(widest0_name), new_width)
-        excess = _get_excess_width(table)
+        table.colwidths[widest0_name] -= shrink_amount
+        excess -= shrink_amount
 
 def _shrink_by_removing_columns(table):
     # Remove columns until table is no longer wider than terminal
@@ -178,37 +178,122 @@ def _shrink_by_removing_columns(table):
 
     # We may have freed up space to give back to columns of variable width
     freed_width = -_get_excess_width(table)
-    if freed_width > 0:
-        while freed_width > 0:
-            freed_width -= 1
-            # Find non-fixed-width columns that could use more width
-            candidates = [(colname,table.colwidths[colname])
-                          for colname in table.colorder
-                          if (_column_has_variable_width(table, colname) and
-                              _column_could_use_more_width(table, colname))]
-            if not candidates:
-                # We have space left, but no column wants it
-                break
-            candidates_sorted = sorted(candidates, key=lambda col: col[1])
-            colname = candidates_sorted[0][0]
-            new_width = table.colwidths[candidates_sorted[0][0]] + 1
-            _set_colwidth(table, table.colorder.index(colname), new_width)
+    while freed_width > 0:
+        freed_width -= 1
+        # Find non-fixed-width columns that could use more width
+        candidates = [(colname,table.colwidths[colname])
+                      for colname in table.colorder
+                      if (_column_has_variable_width(table, colname) and
+                          _column_could_use_more_width(table, colname))]
+        if not candidates:
+            # We have space left, but no column wants it
+            break
+        colname = min(candidates, key=lambda col: col[1])[0]
+        table.colwidths[colname] += 1
 
 def _fit_table_into_terminal(table):
-    # Expand all cells in each colum to the width of the widest cell
-    # Keep track of each column width in table namespace
-    for colindex,colname in enumerate(table.colorder):
-        if _column_has_variable_width(table, colname):
-            colwidth = _get_colwidth(table, colindex)
-        else:
-            colwidth = table.colspecs[colname].width
-        _set_colwidth(table, colindex, colwidth)
-
+    # Column widths are calculated from the widest value in each column, which
+    # is the only part of a table that depends on the number of rows.  The
+    # remaining steps only look at the widths of the columns.
+    table.colindexes = list(range(len(table.colorder)))
     _shrink_to_widest_value(table)
     _shrink_variable_width_columns(table)
     _shrink_by_removing_columns(table)
 
-def print_table(items, order, column_specs):
+def _write_tsv(rows, colnames, delimiter='\t'):
+    for row in rows:
+        print(delimiter.join(str(value) for value in row), flush=True)
+
+def _json_value(value):
+    # JSON doesn't support infinity and NaN
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    elif isinstance(value, str):
+        return value
+    elif isinstance(value, abc.Mapping):
+        return {str(k):_json_value(v) for k,v in value.items()}
+    elif isinstance(value, (tuple, list)):
+        return [_json_value(v) for v in value]
+    return value
+
+def _json_object(row, colnames):
+    obj = {colname:_json_value(value) for colname,value in zip(colnames, row)}
+    return json.dumps(obj, default=str)
+
+def _csv_value(value):
+    # Numbers are written without unit and nested values (e.g. a torrent's
+    # trackers) are encoded as JSON
+    if isinstance(value, bool):
+        return value
+    elif isinstance(value, int):
+        return int(value)
+    elif isinstance(value, float):
+        return float(value)
+    elif isinstance(value, (abc.Mapping, tuple, list)):
+        return json.dumps(_json_value(value), default=str)
+    return value
+
+def _write_csv(rows, colnames):
+    writer = csv.writer(sys.stdout, lineterminator='\n')
+    writer.writerow(colnames)
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        sys.stdout.flush()
+
+def _write_jsonl(rows, colnames):
+    for row in rows:
+        print(_json_object(row, colnames), flush=True)
+
+def _write_json(rows, colnames):
+    # Write an array with one object per line so it can be consumed by line
+    # or as a whole
+    sep = '\n'
+    sys.stdout.write('[')
+    for row in rows:
+        sys.stdout.write(sep + _json_object(row, colnames))
+        sys.stdout.flush()
+        sep = ',\n'
+    sys.stdout.write('\n]\n')
+    sys.stdout.flush()
+
+STREAM_FORMATS = {
+    'tsv': _write_tsv,
+    'csv': _write_csv,
+    'json': _write_json,
+    'jsonl': _write_jsonl,
+}
+
+def print_rows(rows, colnames, format='tsv', **kwargs):
+    """
+    Print rows for a machine to read
+
+    `rows` is an iterable of sequences of values in the same order as
+    `colnames`.  Each row is printed and flushed as soon as it is available so
+    the output can be consumed while it is produced.
+
+    `format` must be a key of STREAM_FORMATS.  Any other keyword arguments are
+    passed on to the writer (e.g. `delimiter` for 'tsv').
+    """
+    try:
+        write = STREAM_FORMATS[format]
+    except KeyError:
+        raise ValueError('Unsupported format: %r' % (format,))
+    write(rows, colnames, **kwargs)
+
+def print_records(items, order, column_specs, format):
+    """
+    Print the values that columns are made of for a machine to read
+
+    Instead of creating cells, the `needed_keys` of each column in `order` are
+    looked up in each item of `items` and printed with print_rows() as
+    `format`.  Record fields are named after these keys.
+    """
+    keys = tuple(dict.fromkeys(key for colname in order
+                               for key in column_specs[colname].needed_keys))
+    rows = ([item[key] for key in keys] for item in items)
+    print_rows(rows, keys, format=format)
+
+def print_table(items, order, column_specs, format='tsv'):
     """
     Print table from a two-dimensional array of column objects
 
@@ -218,16 +303,29 @@ def print_table(items, order, column_specs):
 
     `order` is a sequence of column IDs.
 
-    `items` is a sequence of arbitrary objects that are used to create cell
+    `items` is an iterable of arbitrary objects that are used to create cell
     objects by passing them to the classes in `column_specs`.
+
+    If stdout is not a TTY, raw values are streamed with print_rows() in
+    `format` while `items` is iterated.
     """
     # Whether to print for a human or for a machine to read our output
     pretty_output = all(x is not None for x in (TERMSIZE.columns, TERMSIZE.lines))
+    if not pretty_output:
+        log.debug('Could not detect TTY size - assuming stdout is no TTY')
+        colspecs = [column_specs[colname] for colname in order]
+        rows = ([colspec(item).get_raw_value() for colspec in colspecs]
+                for item in items)
+        kwargs = {}
+        if format == 'tsv':
+            kwargs['delimiter'] = '\t' if TERMSIZE.columns is None else '│'
+        print_rows(rows, order, format=format, **kwargs)
+        return
 
     table = SimpleNamespace(colspecs=column_specs,
                             colorder=order,
                             colwidths={}, maxcolwidths={},  # Calculated when needed
-                            delimiter='\t' if TERMSIZE.columns is None else '│',
+                            delimiter='│',
                             max_width=TERMSIZE.columns)
 
     # Create two-dimensional list of cells.  Each cell must behave like an
@@ -240,15 +338,11 @@ def print_table(items, order, column_specs):
         table.rows.append(row)
 
     if len(table.rows) > 0:
-        if pretty_output:
-            _fit_table_into_terminal(table)
-            headerstr = '\033[1;4m' + _assemble_headers(table) + '\033[0m'
-        else:
-            log.debug('Could not detect TTY size - assuming stdout is no TTY')
-
+        _fit_table_into_terminal(table)
+        headerstr = '\033[1;4m' + _assemble_headers(table) + '\033[0m'
         for line_index in range(len(table.rows)):
             # Print column headers after every screen full
-            if pretty_output and line_index % (TERMSIZE.lines - 2) == 0:
+            if line_index % (TERMSIZE.lines - 2) == 0:
                 print(headerstr)
-            for row in _assemble_row(table, line_index, pretty=pretty_output):
+            for row in _assemble_row(table, line_index):
                 print(row)
@@ -15,7 +15,7 @@ from ... import objects
 from .. import CmdError
 from ..base import file as base
 from . import _mixin as mixin
-from ._table import TERMSIZE, print_table
+from ._table import TERMSIZE, print_records, print_table
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -26,7 +26,7 @@ class ListFilesCmd(base.ListFilesCmdbase,
                    mixin.only_supported_columns):
     provides = {'cli'}
 
-    async def make_file_list(self, tfilter, ffilter, columns):
+    async def make_file_list(self, tfilter, ffilter, columns, format):
         response = await self.make_request(
             objects.srvapi.torrent.torrents(tfilter, keys=('name', 'files')),
             quiet=True)
@@ -37,15 +37,21 @@ class ListFilesCmd(base.ListFilesCmdbase,
 
         filelist = []
         for torrent in humansorted(torrents, key=lambda t: t['name']):
-            files, filtered_count = self._flatten_tree(torrent['files'], ffilter)
-            filelist.extend(files)
+            if format is not None:
+                filelist.extend(self._list_files(torrent['files'], ffilter))
+            else:
+                files, filtered_count = self._flatten_tree(torrent['files'], ffilter)
+                filelist.extend(files)
 
         if filelist:
             from ...views.file import COLUMNS as FILE_COLUMNS
 
             # Remove columns that aren't supported by CLI interface (e.g. 'marked')
             columns = self.only_supported_columns(columns, FILE_COLUMNS)
-            print_table(filelist, columns, FILE_COLUMNS)
+            if format is not None:
+                print_records(filelist, columns, FILE_COLUMNS, format)
+            else:
+                print_table(filelist, columns, FILE_COLUMNS)
         else:
             if str(tfilter) != 'all':
                 raise CmdError('No matching files in %s torrents: %s' % (tfilter, ffilter))
@@ -88,6 +94,20 @@ class ListFilesCmd(base.ListFilesCmdbase,
 
         return flist, filtered_count
 
+    def _list_files(self, files, ffilter=None):
+        """
+        Yield unmodified TorrentFiles in the same order as `_flatten_tree`
+
+        `files` must be a nested mapping tree (i.e. TorrentFileTree).
+        `ffilter` must be a FileFilter instance or None.
+        """
+        for key,value in humansorted(files.items(), key=lambda pair: pair[0]):
+            if value.nodetype == 'leaf':
+                if ffilter is None or ffilter.match(value):
+                    yield value
+            elif value.nodetype == 'parent':
+                yield from self._list_files(value, ffilter)
+
 
 class PriorityCmd(base.PriorityCmdbase,
                   mixin.make_request, mixin.select_torrents, mixin.select_files):
@@ -15,7 +15,7 @@ from ... import objects
 from .. import CmdError
 from ..base import peer as base
 from . import _mixin as mixin
-from ._table import print_table
+from ._table import print_records, print_table
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -25,7 +25,7 @@ class ListPeersCmd(base.ListPeersCmdbase,
                    mixin.make_request, mixin.select_torrents):
     provides = {'cli'}
 
-    async def make_peer_list(self, tfilter, pfilter, sort, columns):
+    async def make_peer_list(self, tfilter, pfilter, sort, columns, format):
         response = await self.make_request(
             objects.srvapi.torrent.torrents(tfilter, keys=('name', 'peers')),
             quiet=True)
@@ -54,7 +54,10 @@ class ListPeersCmd(base.ListPeersCmdbase,
 
         if peerlist:
             from ...views.peer import COLUMNS as PEER_COLUMNS
-            print_table(peerlist, columns, PEER_COLUMNS)
+            if format is not None:
+                print_records(peerlist, columns, PEER_COLUMNS, format)
+            else:
+                print_table(peerlist, columns, PEER_COLUMNS)
         else:
             def filter_is_relevant(f):
                 return f and str(f) != 'all'
@@ -14,7 +14,7 @@ from ...completion import candidates
 from .. import CmdError
 from ..base import torrent as base
 from . import _mixin as mixin
-from ._table import TERMSIZE, print_table
+from ._table import TERMSIZE, print_records, print_table
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -83,7 +83,7 @@ class ListTorrentsCmd(base.ListTorrentsCmdbase,
                       mixin.only_supported_columns):
     provides = {'cli'}
 
-    async def make_torrent_list(self, tfilter, sort, columns):
+    async def make_torrent_list(self, tfilter, sort, columns, format):
         from ...views.torrent import COLUMNS as TORRENT_COLUMNS
 
         # Remove columns that aren't supported by CLI interface (e.g. 'marked')
@@ -105,7 +105,10 @@ class ListTorrentsCmd(base.ListTorrentsCmdbase,
 
         # Show table of found torrents
         if torrents:
-            print_table(torrents, columns, TORRENT_COLUMNS)
+            if format is not None:
+                print_records(torrents, columns, TORRENT_COLUMNS, format)
+            else:
+                print_table(torrents, columns, TORRENT_COLUMNS)
         else:
             raise CmdError()
 
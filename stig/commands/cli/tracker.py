@@ -15,7 +15,7 @@ from ... import objects
 from .. import CmdError
 from ..base import tracker as base
 from . import _mixin as mixin
-from ._table import print_table
+from ._table import print_records, print_table
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -25,7 +25,7 @@ class ListTrackersCmd(base.ListTrackersCmdbase,
                       mixin.make_request, mixin.select_torrents):
     provides = {'cli'}
 
-    async def make_tracker_list(self, torfilter, trkfilter, sort, columns):
+    async def make_tracker_list(self, torfilter, trkfilter, sort, columns, format):
         response = await self.make_request(
             objects.srvapi.torrent.torrents(torfilter, keys=('name', 'trackers')),
             quiet=True)
@@ -49,7 +49,10 @@ class ListTrackersCmd(base.ListTrackersCmdbase,
 
         if trklist:
             from ...views.tracker import COLUMNS as TRACKER_COLUMNS
-            print_table(trklist, columns, TRACKER_COLUMNS)
+            if format is not None:
+                print_records(trklist, columns, TRACKER_COLUMNS, format)
+            else:
+                print_table(trklist, columns, TRACKER_COLUMNS)
         else:
             def filter_is_relevant(f):
                 return f and str(f) != 'all'
@@ -19,7 +19,7 @@ class ListPeersCmd(base.ListPeersCmdbase,
                    mixin.create_list_widget):
     provides = {'tui'}
 
-    def make_peer_list(self, tfilter, pfilter, sort, columns):
+    def make_peer_list(self, tfilter, pfilter, sort, columns, format):
         from ...tui.views import PeerListWidget
         self.create_list_widget(PeerListWidget, theme_name='peerlist',
                                 tfilter=tfilter, pfilter=pfilter,
@@ -80,7 +80,7 @@ class ListTorrentsCmd(base.ListTorrentsCmdbase,
                       mixin.create_list_widget):
     provides = {'tui'}
 
-    def make_torrent_list(self, tfilter, sort, columns):
+    def make_torrent_list(self, tfilter, sort, columns, format):
         from ...tui.views import TorrentListWidget
         self.create_list_widget(TorrentListWidget, theme_name='torrentlist',
                                 tfilter=tfilter, sort=sort, columns=columns,
@@ -220,6 +220,30 @@ def init_defaults(localcfg):
                  Float.partial(min=0.1),
                  default=5,
                  description='Interval in seconds between TUI updates')
+    localcfg.add('tui.poll.incremental',
+                 Bool.partial(),
+                 default=False,
+                 description=('Whether to request only recently active torrents '
+                              'for TUI updates'))
+    localcfg.add('tui.poll.resync',
+                 Float.partial(min=0),
+                 default=60,
+                 description=('Interval in seconds between requests for all torrents '
+                              "if 'tui.poll.incremental' is enabled"))
+    localcfg.add('tui.poll.slow',
+                 Float.partial(min=0),
+                 default=0,
+                 description=('Interval in seconds between requests for values that rarely '
+                              'change (e.g. name, size or trackers) for TUI updates; '
+                              "0 requests them every 'tui.poll' seconds"))
+    localcfg.add('tui.poll.max',
+                 Float.partial(min=0),
+                 default=0,
+                 description=('Maximum interval in seconds between TUI updates; '
+                              "polling slows down from 'tui.poll' to this interval "
+                              'while nothing changes and for tabs that are not '
+                              'focused, and speeds up again on any key press; '
+                              "0 always polls every 'tui.poll' seconds"))
     localcfg.add('tui.theme',
                  Path.partial(base=os.path.dirname(DEFAULT_RCFILE)),
                  default=DEFAULT_THEME_FILE,
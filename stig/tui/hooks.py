@@ -66,6 +66,39 @@ def _set_poll_interval(settings, name, value):
     srvapi.interval = value
 localcfg.on_change(_set_poll_interval, name='tui.poll')
 
+def _set_poll_incremental(settings, name, value):
+    srvapi.treqpool.incremental = value
+localcfg.on_change(_set_poll_incremental, name='tui.poll.incremental')
+
+def _set_poll_resync(settings, name, value):
+    srvapi.torrent.resync_interval = value
+localcfg.on_change(_set_poll_resync, name='tui.poll.resync')
+
+def _set_poll_slow(settings, name, value):
+    srvapi.torrent.slow_fields_interval = value
+    srvapi.treqpool.split_fields = value > 0
+localcfg.on_change(_set_poll_slow, name='tui.poll.slow')
+
+def _set_poll_max(settings, name, value):
+    srvapi.max_interval = value
+localcfg.on_change(_set_poll_max, name='tui.poll.max')
+
+def _set_background_pollers(tabs, focus):
+    # Pollers of widgets in unfocused tabs are polled less often
+    for widget in tabs.contents:
+        background = widget is not focus
+        if isinstance(widget, TorrentListWidget):
+            srvapi.treqpool.set_background(widget.id, background)
+        else:
+            poller = getattr(widget, 'poller', None)
+            if poller is not None:
+                poller.background = background
+tuiobjects.tabs.on_focus_change(_set_background_pollers)
+
+def _set_background_pollers_of_new_tabs(tabs):
+    _set_background_pollers(tabs, focus=tabs.focus)
+tuiobjects.tabs.on_contents_change(_set_background_pollers_of_new_tabs)
+
 
 def _set_cli_history_dir(settings, name, value):
     tuiobjects.cli.original_widget.history_file = os.path.join(value.full_path, 'commands')
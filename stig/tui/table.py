@@ -37,12 +37,18 @@ class Table():
         self._members = {}
         self.columns = columns
 
-    def register(self, member_id):
+    def register(self, member_id, row=None):
         """Add a new row
 
         Create a new Group(cls=Columns) object and fill it with enabled column
         cells which can then be retrieved with `get_row(member_id)`.
+
+        If `row` is given, it is used instead of a new Group object.  It must
+        have been created by a Table with the same columns.
         """
+        if row is not None:
+            self._members[member_id] = row
+            return
         member = Group(cls=urwid.Columns, dividechars=1)
         for colname in self._enabled_columns:
             cellcls = self._colspecs[colname]
@@ -52,6 +58,10 @@ class Table():
             member.add(colname, cellwidget, options=cellcls.width, removable=True)
         self._members[member_id] = member
 
+    def unregister(self, member_id):
+        """Remove row created by register() and return it or None if it doesn't exist"""
+        return self._members.pop(member_id, None)
+
     def get_row(self, member_id):
         """Return a row, i.e. a Group(cls=Columns) object created by register()"""
         return self._members[member_id]
@@ -11,6 +11,7 @@
 
 from collections import abc, defaultdict
 
+import blinker
 import urwid
 
 from ..utils.string import strwidth
@@ -102,6 +103,8 @@ class Tabs(urwid.Widget):
         self._info = defaultdict(lambda: {})
         self._contents = urwid.MonitoredFocusList()
         self._contents.set_focus_changed_callback(self._focus_changed_callback)
+        self._on_focus_change = blinker.Signal()
+        self._on_contents_change = blinker.Signal()
         for content in contents:
             if not isinstance(content, abc.Mapping):
                 content = dict(zip(('title', 'widget', 'position', 'focus'),
@@ -250,6 +253,7 @@ class Tabs(urwid.Widget):
         self._contents.insert(newpos, widget)
         if focus:
             self.focus_position = newpos
+        self._on_contents_change.send(self)
         return this_id
 
     def move(self, position=None, destination='right', wrap=False):
@@ -376,6 +380,7 @@ class Tabs(urwid.Widget):
         i = self.get_index(position)
         if i is not None:
             self._contents[i] = widget
+            self._on_contents_change.send(self)
         else:
             raise RuntimeError('Tabs is empty')
 
@@ -413,6 +418,27 @@ class Tabs(urwid.Widget):
         self._focus_history.append(tab_id)
         while len(self._focus_history) > self._max_focus_history_size:
             self._focus_history.pop(0)
+        # This is called before the focus is changed
+        self._on_focus_change.send(self, focus=self._contents[pos])
+
+    def on_focus_change(self, callback, autoremove=True):
+        """
+        Register `callback` to be called when a different tab is focused
+
+        `callback` gets the instance of this class and the newly focused
+        content widget as the keyword argument `focus`.
+        """
+        self._on_focus_change.connect(callback, weak=autoremove)
+
+    def on_contents_change(self, callback, autoremove=True):
+        """
+        Register `callback` to be called when a tab is inserted or its content
+        is replaced
+
+        `callback` gets the instance of this class.  It is called after the new
+        tab is focused (if it is focused).
+        """
+        self._on_contents_change.connect(callback, weak=autoremove)
 
     @property
     def focus(self):
@@ -14,6 +14,7 @@ Application-wide instances for the TUI
 """
 
 import asyncio
+import time
 
 import urwid
 
@@ -124,9 +125,22 @@ def unhandled_input(key):
     if key is not None:
         log.debug('Unhandled key: %s', key)
 
+_last_interval_reset = 0
+
+def input_filter(keys, raw):
+    # User is looking - stop polling slowly.  Pollers can only slow down after
+    # polling, so there's no need to do this more than once per interval.
+    global _last_interval_reset
+    now = time.monotonic()
+    if now - _last_interval_reset >= objects.srvapi.interval:
+        _last_interval_reset = now
+        objects.srvapi.reset_intervals()
+    return keys
+
 urwidscreen = urwid.raw_display.Screen()
 urwidloop = urwid.MainLoop(widgets,
                            screen=urwidscreen,
                            event_loop=urwid.AsyncioEventLoop(loop=asyncio.get_event_loop()),
                            unhandled_input=unhandled_input,
+                           input_filter=input_filter,
                            handle_mouse=False)
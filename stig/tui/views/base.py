@@ -9,7 +9,11 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
+import bisect
 import collections
+import functools
+import itertools
+import weakref
 
 import urwid
 
@@ -109,7 +113,17 @@ class CellWidgetBase(urwid.WidgetWrap):
 
 
 class ItemWidgetBase(urwid.WidgetWrap):
-    """Base class for items in Torrent/File/Peer/... lists"""
+    """
+    Base class for items in Torrent/File/Peer/... lists
+
+    `cells` is a Group instance that combines widgets horizontally or a callable
+    that returns one.  If it is a callable, it is called when the item is
+    displayed for the first time.  Until then, no widgets exist.  Such items
+    must always be one row high.
+
+    update() only stores the new data.  Cells are updated when the item is
+    rendered, so items that are not visible don't format any values.
+    """
 
     # Derived classes must set these class attributes; lists with unfocusable
     # items (e.g. peer lists) don't have to set palette_focused and
@@ -120,7 +134,18 @@ class ItemWidgetBase(urwid.WidgetWrap):
 
     def __init__(self, data, cells):
         self._data = data    # Info of torrent/tracker/file/peer/... as mapping
-        self._cells = cells  # Group instance that combines widgets horizontally
+        self._is_marked = False
+        self._is_stale = False  # Whether cells display outdated data
+        self._item_widget = None
+        self._is_one_row = callable(cells)
+        if self._is_one_row:
+            self._create_cells = cells
+        else:
+            self._create_cells = None
+            self._build(cells)
+
+    def _build(self, cells):
+        self.__cells = cells
 
         # Create focusable or unfocusable item widget
         if self.columns_focus_map is not NotImplemented:
@@ -130,16 +155,75 @@ class ItemWidgetBase(urwid.WidgetWrap):
             )
         else:
             item_widget = urwid.AttrMap(cells, self.palette_unfocused)
-        urwid.WidgetWrap.__init__(self, item_widget)
+        self._item_widget = item_widget
 
         # Initialize cell widgets
-        self.update(data)
+        self._update_cells()
+        if cells.exists('marked'):
+            cells.marked.is_marked = self._is_marked
 
-    def update(self, data):
-        for widget in self._cells.widgets:
+    # urwid.WidgetWrap delegates rendering, key presses, etc to this attribute
+    @property
+    def _wrapped_widget(self):
+        if self._item_widget is None:
+            self._build(self._create_cells())
+            self._create_cells = None
+        return self._item_widget
+
+    @_wrapped_widget.setter
+    def _wrapped_widget(self, widget):
+        self._item_widget = widget
+
+    @property
+    def _cells(self):
+        self._wrapped_widget  # Create widgets if necessary
+        if self._is_stale:
+            self._update_cells()
+        return self.__cells
+
+    def _update_cells(self):
+        data = self._data
+        for widget in self.__cells.widgets:
             if hasattr(widget, 'update'):
                 widget.update(data)
+        self._is_stale = False
+
+    def rows(self, size, focus=False):
+        # Don't create widgets or update cells just to count rows (e.g. for the
+        # scrollbar)
+        if self._is_one_row:
+            return 1
+        if self._is_stale:
+            self._update_cells()
+        return self._item_widget.rows(size, focus)
+
+    def render(self, size, focus=False):
+        widget = self._wrapped_widget
+        if self._is_stale:
+            self._update_cells()
+        return widget.render(size, focus)
+
+    @property
+    def is_built(self):
+        """Whether the widgets that display this item exist"""
+        return self._item_widget is not None
+
+    def update(self, data):
         self._data = data
+        if self._item_widget is not None:
+            self._is_stale = True
+            self._invalidate()
+
+    def recycle(self, data):
+        """
+        Display `data`, which belongs to a different item, and return cells
+
+        The item is unmarked.  Only items that have been displayed can be
+        recycled.
+        """
+        self.is_marked = False
+        self.update(data)
+        return self.__cells
 
     @property
     def id(self):
@@ -154,20 +238,99 @@ class ItemWidgetBase(urwid.WidgetWrap):
     @property
     def is_marked(self):
         """Whether this item has been marked by the user"""
-        if self._cells.exists('marked'):
-            return self._cells.marked.is_marked
-        else:
-            return False
+        # Items without a "marked" column can be marked too, and unbuilt items
+        # don't have any cells
+        return self._is_marked
 
     @is_marked.setter
     def is_marked(self, is_marked):
-        if self._cells.exists('marked'):
-            self._cells.marked.is_marked = bool(is_marked)
+        self._is_marked = bool(is_marked)
+        if self._item_widget is not None and self.__cells.exists('marked'):
+            self.__cells.marked.is_marked = self._is_marked
+
+
+class ItemWidgetPool():
+    """
+    Item widgets that are no longer listed and can be reused
+
+    Widgets are stored per item widget class and column layout so any list of
+    the same type that displays the same columns can reuse them.
+    """
+
+    def __init__(self, maxsize=1000):
+        self._maxsize = maxsize
+        self._widgets = collections.defaultdict(list)
+
+    def put(self, item_class, columns, widget):
+        """Store `widget` unless `maxsize` widgets with the same class and columns are stored"""
+        widgets = self._widgets[(item_class, columns)]
+        if len(widgets) < self._maxsize:
+            widgets.append(widget)
+
+    def get(self, item_class, columns):
+        """Remove and return stored widget or None if there is none"""
+        widgets = self._widgets.get((item_class, columns))
+        if widgets:
+            return widgets.pop()
+
+    def __len__(self):
+        return sum(len(widgets) for widgets in self._widgets.values())
+
+
+def _create_row(table, data_id):
+    table.register(data_id)
+    return table.get_row(data_id)
+
+
+def _release_item_widgets(widgets, table, item_class, pool):
+    # Remove rows from `table` and give displayed widgets to `pool` if it is not
+    # None.  This is also called when a list is garbage collected, so it must
+    # not reference the list.
+    columns = table.columns
+    for w in widgets:
+        row = table.unregister(w.id)
+        if pool is not None and row is not None and w.is_built:
+            pool.put(item_class, columns, w)
+
+
+def _sort_values(data, needed_keys):
+    # Return values of `data` that its sort key is computed from or None if they
+    # are not available
+    try:
+        return tuple(data[key] for key in needed_keys)
+    except KeyError:
+        return None
+
+
+def _same_sort_values(values, data, needed_keys):
+    # Whether `data` still has the same `values` (see _sort_values()).  Values
+    # are compared by identity because data objects (e.g. Torrent) return the
+    # same object until it changes and `==` is slow or inconsistent for some
+    # values.
+    if values is None:
+        return False
+    new_values = _sort_values(data, needed_keys)
+    if new_values is None or len(new_values) != len(values):
+        return False
+    for old, new in zip(values, new_values):
+        if old is not new:
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _keymapped_item_class(keymap, item_class, context):
+    # Lists of the same type share item widget classes so they can share
+    # recycled item widgets
+    return keymap.wrap(item_class, context=context)
 
 
 class ListWidgetBase(urwid.WidgetWrap):
     """Base class for Torrent/File/Peer/... lists"""
 
+    # Recycled item widgets of all lists
+    widget_pool = ItemWidgetPool()
+
     # Derived classes must set these class attributes
     tuicolumns      = NotImplemented
     ListItemClass   = NotImplemented
@@ -180,18 +343,35 @@ class ListWidgetBase(urwid.WidgetWrap):
         self._keymap = keymap
 
         if self.focusable_items:
-            self._ListItemClass = keymap.wrap(self.ListItemClass, context=self.keymap_context)
+            self._ListItemClass = _keymapped_item_class(keymap, self.ListItemClass,
+                                                        self.keymap_context)
         else:
             self._ListItemClass = self.ListItemClass
 
         self._data_dict = None
         self._marked = set()
+        self._poller = None
 
         self._existing_widgets = set()
-        self._hidden_widgets = set()
+        self._visible_widgets = set()     # Existing widgets in the list walker
+        self._hidden_widgets = set()      # Existing widgets that are filtered out
+
+        # Item widgets are created when they are displayed for the first time,
+        # but only if they are guaranteed to be one row high
+        self._lazy_items = all(getattr(cellcls, 'wrap', 'clip') == 'clip'
+                               for cellcls in self.tuicolumns.values())
+
+        # Items of lazy lists are plain rows of cells and can be reused by
+        # other lists
+        self._widget_pool = self.widget_pool if self._lazy_items else None
 
         self._sort = sort
         self._sort_orig = sort
+        self._sorted_by = None            # Sorter that created self._sort_keys
+        self._sort_keys = {}              # Map positioned item widgets to (sort key, number)
+        self._sort_values = {}            # Map positioned item widgets to values of sort.needed_keys
+        self._sort_counter = itertools.count()
+        self._unsorted_widgets = set()    # Item widgets that may be in the wrong position
 
         self._title_name = title
         self.title_updater = None
@@ -199,6 +379,12 @@ class ListWidgetBase(urwid.WidgetWrap):
         self._table = Table(**self.tuicolumns)
         self._table.columns = columns or ()
 
+        # Recycle item widgets when this list is garbage collected (e.g. because
+        # its tab was closed)
+        finalizer = weakref.finalize(self, _release_item_widgets, self._existing_widgets,
+                                     self._table, self._ListItemClass, self._widget_pool)
+        finalizer.atexit = False
+
         if self.focusable_items:
             walker = urwid.SimpleFocusListWalker([])
         else:
@@ -255,41 +441,75 @@ class ListWidgetBase(urwid.WidgetWrap):
         existing_widgets = self._existing_widgets
         dead_widgets = []
 
+        # Only widgets that got new values for the keys the sort order depends
+        # on can be in the wrong position.  If we don't know those keys, any
+        # widget can be.
+        needed_keys = getattr(self._sort, 'needed_keys', None)
+        if needed_keys is None:
+            self._unsorted_widgets.update(existing_widgets)
+        unsorted_widgets = self._unsorted_widgets
+        sort_values = self._sort_values
+
         for w in existing_widgets:  # w = *ItemWidget instance
             id = w.id
             try:
-                # Update existing *ItemWidget instances with new data
-                w.update(data_dict[id])
-                del data_dict[id]
+                data = data_dict.pop(id)
             except KeyError:
                 # Item no longer exists in data_dict anymore
                 dead_widgets.append(w)
+            else:
+                # Update existing *ItemWidget instances with new data
+                w.update(data)
+                if needed_keys is not None and \
+                   not _same_sort_values(sort_values.get(w), data, needed_keys):
+                    unsorted_widgets.add(w)
 
         # Remove dead *ItemWidget instances
-        walker = self._listbox.body
-        marked = self._marked
-        for w in dead_widgets:
-            if w in walker:
-                walker.remove(w)
-            existing_widgets.remove(w)
-            marked.discard(w)  # self._marked may have a reference too
-
-        # Any items that haven't been used to update an existing *ItemWidget instance are new
+        if dead_widgets:
+            dead_widgets = set(dead_widgets)
+            visible_widgets = self._visible_widgets
+            if not dead_widgets.isdisjoint(visible_widgets):
+                walker = self._listbox.body
+                walker[:] = [w for w in walker if w not in dead_widgets]
+                visible_widgets.difference_update(dead_widgets)
+            existing_widgets.difference_update(dead_widgets)
+            _release_item_widgets(dead_widgets, self._table, self._ListItemClass, self._widget_pool)
+            self._hidden_widgets.difference_update(dead_widgets)
+            self._marked.difference_update(dead_widgets)  # self._marked may have a reference too
+            self._unsorted_widgets.difference_update(dead_widgets)
+            sort_keys = self._sort_keys
+            sort_values = self._sort_values
+            for w in dead_widgets:
+                sort_keys.pop(w, None)
+                sort_values.pop(w, None)
+
+        # Any items that haven't been used to update an existing *ItemWidget
+        # instance are new; reuse recycled widgets if possible
         if data_dict:
-            table = self._table
             ListItemClass = self._ListItemClass
+            table = self._table
+            lazy = self._lazy_items
+            pool = self._widget_pool
+            columns = table.columns
             for data_id,data in data_dict.items():
-                table.register(data_id)
-                row = table.get_row(data_id)
-                existing_widgets.add(ListItemClass(data, row))
+                if not lazy:
+                    w = ListItemClass(data, _create_row(table, data_id))
+                else:
+                    w = pool.get(ListItemClass, columns)
+                    if w is None:
+                        w = ListItemClass(data, functools.partial(_create_row, table, data_id))
+                    else:
+                        table.register(data_id, row=w.recycle(data))
+                existing_widgets.add(w)
 
     def _sort_widgets(self):
-        walker = self._listbox.body
-        if self._sort is not None:
+        sort = self._sort
+        if sort is not None:
             try:
-                self._sort.apply(walker,
-                                 item_getter=lambda w: w.data,
-                                 inplace=True)
+                if sort is self._sorted_by:
+                    self._reposition_unsorted_widgets(sort)
+                else:
+                    self._sort_all_widgets(sort)
             except KeyError:
                 # This happens when adding a new sort order that needs
                 # previously unneeded keys (e.g. "started" needs "time-started",
@@ -302,18 +522,99 @@ class ListWidgetBase(urwid.WidgetWrap):
                 # through, a new redraw is issued and the new sort exists.
                 pass
 
-    def _hide_or_unhide_widgets(self):
+    def _sort_all_widgets(self, sort):
+        walker = self._listbox.body
+        keys = sort.keys([w.data for w in walker])
+        order = sorted(range(len(walker)), key=keys.__getitem__)
+
+        sort_keys = self._sort_keys
+        sort_keys.clear()
+        counter = self._sort_counter
+        for i in order:
+            sort_keys[walker[i]] = (keys[i], next(counter))
+        self._remember_sort_values(walker)
+        if order != list(range(len(walker))):
+            walker[:] = [walker[i] for i in order]
+
+        self._sorted_by = sort
+        self._unsorted_widgets.clear()
+
+    def _remember_sort_values(self, widgets):
+        # Remember what the sort keys of `widgets` were computed from so we can
+        # tell if they change
+        needed_keys = getattr(self._sort, 'needed_keys', None)
+        if needed_keys is not None:
+            sort_values = self._sort_values
+            for w in widgets:
+                sort_values[w] = _sort_values(w.data, needed_keys)
+
+    def _reposition_unsorted_widgets(self, sort):
+        # Only widgets that were added or got new data can be in the wrong
+        # position.  Move those that have a different sort key now and keep
+        # everything else in place so the walker is modified as little as
+        # possible.
+        unsorted = self._unsorted_widgets
+        if not unsorted:
+            return
         walker = self._listbox.body
+        indexes = [i for i,w in enumerate(walker) if w in unsorted]
+        keys = sort.keys([walker[i].data for i in indexes])
+        self._remember_sort_values(walker[i] for i in indexes)
+        unsorted.clear()
+
+        sort_keys = self._sort_keys
+        counter = self._sort_counter
+        moved = []  # Indexes of widgets with new sort keys
+        for i,key in zip(indexes, keys):
+            w = walker[i]
+            entry = sort_keys.get(w)
+            if entry is None or entry[0] != key:
+                sort_keys[w] = (key, next(counter))
+                moved.append(i)
+        if not moved:
+            return
+        widgets = [walker[i] for i in moved]
+
+        if len(moved) > len(walker) // 8:
+            # Replacing all items at once is cheaper than many single moves
+            walker[:] = sorted(walker, key=sort_keys.__getitem__)
+        else:
+            for i in reversed(moved):
+                del walker[i]
+            entries = [sort_keys[w] for w in walker]
+            for w in sorted(widgets, key=sort_keys.__getitem__):
+                entry = sort_keys[w]
+                i = bisect.bisect_right(entries, entry)
+                entries.insert(i, entry)
+                walker.insert(i, w)
+
+    def _hide_or_unhide_widgets(self):
         existing_widgets = self._existing_widgets
-        hidden_ids = tuple(w.id for w in self._limit_items(existing_widgets))
-        for w in existing_widgets:
-            widget_is_visible = w in walker
-            hide_widget = w.id in hidden_ids
-            if hide_widget and widget_is_visible:
-                walker.remove(w)
-                self._hidden_widgets.add(w)
-            elif not hide_widget and not widget_is_visible:
-                walker.append(w)
+        visible_widgets = self._visible_widgets
+        hidden_widgets = set(self._limit_items(existing_widgets))
+        self._hidden_widgets = hidden_widgets
+
+        hide = visible_widgets.intersection(hidden_widgets)
+        unhide = existing_widgets.difference(hidden_widgets, visible_widgets)
+        if hide or unhide:
+            # Change the walker only once because each change is O(n)
+            walker = self._listbox.body
+            if hide:
+                visible_widgets.difference_update(hide)
+                sort_keys = self._sort_keys
+                sort_values = self._sort_values
+                for w in hide:
+                    sort_keys.pop(w, None)
+                    sort_values.pop(w, None)
+                walker[:] = [w for w in walker if w not in hide] + list(unhide)
+            else:
+                was_empty = len(walker) == 0
+                walker.extend(unhide)
+                if was_empty:
+                    # Extending an empty walker focuses the last item
+                    walker.set_focus(0)
+            visible_widgets.update(unhide)
+            self._unsorted_widgets.update(unhide)
 
         if self.title_updater is not None:
             self.title_updater(self.title, ' [%d]' % self.count)
@@ -324,10 +625,18 @@ class ListWidgetBase(urwid.WidgetWrap):
 
     def clear(self):
         """Remove all list items"""
+        _release_item_widgets(self._existing_widgets, self._table,
+                              self._ListItemClass, self._widget_pool)
         self._table.clear()
         self._listbox.body[:] = ()
         self._listbox._invalidate()
         self._marked.clear()
+        self._existing_widgets.clear()
+        self._visible_widgets.clear()
+        self._hidden_widgets.clear()
+        self._unsorted_widgets.clear()
+        self._sort_keys.clear()
+        self._sort_values.clear()
 
     def refresh(self):
         """Update list items"""
@@ -354,6 +663,11 @@ class ListWidgetBase(urwid.WidgetWrap):
         else:
             self._sort = sort
 
+    @property
+    def poller(self):
+        """Poller that provides the list items or None"""
+        return self._poller
+
     @property
     def count(self):
         """Number of listed items"""
@@ -122,6 +122,11 @@ class TorrentDetailsWidget(urwid.WidgetWrap):
         else:
             return 'No title'
 
+    @property
+    def poller(self):
+        """Poller that provides the torrent"""
+        return self._poller
+
     @property
     def focused_torrent_id(self):
         return self._torrent['id'] if 'id' in self._torrent else None
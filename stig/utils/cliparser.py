@@ -177,6 +177,35 @@ def _on_any_substr(string, pos, substrs):
     return False, '', None, None
 
 
+_NOT_ON_SUBSTR = (False, '', None, None)
+
+def _make_substr_finder(substrs):
+    """
+    Return function that takes `string` and `pos` and returns the same as
+    `_on_any_substr(string, pos, substrs)`
+
+    `string[pos]` must be part of any substring that is found, so
+    `_on_any_substr` is only called for characters that exist in `substrs`.
+    If `substrs` only contains single characters, it is never called.
+    """
+    chars = frozenset(''.join(substrs))
+    if all(len(substr) == 1 for substr in substrs):
+        def find(string, pos):
+            if pos < len(string):
+                char = string[pos]
+                if char in chars:
+                    return True, char, pos, 0
+            return _NOT_ON_SUBSTR
+    else:
+        substrs = sorted(substrs, key=len, reverse=True)
+
+        def find(string, pos):
+            if pos < len(string) and string[pos] in chars:
+                return _on_any_substr(string, pos, substrs)
+            return _NOT_ON_SUBSTR
+    return find
+
+
 def _parse(string, delims=DEFAULT_DELIMS, escapes=DEFAULT_ESCAPES, quotes=DEFAULT_QUOTES):
     """
     Yield `Char` instances
@@ -196,19 +225,22 @@ def _parse(string, delims=DEFAULT_DELIMS, escapes=DEFAULT_ESCAPES, quotes=DEFAUL
            be escaped so the closing quote can do its job.
     """
     # log.debug('Parsing %r', string)
+    find_delim = _make_substr_finder(delims)
+    find_quote = _make_substr_finder(quotes)
+    find_escape = _make_substr_finder(escapes)
     state = {'escape': '', 'quote': '', 'closing_quote_end_index': -1}
     for i,char in enumerate(string):
         # log.debug('<%s>', string[:i] + '[' + string[i] + ']' + string[i+1:])
-        is_delim, delim, delim_index, delim_offset = _on_any_substr(string, i, delims)
+        is_delim, delim, delim_index, delim_offset = find_delim(string, i)
         # if is_delim: log.debug('    Delimiter at %r: %r', delim_index, delim)
-        is_quote, quote, quote_index, quote_offset = _on_any_substr(string, i, quotes)
+        is_quote, quote, quote_index, quote_offset = find_quote(string, i)
         # if is_quote: log.debug('    Quote at %r: %r', quote_index, quote)
-        is_escape, escape, escape_index, escape_offset = _on_any_substr(string, i, escapes)
+        is_escape, escape, escape_index, escape_offset = find_escape(string, i)
         # if is_escape: log.debug('    Escape at %r: %r', escape_index, escape)
 
         if not state['escape']:
-            next_is_quote, next_quote, next_quote_index, next_quote_offset = _on_any_substr(string, i + 1, quotes)
-            next_is_escape, next_escape, next_escape_index, next_escape_offset = _on_any_substr(string, i + 1, escapes)
+            next_is_quote, next_quote, next_quote_index, next_quote_offset = find_quote(string, i + 1)
+            next_is_escape, next_escape, next_escape_index, next_escape_offset = find_escape(string, i + 1)
 
             # Backslash is plain text between quotes except when it escapes the
             # enclosing quote (e.g. "foo \" bar" -> [foo " bar])
@@ -220,7 +252,7 @@ def _parse(string, delims=DEFAULT_DELIMS, escapes=DEFAULT_ESCAPES, quotes=DEFAUL
                 # escape string (escape characters are not marked as escaped)
                 if i >= escape_index + len(escape) - 1:
                     # Only mark escape characters that nned it
-                    next_is_delim, _, _, _ = _on_any_substr(string, i + 1, delims)
+                    next_is_delim, _, _, _ = find_delim(string, i + 1)
                     if next_is_delim or next_is_quote or next_is_escape:
                         # log.debug('    Enabling escape state')
                         state['escape'] = escape
@@ -427,63 +459,93 @@ def tokenize(cmdline, maxdelims=None, delims=DEFAULT_DELIMS, escapes=DEFAULT_ESC
 
     Delimiters are included as separate tokens.
     """
+    # This does the same as iterating over `_parse(cmdline, ...)` without
+    # creating Char instances.  Only delimiters that are not escaped or quoted
+    # split `cmdline`.
+    find_delim = _make_substr_finder(delims)
+    find_quote = _make_substr_finder(quotes)
+    find_escape = _make_substr_finder(escapes)
+    maxdelims = float('inf') if maxdelims is None else maxdelims
+
     tokens = []
     token = []
-    chars = tuple(_parse(cmdline, delims=delims, escapes=escapes, quotes=quotes))
-    maxdelims = float('inf') if maxdelims is None else maxdelims
+    escape_state = quote_state = ''
+    closing_quote_end_index = -1
+    prev_is_delim = False
+    for i,char in enumerate(cmdline):
+        is_delim, delim, delim_index, delim_offset = find_delim(cmdline, i)
+        is_quote, quote, quote_index, quote_offset = find_quote(cmdline, i)
+        is_escape, escape, escape_index, escape_offset = find_escape(cmdline, i)
+
+        # Whether this character is part of a delimiter that is not escaped
+        # or quoted
+        char_is_delim = False
+        if not escape_state and (is_escape or is_quote):
+            next_is_quote, next_quote, _, _ = find_quote(cmdline, i + 1)
+            next_is_escape = find_escape(cmdline, i + 1)[0]
+        else:
+            next_is_quote = next_is_escape = False
+            next_quote = ''
 
-    def get_token_and_delim_from_end(token_and_delim, delim):
-        len_delim = len(delim)
-        token = ''.join(token_and_delim[:-len_delim])
-        delim = ''.join(token_and_delim[-len_delim:])
-        return token, delim
+        if not escape_state and is_escape and \
+           (not quote_state or next_quote == quote_state or next_is_escape):
+            # Backslash is plain text between quotes except when it escapes the
+            # enclosing quote (e.g. "foo \" bar" -> [foo " bar])
+            if i >= escape_index + len(escape) - 1:
+                if find_delim(cmdline, i + 1)[0] or next_is_quote or next_is_escape:
+                    escape_state = escape
 
-    # log.debug('Tokenizing: %r', cmdline)
-    for i,char in enumerate(chars):
-        # log.debug('Char: %r', char)
+        elif not escape_state and is_quote and quote_state == quote:
+            # Closing quote; the next character might still be part of it
+            quote_state = ''
+            closing_quote_end_index = i + len(quote) - 1
 
-        curdelims = int(len(tokens) / 2)
-        if char.is_delim and char.is_special and curdelims < maxdelims:
-            # Character is part of a delimiter string that is not escaped or quoted
-            prev_char = chars[i - 1] if i > 0 else Char('')
+        elif not escape_state and is_quote and not quote_state:
+            # Opening quote
+            if i >= quote_index + len(quote) - 1 and i > closing_quote_end_index:
+                quote_state = quote
 
-            if not prev_char.is_delim or not prev_char.is_special:
+        else:
+            if is_delim:
+                special_string, special_string_offset = delim, delim_offset
+            elif is_escape:
+                special_string, special_string_offset = escape, escape_offset
+            elif is_quote:
+                special_string, special_string_offset = quote, quote_offset
+            else:
+                special_string, special_string_offset = '', 0
+
+            char_is_delim = is_delim and not escape_state and not quote_state
+
+            if escape_state and special_string and special_string_offset >= len(special_string) - 1:
+                # Keep the escape state alive until all characters of a
+                # multichar special string are processed
+                escape_state = ''
+
+        if char_is_delim and len(tokens) // 2 < maxdelims:
+            if not prev_is_delim:
                 # This is the first character of a delimiter.  Append the
                 # current (non-delimiter) token first before starting a new
                 # delimiter token with this character.
-                # log.debug('  Delimiter starts at %r: %r: %r', i, char, cmdline[i:])
                 if token:
                     tokens.append(''.join(token))
-                    # log.debug('    Added %r: %r', tokens[-1], tokens)
-                token.clear()
-                token[:] = char
+                token = [char]
             else:
                 # This is not the first character of a delimiter, i.e. the
                 # current token is a multi-character delimiter.
-                # log.debug('  Delimiter already started: %r (prev.is_delim=%r, prev.is_special=%r)',
-                #           prev_char.delim, prev_char.is_delim, prev_char.is_special)
                 token.append(char)
 
-            if ''.join(token) == char.delim:
+            if ''.join(token) == delim:
                 # This is the last character of a delimiter.  Append the current
                 # token (a delimiter) before starting a new empty token.
-                # log.debug('  Delimiter ends at %r: %r: %r', i, char, cmdline[i:])
-                if token:
-                    tokens.append(''.join(token))
-                    # log.debug('    Added %r: %r', tokens[-1], tokens)
-                    token.clear()
-
-            # log.debug('    New token: %r', ''.join(token))
-            continue
-
-        token.append(char)
-        # log.debug('New token: %r', ''.join(token))
+                tokens.append(''.join(token))
+                token = []
+        else:
+            token.append(char)
+        prev_is_delim = char_is_delim
 
     if token or not tokens:
         tokens.append(''.join(token))
-        # log.debug('Added last token: %r', tokens[-1])
-
-    # log.debug('Tokenized: %r', tokens)
     return tokens
 
 
@@ -0,0 +1,179 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+JSON encoding and decoding with the fastest available library
+
+orjson and ujson are used if they are installed, otherwise the standard
+library's json module is used.
+"""
+
+import importlib
+import json
+import re
+
+from ..logging import make_logger  # isort:skip
+log = make_logger(__name__)
+
+
+# Supported libraries in order of preference
+BACKENDS = ('orjson', 'ujson', 'json')
+
+_backend = None
+_dumps = None
+_loads = None
+
+
+def use(*names):
+    """
+    Use the first importable library in `names` for `dumps` and `loads`
+
+    Return the name of the library.
+
+    Raise ValueError if `names` contains unsupported names or if none of them
+    can be imported.
+    """
+    global _backend, _dumps, _loads
+    for name in names:
+        if name not in BACKENDS:
+            raise ValueError('Unsupported JSON library: %r' % (name,))
+    for name in names:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            log.debug('JSON library is not available: %s', name)
+        else:
+            _backend, _dumps, _loads = name, module.dumps, module.loads
+            log.debug('Using JSON library: %s', name)
+            return name
+    raise ValueError('No JSON library available: %s' % (', '.join(names),))
+
+
+def backend():
+    """Name of the library that is currently used"""
+    return _backend
+
+
+def dumps(obj):
+    """
+    Serialize `obj` to JSON `str` or `bytes`
+
+    Raise TypeError if `obj` is not serializable.
+    """
+    try:
+        return _dumps(obj)
+    except TypeError:
+        # Some libraries can't handle subclasses of builtin types (e.g. orjson
+        # refuses tuple and float subclasses)
+        if _dumps is json.dumps:
+            raise
+        return json.dumps(obj)
+
+
+def loads(data):
+    """
+    Deserialize JSON `str` or `bytes`
+
+    Raise ValueError if `data` is not valid JSON.
+    """
+    return _loads(data)
+
+
+_raw_decode = json.JSONDecoder().raw_decode
+_skip_whitespace = re.compile(r'[ \t\n\r]*').match
+
+
+def iterloads(data, chunk_size=64 * 1024, depth=3):
+    """
+    Deserialize JSON `str` or `bytes` piece by piece
+
+    Return generator that yields None after roughly every `chunk_size`
+    characters and returns the deserialized object.  The caller can do other
+    work between iterations, which is not possible while `loads` is running.
+
+    Objects and arrays that are nested no deeper than `depth` are split into
+    their items.  Deeper values are deserialized at once.
+
+    Raise ValueError if `data` is not valid JSON.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    decoder = _Decoder(data, chunk_size, depth)
+    value = yield from decoder.decode_value(0)
+    end = _skip_whitespace(data, decoder.pos).end()
+    if end != len(data):
+        raise ValueError('Extra data at position %d' % (end,))
+    return value
+
+
+class _Decoder():
+    def __init__(self, data, chunk_size, depth):
+        self.data = data
+        self.pos = 0
+        self.chunk_size = chunk_size
+        self.max_depth = depth
+        self._next_yield = chunk_size
+
+    def peek(self):
+        # Move past whitespace and return the next character
+        self.pos = _skip_whitespace(self.data, self.pos).end()
+        return self.data[self.pos:self.pos + 1]
+
+    def skip(self, expected):
+        # Move past whitespace and the next character, which must be in `expected`
+        char = self.peek()
+        if not char or char not in expected:
+            raise ValueError('Expecting %s at position %d'
+                             % (' or '.join(map(repr, expected)), self.pos))
+        self.pos += 1
+        return char
+
+    def decode_value(self, depth):
+        char = self.peek()
+        if depth < self.max_depth and char == '[':
+            return (yield from self.decode_array(depth + 1))
+        elif depth < self.max_depth and char == '{':
+            return (yield from self.decode_object(depth + 1))
+        else:
+            value, self.pos = _raw_decode(self.data, self.pos)
+            if self.pos >= self._next_yield:
+                self._next_yield = self.pos + self.chunk_size
+                yield
+            return value
+
+    def decode_array(self, depth):
+        self.pos += 1
+        items = []
+        if self.peek() == ']':
+            self.pos += 1
+            return items
+        while True:
+            items.append((yield from self.decode_value(depth)))
+            if self.skip(',]') == ']':
+                return items
+
+    def decode_object(self, depth):
+        self.pos += 1
+        obj = {}
+        if self.peek() == '}':
+            self.pos += 1
+            return obj
+        while True:
+            if self.peek() != '"':
+                raise ValueError('Expecting property name at position %d' % (self.pos,))
+            key, self.pos = _raw_decode(self.data, self.pos)
+            self.skip(':')
+            obj[key] = yield from self.decode_value(depth)
+            if self.skip(',}') == '}':
+                return obj
+
+
+use(*BACKENDS)
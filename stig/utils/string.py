@@ -35,8 +35,12 @@ def striplines(lines):
 
 def strwidth(string):
     """Return displayed width of `string`, considering wide characters"""
-    return len(string) + sum(1 for char in string
-                             if _east_asian_width(char) in 'FW')
+    length = len(string)
+    if length == len(string.encode('utf-8', 'surrogatepass')):
+        # ASCII characters are never wide
+        return length
+    return length + sum(1 for char in string
+                        if _east_asian_width(char) in 'FW')
 
 
 def strcrop(string, width, tail=None):
@@ -34,6 +34,7 @@ class Filename(ColumnBase):
     width = None
     min_width = 10
     may_have_wide_chars = True
+    needed_keys = ('name', 'path-absolute')
 
     def get_value(self):
         return self.data['name']
@@ -45,6 +46,7 @@ class Size(ColumnBase):
     header = {'left': 'Size', 'right': '?'}
     width = 6
     min_width = 6
+    needed_keys = ('size-total',)
 
     def get_value(self):
         return self._from_cache(_ensure_hide_unit, self.data['size-total'])
@@ -60,6 +62,7 @@ class Downloaded(ColumnBase):
     header = {'left': 'Dn', 'right': '?'}
     width = 6
     min_width = 6
+    needed_keys = ('size-downloaded',)
 
     def get_value(self):
         return self._from_cache(_ensure_hide_unit, self.data['size-downloaded'])
@@ -75,6 +78,7 @@ class PercentDownloaded(ColumnBase):
     header = {'right': '%'}
     width = 4
     min_width = 4
+    needed_keys = ('%downloaded',)
 
     def get_value(self):
         return self._from_cache(_ensure_hide_unit, self.data['%downloaded'])
@@ -87,6 +91,7 @@ class Priority(ColumnBase):
     width = 4
     min_width = 4
     align = 'left'
+    needed_keys = ('priority',)
 
     def get_value(self):
         val = self.get_raw_value()
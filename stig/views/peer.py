@@ -32,6 +32,7 @@ class Torrent(ColumnBase):
     width = None
     min_width = 7
     may_have_wide_chars = True
+    needed_keys = ('tname',)
 
     def get_value(self):
         return self.data['tname']
@@ -44,6 +45,7 @@ class Client(ColumnBase):
     align = 'left'
     width = None
     min_width = 6
+    needed_keys = ('client',)
 
     def get_value(self):
         return self.data['client']
@@ -56,6 +58,7 @@ class Host(ColumnBase):
     align = 'right'
     width = None
     min_width = 4
+    needed_keys = ('ip',)
 
     def get_value(self):
         return self.data['ip']
@@ -75,6 +78,7 @@ class Port(ColumnBase):
     align = 'right'
     width = 5
     min_width = 5
+    needed_keys = ('port',)
 
     def get_value(self):
         return self.data['port']
@@ -86,6 +90,7 @@ class PercentDownloaded(ColumnBase):
     header = {'right': '%'}
     width = 4
     min_width = 4
+    needed_keys = ('%downloaded',)
 
     def get_value(self):
         return self._from_cache(_ensure_hide_unit, self.data['%downloaded'])
@@ -97,6 +102,7 @@ class RateUp(ColumnBase):
     header = {'left': 'Up', 'right': '?/s'}
     width = 6
     min_width = 6
+    needed_keys = ('rate-up',)
 
     def get_value(self):
         return self._from_cache(_ensure_hide_unit, self.data['rate-up'])
@@ -112,6 +118,7 @@ class RateDown(ColumnBase):
     header = {'left': 'Dn', 'right': '?/s'}
     width = 6
     min_width = 6
+    needed_keys = ('rate-down',)
 
     def get_value(self):
         return self._from_cache(_ensure_hide_unit, self.data['rate-down'])
@@ -127,6 +134,7 @@ class ETA(ColumnBase):
     header = {'left': 'ETA'}
     width = 5
     min_width = 3
+    needed_keys = ('eta',)
 
     def get_value(self):
         return self.data['eta']
@@ -138,6 +146,7 @@ class RateEst(ColumnBase):
     header = {'left': 'Est', 'right': '?/s'}
     width = 7
     min_width = 7
+    needed_keys = ('rate-est',)
 
     def get_value(self):
         return self._from_cache(_ensure_hide_unit, self.data['rate-est'])
@@ -40,6 +40,7 @@ class Torrent(ColumnBase):
     width = None
     min_width = 7
     may_have_wide_chars = True
+    needed_keys = ('tname',)
 
     def get_value(self):
         return self.data['tname']
@@ -52,6 +53,7 @@ class Tier(ColumnBase):
     align = 'right'
     width = 4
     min_width = 4
+    needed_keys = ('tier',)
 
     def get_value(self):
         return self.data['tier']
@@ -64,6 +66,7 @@ class Domain(ColumnBase):
     align = 'left'
     width = None
     min_width = 5
+    needed_keys = ('domain',)
 
     def get_value(self):
         return self.data['domain']
@@ -76,6 +79,7 @@ class AnnounceURL(ColumnBase):
     align = 'left'
     width = None
     min_width = 10
+    needed_keys = ('url-announce',)
 
     def get_value(self):
         return self.data['url-announce']
@@ -88,6 +92,7 @@ class ScrapeURL(ColumnBase):
     align = 'left'
     width = None
     min_width = 10
+    needed_keys = ('url-scrape',)
 
     def get_value(self):
         return self.data['url-scrape']
@@ -100,6 +105,7 @@ class Status(ColumnBase):
     align = 'right'
     width = 10
     min_width = 5
+    needed_keys = ('status',)
 
     def get_value(self):
         return self.data['status']
@@ -112,6 +118,7 @@ class Error(ColumnBase):
     align = 'left'
     width = None
     min_width = 20
+    needed_keys = ('error',)
 
     def get_value(self):
         return self.data['error']
@@ -124,6 +131,7 @@ class ErrorAnnounce(ColumnBase):
     align = 'left'
     width = None
     min_width = 10
+    needed_keys = ('error-announce',)
 
     def get_value(self):
         return self.data['error-announce']
@@ -136,6 +144,7 @@ class ErrorScrape(ColumnBase):
     align = 'left'
     width = None
     min_width = 10
+    needed_keys = ('error-scrape',)
 
     def get_value(self):
         return self.data['error-scrape']
@@ -148,6 +157,7 @@ class Downloads(ColumnBase):
     align = 'right'
     width = 9
     min_width = 5
+    needed_keys = ('count-downloads',)
 
     def get_value(self):
         return self.data['count-downloads']
@@ -160,6 +170,7 @@ class Leeches(ColumnBase):
     align = 'right'
     width = 7
     min_width = 5
+    needed_keys = ('count-leeches',)
 
     def get_value(self):
         return self.data['count-leeches']
@@ -172,6 +183,7 @@ class Seeds(ColumnBase):
     align = 'right'
     width = 5
     min_width = 5
+    needed_keys = ('count-seeds',)
 
     def get_value(self):
         return self.data['count-seeds']
@@ -184,6 +196,7 @@ class LastAnnounce(ColumnBase):
     align = 'right'
     width = 13
     min_width = 10
+    needed_keys = ('time-last-announce',)
 
     def get_value(self):
         return self.data['time-last-announce']
@@ -196,6 +209,7 @@ class NextAnnounce(ColumnBase):
     align = 'right'
     width = 13
     min_width = 10
+    needed_keys = ('time-next-announce',)
 
     def get_value(self):
         return self.data['time-next-announce']
@@ -208,6 +222,7 @@ class LastScrape(ColumnBase):
     align = 'right'
     width = 11
     min_width = 10
+    needed_keys = ('time-last-scrape',)
 
     def get_value(self):
         return self.data['time-last-scrape']
@@ -220,6 +235,7 @@ class NextScrape(ColumnBase):
     align = 'right'
     width = 11
     min_width = 10
+    needed_keys = ('time-next-scrape',)
 
     def get_value(self):
         return self.data['time-next-scrape']
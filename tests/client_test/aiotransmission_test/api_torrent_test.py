@@ -2,6 +2,7 @@ import os.path
 
 import asynctest
 import resources_aiotransmission as rsrc
+from aiohttp import web
 
 from stig.client import MAX_TORRENT_FILE_SIZE
 from stig.client.aiotransmission.api_torrent import TorrentAPI
@@ -133,6 +134,19 @@ class TestGettingTorrents(TorrentAPITestCase):
         self.assertEqual(response.msgs, ())
         self.assertEqual(response.errors, ('No torrent with ID: 4', 'No torrent with ID: 5'))
 
+    async def test_get_torrents_by_ids_preserves_order(self):
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Torrent1'},
+            {'id': 2, 'name': 'Torrent2'},
+            {'id': 3, 'name': 'Torrent3'},
+        )
+        response = await self.api.torrents(torrents=(3, 5, 1, 3))
+        self.assertEqual(response.success, True)
+        self.assertEqual(response.torrents,
+                         (Torrent({'id': 3, 'name': 'Torrent3'}),
+                          Torrent({'id': 1, 'name': 'Torrent1'})))
+        self.assertEqual(response.errors, ('No torrent with ID: 5',))
+
     async def test_get_torrents_by_filter(self):
         self.daemon.response = rsrc.response_torrents(
             {'id': 1, 'name': 'Foo'},
@@ -160,6 +174,155 @@ class TestGettingTorrents(TorrentAPITestCase):
         self.assertEqual(response.msgs, ())
         self.assertEqual(response.errors, ('No matching torrents: =Nope',))
 
+    async def test_get_torrents_incrementally(self):
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Foo'},
+            {'id': 2, 'name': 'Bar'},
+            {'id': 3, 'name': 'Boo'},
+        )
+        response = await self.api.torrents(keys=('name',), incremental=True)
+        self.assertEqual(self.daemon.requests[-1]['arguments'].get('ids'), None)
+        self.assertEqual(tuple(t['name'] for t in response.torrents), ('Foo', 'Bar', 'Boo'))
+
+        self.daemon.response = rsrc.response_success(
+            {'torrents': [{'id': 2, 'name': 'Baz'}], 'removed': [3]}
+        )
+        response = await self.api.torrents(keys=('name',), incremental=True)
+        self.assertEqual(self.daemon.requests[-1]['arguments']['ids'], 'recently-active')
+        self.assertEqual(response.success, True)
+        self.assertEqual(tuple(t['name'] for t in response.torrents), ('Foo', 'Baz'))
+
+        response = await self.api.torrents(torrents=TorrentFilter('name~oo'),
+                                           keys=('name',), incremental=True)
+        self.assertEqual(self.daemon.requests[-1]['arguments']['ids'], 'recently-active')
+        self.assertEqual(tuple(t['name'] for t in response.torrents), ('Foo',))
+        self.assertEqual(response.msgs, ('Found 1 ~oo torrent',))
+
+    async def test_get_torrents_incrementally_resyncs_on_new_keys(self):
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Foo', 'rateDownload': 10},
+        )
+        await self.api.torrents(keys=('name',), incremental=True)
+        await self.api.torrents(keys=('name', 'rate-down'), incremental=True)
+        self.assertEqual(self.daemon.requests[-1]['arguments'].get('ids'), None)
+
+    async def test_get_torrents_incrementally_resyncs_after_interval(self):
+        self.api.resync_interval = 0
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Foo'},
+        )
+        await self.api.torrents(keys=('name',), incremental=True)
+        await self.api.torrents(keys=('name',), incremental=True)
+        self.assertEqual(self.daemon.requests[-1]['arguments'].get('ids'), None)
+
+    def respond_with_requested_fields(self, *torrents):
+        # Only respond with requested fields of requested torrents like a real daemon
+        async def response(request):
+            args = (await request.json())['arguments']
+            ids = args.get('ids')
+            tlist = [{k:v for k,v in t.items() if k in args['fields']}
+                     for t in torrents if ids is None or t['id'] in ids]
+            return web.json_response(rsrc.response_success({'torrents': tlist}))
+        self.daemon.response = response
+
+    async def test_get_torrents_with_split_fields(self):
+        self.respond_with_requested_fields(
+            {'id': 1, 'name': 'Foo', 'rateDownload': 10, 'metadataPercentComplete': 1},
+        )
+        requests_sent = len(self.daemon.requests)
+        await self.api.torrents(keys=('name', 'rate-down'), split_fields=True)
+        self.assertEqual(len(self.daemon.requests), requests_sent + 1)
+        self.assertEqual(set(self.daemon.requests[-1]['arguments']['fields']),
+                         {'id', 'name', 'rateDownload'})
+
+        # Slow-changing fields are cached
+        await self.api.torrents(keys=('name', 'rate-down'), split_fields=True)
+        self.assertEqual(len(self.daemon.requests), requests_sent + 2)
+        self.assertEqual(set(self.daemon.requests[-1]['arguments']['fields']),
+                         {'id', 'rateDownload', 'metadataPercentComplete'})
+
+        # Slow-changing fields are requested for new torrents
+        self.respond_with_requested_fields(
+            {'id': 1, 'name': 'Foo', 'rateDownload': 10, 'metadataPercentComplete': 1},
+            {'id': 2, 'name': 'Bar', 'rateDownload': 20, 'metadataPercentComplete': 1},
+        )
+        response = await self.api.torrents(keys=('name', 'rate-down'), split_fields=True)
+        self.assertEqual(len(self.daemon.requests), requests_sent + 4)
+        self.assertEqual(self.daemon.requests[-1]['arguments']['ids'], [2])
+        self.assertEqual(set(self.daemon.requests[-1]['arguments']['fields']), {'id', 'name'})
+        self.assertEqual(tuple(t['name'] for t in response.torrents), ('Foo', 'Bar'))
+        self.assertEqual(tuple(t['rate-down'] for t in response.torrents), (10, 20))
+
+        # Slow-changing fields are requested while metadata is downloaded
+        self.respond_with_requested_fields(
+            {'id': 1, 'name': 'Foo', 'rateDownload': 10, 'metadataPercentComplete': 1},
+            {'id': 2, 'name': 'Bar', 'rateDownload': 20, 'metadataPercentComplete': 0.5},
+        )
+        await self.api.torrents(keys=('name', 'rate-down'), split_fields=True)
+        await self.api.torrents(keys=('name', 'rate-down'), split_fields=True)
+        self.assertEqual(len(self.daemon.requests), requests_sent + 8)
+        self.assertEqual(self.daemon.requests[-1]['arguments']['ids'], [2])
+
+    async def test_get_torrents_with_split_fields_refreshes_after_interval(self):
+        self.api.slow_fields_interval = 0
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Foo', 'rateDownload': 10, 'metadataPercentComplete': 1},
+        )
+        await self.api.torrents(keys=('name', 'rate-down'), split_fields=True)
+        await self.api.torrents(keys=('name', 'rate-down'), split_fields=True)
+        self.assertEqual(self.daemon.requests[-1]['arguments']['ids'], [1])
+        self.assertEqual(set(self.daemon.requests[-1]['arguments']['fields']), {'id', 'name'})
+
+    async def test_get_torrents_with_split_fields_refreshes_each_torrent_after_interval(self):
+        self.respond_with_requested_fields(
+            {'id': 1, 'name': 'Foo', 'rateDownload': 10, 'metadataPercentComplete': 1},
+            {'id': 2, 'name': 'Bar', 'rateDownload': 20, 'metadataPercentComplete': 1},
+        )
+
+        def age_slow_fields(seconds):
+            refreshed = self.api._tcache._refreshed
+            for tid in refreshed:
+                refreshed[tid] -= seconds
+
+        await self.api.torrents(keys=('name', 'rate-down'), split_fields=True)
+        age_slow_fields(self.api.slow_fields_interval)
+
+        # Requesting some torrents only refreshes those
+        await self.api.torrents(torrents=(1,), keys=('name', 'rate-down'), split_fields=True)
+        self.assertEqual(self.daemon.requests[-1]['arguments']['ids'], [1])
+        self.assertEqual(set(self.daemon.requests[-1]['arguments']['fields']), {'id', 'name'})
+
+        # The other torrents are still refreshed
+        requests_sent = len(self.daemon.requests)
+        await self.api.torrents(keys=('name', 'rate-down'), split_fields=True)
+        self.assertEqual(len(self.daemon.requests), requests_sent + 2)
+        self.assertEqual(self.daemon.requests[-1]['arguments']['ids'], [2])
+        self.assertEqual(set(self.daemon.requests[-1]['arguments']['fields']), {'id', 'name'})
+
+    async def test_get_torrents_with_split_fields_always_requests_file_progress(self):
+        # 'files' contains 'bytesCompleted', which changes while downloading
+        self.respond_with_requested_fields(
+            {'id': 1, 'name': 'Foo', 'files': [], 'fileStats': [], 'downloadDir': '/foo',
+             'metadataPercentComplete': 1},
+        )
+        await self.api.torrents(keys=('name', 'files'), split_fields=True)
+        await self.api.torrents(keys=('name', 'files'), split_fields=True)
+        fields = set(self.daemon.requests[-1]['arguments']['fields'])
+        self.assertIn('files', fields)
+        self.assertNotIn('name', fields)
+
+    async def test_get_torrents_with_split_fields_always_requests_tracker_stats(self):
+        # Seeder counts and announce results change all the time
+        self.respond_with_requested_fields(
+            {'id': 1, 'name': 'Foo', 'isPrivate': False, 'trackerStats': [],
+             'peersConnected': 0, 'metadataPercentComplete': 1},
+        )
+        await self.api.torrents(keys=('name', 'peers-seeding'), split_fields=True)
+        await self.api.torrents(keys=('name', 'peers-seeding'), split_fields=True)
+        fields = set(self.daemon.requests[-1]['arguments']['fields'])
+        self.assertIn('trackerStats', fields)
+        self.assertNotIn('name', fields)
+
 
 class TestManipulatingTorrents(TorrentAPITestCase):
     async def setUp(self):
@@ -178,6 +341,31 @@ class TestManipulatingTorrents(TorrentAPITestCase):
         # None of the RPC methods for torrents have return values,
         # so we return nothing
 
+    async def test_generation_changes_when_torrents_change(self):
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Torrent1', 'rateDownload': 0},
+            {'id': 2, 'name': 'Torrent2', 'rateDownload': 0},
+        )
+        generation = self.api.generation
+        await self.api.torrents(keys=('name', 'rate-down'))
+        self.assertEqual(self.api.generation, generation + 1)
+
+        await self.api.torrents(keys=('name', 'rate-down'))
+        self.assertEqual(self.api.generation, generation + 1)
+
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Torrent1', 'rateDownload': 0},
+            {'id': 2, 'name': 'Torrent2', 'rateDownload': 123},
+        )
+        await self.api.torrents(keys=('name', 'rate-down'))
+        self.assertEqual(self.api.generation, generation + 2)
+
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 2, 'name': 'Torrent2', 'rateDownload': 123},
+        )
+        await self.api.torrents(keys=('name', 'rate-down'))
+        self.assertEqual(self.api.generation, generation + 3)
+
     async def test_no_torrents_found(self):
         response = await self.api._torrent_action(
             torrents=TorrentFilter('id=4'),
@@ -1,4 +1,7 @@
 import asyncio
+import gc
+import json
+import time
 
 import asynctest
 import resources_aiotransmission as rsrc
@@ -6,6 +9,7 @@ from aiohttp import web
 
 from stig.client import AuthError, ConnectionError, RPCError, TimeoutError
 from stig.client.aiotransmission.rpc import TransmissionRPC
+from stig.utils import jsoncodec
 
 
 class TestTransmissionRPC(asynctest.ClockedTestCase):
@@ -299,6 +303,126 @@ class TestTransmissionRPC(asynctest.ClockedTestCase):
                                     args=[(self.client,)],
                                     kwargs=[{'error': cm.exception}])
 
+    async def test_malformed_json_response(self):
+        await self.client.connect()
+        self.daemon.response = '{"result": "succ'
+        with self.assertRaises(RPCError) as cm:
+            await self.client.torrent_get()
+        self.assertIn('Server sent malformed JSON', str(cm.exception))
+        self.assertEqual(self.client.connected, True)
+
+    @asynctest.patch('stig.client.aiotransmission.rpc.DECODE_IN_CHUNKS_THRESHOLD', 10)
+    @asynctest.patch('stig.client.aiotransmission.rpc.DECODE_CHUNK_SIZE', 100)
+    async def test_big_response_is_decoded_in_chunks(self):
+        await self.client.connect()
+        tlist = [{'id': i, 'name': 'Torrent %d' % i} for i in range(100)]
+        self.daemon.response = rsrc.response_success({'torrents': tlist})
+        with asynctest.patch('asyncio.sleep', wraps=asyncio.sleep) as sleep:
+            response = await self.client.torrent_get()
+        self.assertEqual(response, tlist)
+        self.assertGreater(sleep.call_count, 10)
+
+        self.daemon.response = '{"result": "success", "arguments": {"torrents": [{"id": 1}'
+        with self.assertRaises(RPCError) as cm:
+            await self.client.torrent_get()
+        self.assertIn('Server sent malformed JSON', str(cm.exception))
+
+    async def test_decoding_big_response_does_not_block_event_loop(self):
+        tlist = [{'id': i, 'name': 'Torrent %d' % i, 'rateDownload': i * 1.5,
+                  'files': [{'name': 'File %d' % j, 'length': j} for j in range(10)]}
+                 for i in range(10000)]
+        body = json.dumps(rsrc.response_success({'torrents': tlist})).encode('utf-8')
+
+        gaps = []
+
+        async def measure_latency():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        # Garbage collection pauses the loop no matter how we decode
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            jsoncodec.loads(body)
+            blocking_time = time.perf_counter() - start
+
+            task = self.loop.create_task(measure_latency())
+            await asyncio.sleep(0)
+            answer = await TransmissionRPC._decode(body)
+            task.cancel()
+        finally:
+            gc.enable()
+        self.assertEqual(answer['arguments']['torrents'], tlist)
+        self.assertGreater(len(gaps), 10)
+        self.assertLess(max(gaps), blocking_time / 4)
+
+    async def test_concurrent_requests(self):
+        await self.client.connect()
+        active = []
+        max_active = 0
+
+        async def slow_response(request):
+            nonlocal max_active
+            active.append(request)
+            max_active = max(max_active, len(active))
+            # Give the other requests a chance to arrive
+            for _ in range(100):
+                await asyncio.sleep(0)
+            active.remove(request)
+            return web.json_response(rsrc.response_success({'torrents': []}))
+        self.daemon.response = slow_response
+
+        responses = await asyncio.gather(*(self.client.torrent_get() for _ in range(3)))
+        self.assertEqual(responses, [[], [], []])
+        self.assertEqual(max_active, 3)
+
+    async def test_concurrent_requests_survive_failing_request(self):
+        await self.client.connect()
+        requests = []
+
+        async def response(request):
+            requests.append(request)
+            if len(requests) == 1:
+                # Wait for the other requests to arrive before dropping the connection
+                for _ in range(100):
+                    await asyncio.sleep(0)
+                request.transport.close()
+            else:
+                for _ in range(200):
+                    await asyncio.sleep(0)
+            return web.json_response(rsrc.response_success({'torrents': []}))
+        self.daemon.response = response
+
+        results = await asyncio.gather(*(self.client.torrent_get() for _ in range(3)),
+                                       return_exceptions=True)
+        self.assertIsInstance(results[0], ConnectionError)
+        self.assertEqual(results[1:], [[], []])
+        self.assertEqual(self.client.connected, False)
+        self.assert_cb_disconnected_called(calls=1, args=[(self.client,)])
+        self.assertEqual(self.client._session_users, {})
+
+    async def test_concurrent_requests_share_connection_attempt(self):
+        responses = await asyncio.gather(*(self.client.session_get() for _ in range(3)))
+        self.assertEqual(responses, [rsrc.SESSION_GET_RESPONSE['arguments']] * 3)
+        self.assert_connected_to(self.daemon.host, self.daemon.port)
+        self.assert_cb_connected_called(calls=1)
+        self.assert_cb_disconnected_called(calls=0)
+        self.assert_cb_error_called(calls=0)
+
+    async def test_concurrent_requests_share_connection_error(self):
+        await self.daemon.stop()
+        results = await asyncio.gather(*(self.client.torrent_get() for _ in range(3)),
+                                       return_exceptions=True)
+        for result in results:
+            self.assertIsInstance(result, ConnectionError)
+        self.assertEqual(self.client.connected, False)
+        # The first request fails to connect, the others get the same exception
+        self.assertEqual(len(set(id(result) for result in results)), 1)
+
     async def test_ConnectionError_during_connect(self):
         self.assert_not_connected_to(self.daemon.host, self.daemon.port)
 
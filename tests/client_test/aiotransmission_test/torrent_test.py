@@ -73,6 +73,24 @@ class TestTorrent(unittest.TestCase):
         self.assertEqual(set(t), {'id', 'name', 'rate-down', 'hash',
                                   'time-created', '%verified'})
 
+    def test_update_invalidates_dependent_keys(self):
+        t = torrent.Torrent({'id': 1, 'name': 'Foo', 'rateDownload': 100, 'rateUpload': 0,
+                             'totalSize': 1000, 'uploadedEver': 500})
+        for key in ('name', 'rate-down', 'rate-up', '%uploaded', 'size-total'):
+            t[key]
+        self.assertEqual(t.update({'id': 1, 'name': 'Foo', 'rateDownload': 100}), False)
+        self.assertEqual(set(t._cache), {'name', 'rate-down', 'rate-up', '%uploaded', 'size-total'})
+
+        self.assertEqual(t.update({'id': 1, 'rateDownload': 200, 'uploadedEver': 600}), True)
+        self.assertEqual(set(t._cache), {'name', 'rate-up', 'size-total'})
+        self.assertEqual(t['rate-down'], 200)
+        self.assertEqual(t['%uploaded'], 60)
+
+    def test_reverse_dependencies(self):
+        for key, fields in torrent.DEPENDENCIES.items():
+            for field in fields:
+                self.assertIn(key, torrent._DEPENDENTS[field])
+
 class TestTorrentFileTree(unittest.TestCase):
     def test_update(self):
         raw = {'id': 1, 'name': 'Fake torrent', 'downloadDir': '/a/path',
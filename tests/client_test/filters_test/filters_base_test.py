@@ -1,6 +1,10 @@
 import unittest
+import unittest.mock
 
+from stig.client.filters import base
 from stig.client.filters.base import BoolFilterSpec, CmpFilterSpec, Filter, FilterChain
+from stig.client.filters.utils import timestamp_or_timedelta
+from stig.client.utils import Timestamp
 
 
 class TestFilterParser(unittest.TestCase):
@@ -294,6 +298,44 @@ class TestFilter_apply(unittest.TestCase):
         self.assertEqual(tuple(FooFilter('c!~b').apply(items, key='v')), ('foo',))
         self.assertEqual(tuple(FooFilter('!c~b').apply(items, key='v')), ('foo',))
 
+    def test_regex_operator(self):
+        class FooFilter(Filter):
+            COMPARATIVE_FILTERS = {'c': CmpFilterSpec(value_type=str, value_getter=lambda i: i['v']),
+                                   'n': CmpFilterSpec(value_type=int, value_getter=lambda i: i['n'])}
+        items = ({'v': 'foo', 'n': 10}, {'v': 'bar', 'n': 20}, {'v': 'baz', 'n': 35})
+        self.assertEqual(tuple(FooFilter('c=~^ba').apply(items, key='v')), ('bar', 'baz'))
+        self.assertEqual(tuple(FooFilter('c!=~^ba').apply(items, key='v')), ('foo',))
+        # Non-string values are matched by their string representation
+        self.assertEqual(tuple(FooFilter('n=~0$').apply(items, key='n')), (10, 20))
+        self.assertEqual(tuple(FooFilter('n=~^[23]').apply(items, key='n')), (20, 35))
+
+    def test_regex_is_compiled_once(self):
+        class FooFilter(Filter):
+            COMPARATIVE_FILTERS = {'c': CmpFilterSpec(value_type=str, value_getter=lambda i: i['v'])}
+        items = ({'v': 'foo'}, {'v': 'bar'}, {'v': 'baz'})
+        f = FooFilter('c=~^ba')
+        with unittest.mock.patch('re.compile') as mock_compile, \
+             unittest.mock.patch('re.search') as mock_search:
+            self.assertEqual(tuple(f.apply(items, key='v')), ('bar', 'baz'))
+        self.assertEqual(mock_compile.call_args_list, [])
+        self.assertEqual(mock_search.call_args_list, [])
+
+    def test_invalid_regex(self):
+        class FooFilter(Filter):
+            COMPARATIVE_FILTERS = {'c': CmpFilterSpec(value_type=str, value_getter=lambda i: i['v'])}
+        with self.assertRaises(ValueError) as cm:
+            FooFilter('c=~(foo')
+        self.assertEqual(str(cm.exception), 'Invalid regular expression: Missing ), unterminated subpattern '
+                                            'at position 0: (foo')
+
+    def test_regex_with_custom_value_matcher_for_non_strings(self):
+        class FooFilter(Filter):
+            COMPARATIVE_FILTERS = {'n': CmpFilterSpec(value_type=int, value_getter=lambda i: i['n'],
+                                                      value_matcher=lambda i, op, v: op(i['n'], v))}
+        with self.assertRaises(ValueError) as cm:
+            FooFilter('n=~0$')
+        self.assertEqual(str(cm.exception), "Invalid operator for filter 'n': =~")
+
     def test_gt_operator(self):
         class FooFilter(Filter):
             COMPARATIVE_FILTERS = {'c': CmpFilterSpec(value_type=int, value_getter=lambda i: i['v'])}
@@ -474,6 +516,11 @@ class TestFilterChain_parser(unittest.TestCase):
         self.assertEqual(self.f('b1|b2&c~foo|ci~bar'), self.f('c~foo&b2|ci~bar|b1'))
         self.assertNotEqual(self.f('b1|b2&c~foo|ci~bar'), self.f('c~foo&b2|b1'))
 
+    def test_hash(self):
+        self.assertEqual(hash(self.f('b1&b2')), hash(self.f('b2&b1')))
+        self.assertEqual(hash(self.f('b1|b2&c~foo')), hash(self.f('c~foo&b2|b1')))
+        self.assertEqual(len({self.f('b1|b2'), self.f('b2|b1'), self.f('b1&b2')}), 2)
+
     def test_combined_needed_keys(self):
         f1 = self.f('b1')
         f2 = self.f('b2')
@@ -512,6 +559,98 @@ class TestFilterChain_parser(unittest.TestCase):
         self.assertEqual(self.f('b2') | self.f('everything') & self.f('c~foo'), self.f('everything'))
 
 
+class TestFilterChain_cache(unittest.TestCase):
+    def setUp(self):
+        class FooFilter(Filter):
+            BOOLEAN_FILTERS = {'b1': BoolFilterSpec(lambda i: i['v'], needed_keys=('a',))}
+            COMPARATIVE_FILTERS = {'c': CmpFilterSpec(value_type=str, value_getter=lambda i: i['v']),
+                                   't': CmpFilterSpec(value_type=Timestamp, value_getter=lambda i: i['t'],
+                                                      value_convert=timestamp_or_timedelta)}
+            DEFAULT_FILTER = 'c'
+
+        class FooFilterChain(FilterChain):
+            filterclass = FooFilter
+
+        self.f = FooFilterChain
+        base.cache_clear()
+        self.addCleanup(base.cache_clear)
+
+    def test_equal_strings_share_parsed_filters(self):
+        f1 = self.f('b1|c~foo')
+        f2 = self.f('b1|c~foo')
+        self.assertIsNot(f1, f2)
+        self.assertIs(f1._filterchains, f2._filterchains)
+        self.assertIs(f1._predicate, f2._predicate)
+        self.assertEqual(base.cache_info().hits, 1)
+
+    def test_normalized_string_is_cached(self):
+        f1 = self.f('!b1 | foo')
+        self.assertEqual(str(f1), '!b1|~foo')
+        f2 = self.f('!b1|~foo')
+        self.assertIs(f1._filterchains, f2._filterchains)
+
+    def test_combined_filters_are_cached(self):
+        f1, f2 = self.f('b1'), self.f('c=bar')
+        info = base.cache_info()
+        self.assertEqual(f1 | f2, f1 | f2)
+        self.assertEqual(base.cache_info().misses, info.misses + 1)
+
+    def test_passing_FilterChain_instance_does_not_use_cache(self):
+        f1 = self.f('b1')
+        info = base.cache_info()
+        f2 = self.f(f1)
+        self.assertIs(f1._filterchains, f2._filterchains)
+        self.assertEqual(base.cache_info(), info)
+
+    def test_filter_classes_are_cached_separately(self):
+        class BarFilterChain(FilterChain):
+            filterclass = self.f.filterclass
+        f1 = self.f('b1')
+        f2 = BarFilterChain('b1')
+        self.assertIsNot(f1._filterchains, f2._filterchains)
+        self.assertEqual(base.cache_info().hits, 1)
+
+    def test_invalid_filters_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.f('foo=bar')
+        self.assertEqual(base.cache_info().hits, 0)
+
+    def test_filters_with_timestamps_are_not_cached(self):
+        for string in ('t>14:00', 't<2001-02-03', 'b1|t>=12:30'):
+            f1, f2 = self.f(string), self.f(string)
+            self.assertIsNot(f1._filterchains, f2._filterchains)
+            self.assertEqual(f1, f2)
+
+    def test_filters_with_timedeltas_are_cached(self):
+        f1, f2 = self.f('t<1d'), self.f('t<1d')
+        self.assertIs(f1._filterchains, f2._filterchains)
+
+    def test_user_value_is_validated_once(self):
+        with unittest.mock.patch.object(self.f.filterclass, '_validate_user_value',
+                                        wraps=self.f.filterclass._validate_user_value) as validate:
+            self.f('c=foo&t<1d')
+        self.assertEqual(validate.call_count, 2)
+
+    def test_hit_rate_is_logged(self):
+        self.f('b1')
+        with self.assertLogs(base.log.name, level='DEBUG') as cm:
+            self.f('b1')
+        self.assertIn('Parsed filter cache: <_ParsedCache hits=1, misses=2 (33% hits), size=2/1000>',
+                      [record.getMessage() for record in cm.records])
+
+    def test_least_recently_used_filters_are_discarded(self):
+        cache = base._ParsedCache(maxsize=2)
+        cache.add(('a', 'A'), 1)
+        cache.add(('b',), 2)
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.get('A'), 1)
+        cache.add(('c',), 3)
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.get('A'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.info(), base.CacheInfo(hits=3, misses=2, maxsize=2, currsize=2))
+
 class TestFilterChain_apply(unittest.TestCase):
     def setUp(self):
         class FooFilter(Filter):
@@ -574,3 +713,52 @@ class TestFilterChain_apply(unittest.TestCase):
             self.assertEqual(self.f('!mod3').match(item), item['v'] % 3 != 0)
             self.assertEqual(self.f('n_abs>0').match(item), abs(item['v']) > 0)
             self.assertEqual(self.f('n_abs!>0').match(item), abs(item['v']) <= 0)
+
+    def test_compiled_predicate_is_equivalent_to_filters(self):
+        for filter_str in ('mod3|mod5', 'mod3&positive', '!mod3&!mod5|n_abs<2',
+                           'mod2&mod3&mod5|mod4&positive|n_int=7|!positive&n_abs>=9',
+                           'mod3&!all|mod5', 'mod3|!all', '!all', 'all&mod3', 'n>='):
+            fchain = self.f(filter_str)
+            for item in self.items:
+                exp = any(all(f.match(item) for f in AND_chain)
+                          for AND_chain in fchain._filterchains)
+                self.assertIs(fchain.match(item), exp, msg='%r: %r' % (filter_str, item))
+            self.assertEqual(tuple(fchain.apply(self.items)),
+                             tuple(item for item in self.items if fchain.match(item)))
+
+    def test_filter_that_matches_nothing(self):
+        self.do('!all', ())
+        self.do('mod10&!all', ())
+
+
+class TestCmpFilterSpec_smart_strings(unittest.TestCase):
+    def setUp(self):
+        from stig.client.utils import SmartCmpStr
+
+        class FooFilter(Filter):
+            COMPARATIVE_FILTERS = {'name': CmpFilterSpec(value_type=SmartCmpStr,
+                                                         value_getter=lambda i: i['name'])}
+            DEFAULT_FILTER = 'name'
+
+        class FooFilterChain(FilterChain):
+            filterclass = FooFilter
+
+        self.f = FooFilterChain
+        names = ('Foo', 'foo', 'FOO', 'bar', 'Bar', 'foobar', 'BarFoo')
+        self.smart_items = tuple({'name': SmartCmpStr(name)} for name in names)
+        self.plain_items = tuple({'name': name} for name in names)
+
+    def test_compiled_matcher_is_equivalent_to_SmartCmpStr(self):
+        for filter_str in ('foo', 'Foo', 'name=foo', 'name=Foo', 'name!=foo', 'name>bar',
+                           'name<=Foo', 'name=~^f', 'name~'):
+            fchain = self.f(filter_str)
+            for items in (self.smart_items, self.plain_items):
+                f = fchain._filterchains[0][0]
+                op = f.OPERATORS.get(f._op)
+                for item in items:
+                    if f._user_value is None:
+                        exp = True
+                    else:
+                        user_value = f._validate_user_value(f._name, f._op, f._user_value)
+                        exp = bool(op(item['name'], user_value)) ^ f._invert
+                    self.assertIs(fchain.match(item), exp, msg='%r: %r' % (filter_str, item))
@@ -217,3 +217,111 @@ class TestRequestPoller(asynctest.ClockedTestCase):
         await self.advance(0)
         self.assertEqual(self.mock_request_calls, 3)
         await rp.stop()
+
+    async def test_pollers_with_same_interval_poll_at_the_same_time(self):
+        polls = []
+
+        async def request(name):
+            polls.append((name, asyncio.get_event_loop().time()))
+
+        rp1 = self.make_poller(request, 'rp1', interval=10)
+        rp2 = self.make_poller(request, 'rp2', interval=10)
+        await rp1.start()
+        await self.advance(3)
+        await rp2.start()
+        await self.advance(20)
+        self.assertEqual([name for name,time in polls if time == 0], ['rp1'])
+        self.assertEqual([name for name,time in polls if time == 3], ['rp2'])
+        self.assertEqual(sorted(name for name,time in polls if time == 10), ['rp1', 'rp2'])
+        self.assertEqual(sorted(name for name,time in polls if time == 20), ['rp1', 'rp2'])
+        self.assertEqual(len(polls), 6)
+        await rp1.stop()
+        await rp2.stop()
+
+    async def test_adaptive_interval_slows_down_while_response_is_unchanged(self):
+        polls = []
+        response = 'foo'
+
+        async def request():
+            polls.append(asyncio.get_event_loop().time())
+            return response
+
+        rp = self.make_poller(request, interval=1)
+        rp.max_interval = 8
+        await rp.start()
+        # Polls are aligned to multiples of the current interval
+        await self.advance(20)
+        self.assertEqual(polls, [0, 1, 2, 4, 8, 16])
+
+        # Changed response resets interval
+        response = 'bar'
+        await self.advance(6)
+        self.assertEqual(polls, [0, 1, 2, 4, 8, 16, 24, 25, 26])
+        await rp.stop()
+
+    async def test_adaptive_interval_is_reset(self):
+        polls = []
+
+        async def request():
+            polls.append(asyncio.get_event_loop().time())
+            return 'foo'
+
+        rp = self.make_poller(request, interval=1)
+        rp.max_interval = 8
+        await rp.start()
+        await self.advance(10)
+        self.assertEqual(polls, [0, 1, 2, 4, 8])
+
+        # Poll immediately and slow down again from there
+        rp.reset_interval()
+        await self.advance(0)
+        self.assertEqual(polls, [0, 1, 2, 4, 8, 10])
+        await self.advance(2)
+        self.assertEqual(polls, [0, 1, 2, 4, 8, 10, 12])
+
+        await rp.stop()
+
+    async def test_reset_interval_without_max_interval(self):
+        rp = self.make_poller(self.mock_request, interval=1)
+        await rp.start()
+        await self.advance(0)
+        self.assertEqual(self.mock_request_calls, 1)
+        rp.reset_interval()
+        await self.advance(0)
+        self.assertEqual(self.mock_request_calls, 1)
+        await rp.stop()
+
+    async def test_max_interval_not_larger_than_interval(self):
+        polls = []
+
+        async def request():
+            polls.append(asyncio.get_event_loop().time())
+            return 'foo'
+
+        rp = self.make_poller(request, interval=5)
+        rp.max_interval = 5
+        await rp.start()
+        await self.advance(20)
+        self.assertEqual(polls, [0, 5, 10, 15, 20])
+        await rp.stop()
+
+    async def test_background_poller_polls_at_max_interval(self):
+        polls = []
+
+        async def request():
+            polls.append(asyncio.get_event_loop().time())
+            return len(polls)
+
+        rp = self.make_poller(request, interval=1)
+        rp.max_interval = 8
+        rp.background = True
+        await rp.start()
+        await self.advance(20)
+        self.assertEqual(polls, [0, 8, 16])
+
+        rp.background = False
+        await self.advance(0)
+        self.assertEqual(polls, [0, 8, 16, 20])
+        await self.advance(2)
+        self.assertEqual(polls, [0, 8, 16, 20, 21, 22])
+        await rp.stop()
@@ -1,6 +1,10 @@
+import gc
 import random
 import unittest
+import weakref
+from unittest.mock import patch
 
+from stig.client.sorters import base
 from stig.client.sorters.base import SorterBase, SortSpec
 
 
@@ -174,3 +178,127 @@ class TestSorterBase(unittest.TestCase):
 
         srted = self.sortercls(('!bar',)).apply(items, item_getter=item_getter)
         self.assertEqual(tuple(obj.id for obj in srted), (1, 2, 3))
+
+    def test_single_pass_is_equivalent_to_consecutive_sorts(self):
+        rng = random.Random(0)
+        items = [{'id': i, 'foo': rng.choice('abc'), 'bar': rng.randint(0, 3)}
+                 for i in range(100)]
+        for sortstrings in (('foo', 'bar'), ('!foo', 'bar'), ('foo', '!bar'), ('!foo', '!bar'),
+                            ('bar', 'foo'), ('!bar', 'foo'), ('bar', '!foo'), ('!bar', '!foo')):
+            self.sortercls.DEFAULT_SORT = None
+            exp = list(items)
+            for sortstring in sortstrings:
+                key, reverse = sortstring.lstrip('!'), sortstring.startswith('!')
+                exp = sorted(exp, key=lambda item: item[key], reverse=reverse)
+            self.assertEqual([i['id'] for i in self.sortercls(sortstrings).apply(items)],
+                             [i['id'] for i in exp], msg=sortstrings)
+
+    def test_values_that_are_only_ordered_by_less_than(self):
+        class Rank(tuple):
+            # Equal to other Ranks with the same tail but ordered by the first element
+            def __lt__(self, other):
+                return self[0] < other[0]
+        items = [{'id': 1, 'foo': Rank((1, 'x')), 'bar': 'b'},
+                 {'id': 2, 'foo': Rank((1, 'y')), 'bar': 'a'},
+                 {'id': 3, 'foo': Rank((0, 'z')), 'bar': 'c'}]
+        self.sortercls.DEFAULT_SORT = None
+        self.assert_sorted(items, ('bar', 'foo'), (3, 2, 1))
+        self.assert_sorted(items, ('!bar', 'foo'), (3, 1, 2))
+        self.assert_sorted(items, ('bar', '!foo'), (2, 1, 3))
+
+    def test_unchanged_items_are_not_sorted_again(self):
+        class List(list):
+            assignments = 0
+
+            def __setitem__(self, index, value):
+                self.assignments += 1
+                super().__setitem__(index, value)
+
+        items = List([{'id': 1, 'foo': 'c', 'bar': 'x'},
+                      {'id': 2, 'foo': 'a', 'bar': 'y'},
+                      {'id': 3, 'foo': 'b', 'bar': 'z'}])
+        sorter = self.sortercls(('bar', 'foo'))
+        sorter.apply(items, inplace=True)
+        self.assertEqual(tuple(item['id'] for item in items), (2, 3, 1))
+        self.assertEqual(items.assignments, 1)
+
+        sorter.apply(items, inplace=True)
+        self.assertEqual(items.assignments, 1)
+
+        items[0]['bar'] = 'a'
+        sorter.apply(items, inplace=True)
+        self.assertEqual(tuple(item['id'] for item in items), (2, 3, 1))
+        self.assertEqual(items.assignments, 1)
+
+        items[0]['foo'] = 'd'
+        sorter.apply(items, inplace=True)
+        self.assertEqual(tuple(item['id'] for item in items), (3, 1, 2))
+        self.assertEqual(items.assignments, 2)
+
+    def test_sorted_items_are_not_sorted_again(self):
+        items = [{'id': 1, 'foo': 'c', 'bar': 'x'},
+                 {'id': 2, 'foo': 'a', 'bar': 'y'},
+                 {'id': 3, 'foo': 'b', 'bar': 'z'}]
+        sorter = self.sortercls(('bar', 'foo'))
+        with patch.object(base, '_composite_keys', wraps=base._composite_keys) as composite_keys:
+            items = sorter.apply(items)
+            self.assertEqual(composite_keys.call_count, 1)
+            sorter.apply(items)
+            self.assertEqual(composite_keys.call_count, 1)
+
+    def test_changes_that_are_equal_but_not_ordered_equally_are_sorted_again(self):
+        class Rank():
+            # Always equal but ordered by `value`
+            def __init__(self, value):
+                self.value = value
+
+            def __lt__(self, other):
+                return self.value < other.value
+
+            def __eq__(self, other):
+                return True
+
+        items = [{'id': 1, 'foo': Rank(2), 'bar': 'x'},
+                 {'id': 2, 'foo': Rank(0), 'bar': 'y'},
+                 {'id': 3, 'foo': Rank(1), 'bar': 'z'}]
+        self.sortercls.DEFAULT_SORT = None
+        sorter = self.sortercls(('foo',))
+        for _ in range(2):
+            items = sorter.apply(items)
+            self.assertEqual(tuple(item['id'] for item in items), (2, 3, 1))
+        items[0]['foo'] = Rank(3)
+        items = sorter.apply(items)
+        self.assertEqual(tuple(item['id'] for item in items), (3, 1, 2))
+
+    def test_sorted_items_are_not_kept_alive(self):
+        class Item(dict):
+            pass
+
+        items = [Item(id=1, foo='b', bar='x'), Item(id=2, foo='a', bar='y')]
+        sorter = self.sortercls(('foo',))
+        sorter.apply(sorter.apply(items))
+        refs = [weakref.ref(item) for item in items]
+        del items
+        gc.collect()
+        self.assertEqual([ref() for ref in refs], [None, None])
+
+    def test_unsorted_items_are_sorted_again(self):
+        items = [{'id': 1, 'foo': 'c', 'bar': 'x'},
+                 {'id': 2, 'foo': 'a', 'bar': 'y'},
+                 {'id': 3, 'foo': 'b', 'bar': 'z'}]
+        sorter = self.sortercls(('foo',))
+        for _ in range(3):
+            self.assertEqual(tuple(item['id'] for item in sorter.apply(items)), (2, 3, 1))
+        self.assertEqual(tuple(item['id'] for item in items), (1, 2, 3))
+
+    def test_keys(self):
+        rng = random.Random(0)
+        items = [{'id': i, 'foo': rng.choice('abc'), 'bar': rng.randint(0, 3)}
+                 for i in range(100)]
+        for sortstrings in (('foo',), ('!foo',), ('foo', '!bar'), ('!bar', 'foo'), ('!foo', '!bar')):
+            sorter = self.sortercls(sortstrings)
+            exp = [(i['foo'], i['bar']) for i in sorter.apply(items)]
+            keys = sorter.keys(items)
+            self.assertEqual([(items[i]['foo'], items[i]['bar'])
+                              for i in sorted(range(len(items)), key=keys.__getitem__)], exp,
+                             msg=sortstrings)
@@ -1,5 +1,6 @@
 import asyncio
 from types import SimpleNamespace
+from unittest.mock import patch
 
 import asynctest
 
@@ -20,16 +21,28 @@ class FakeTorrentAPI():
         self.calls = 0
         self.arg_torrents = None
         self.arg_keys = None
+        self.arg_incremental = None
+        self.arg_split_fields = None
+        self.requests = []
+        self.generation = 0
         self.exc = None
         self.tlist = FAKE_TORRENTS
         self.delay = 0
 
-    async def torrents(self, torrents=None, keys='ALL'):
+    async def torrents(self, torrents=None, keys='ALL', from_cache=False, incremental=False,
+                       split_fields=False):
         if self.delay:
             await asyncio.sleep(self.delay)
+        self.requests.append({'torrents': torrents, 'keys': keys, 'from_cache': from_cache})
+        self.generation += 1
+        if isinstance(torrents, tuple):
+            tlist = tuple(t for t in self.tlist if t['id'] in torrents)
+            return Response(success=bool(tlist), torrents=tlist)
         self.calls += 1
         self.arg_torrents = torrents
         self.arg_keys = keys
+        self.arg_incremental = incremental
+        self.arg_split_fields = split_fields
         if self.exc is None:
             return Response(success=False, torrents=self.tlist)
         else:
@@ -123,6 +136,36 @@ class TestTorrentRequestPool(asynctest.ClockedTestCase):
 
         await self.rp.stop()
 
+    async def test_incremental_requests(self):
+        await self.rp.start()
+        foo = Subscriber('name~foo', 'name', 'rate-down')
+        self.rp.register('foo', foo.callback, keys=foo.keys, tfilter=foo.tfilter)
+        await self.advance(self.rp.interval)
+        self.assertEqual(self.api.arg_incremental, False)
+
+        self.rp.incremental = True
+        await self.advance(self.rp.interval)
+        self.assertEqual(self.api.arg_incremental, True)
+        self.assert_api_request(tfilter=foo.tfilter, keys=foo.keys_needed)
+
+        self.rp.incremental = False
+        await self.advance(self.rp.interval)
+        self.assertEqual(self.api.arg_incremental, False)
+        await self.rp.stop()
+
+    async def test_split_fields_requests(self):
+        await self.rp.start()
+        foo = Subscriber('name~foo', 'name', 'rate-down')
+        self.rp.register('foo', foo.callback, keys=foo.keys, tfilter=foo.tfilter)
+        await self.advance(self.rp.interval)
+        self.assertEqual(self.api.arg_split_fields, False)
+
+        self.rp.split_fields = True
+        await self.advance(self.rp.interval)
+        self.assertEqual(self.api.arg_split_fields, True)
+        self.assert_api_request(tfilter=foo.tfilter, keys=foo.keys_needed)
+        await self.rp.stop()
+
     async def test_autoremoving_requests(self):
         await self.rp.start()
         self.assertEqual(self.rp.running, True)
@@ -177,6 +220,60 @@ class TestTorrentRequestPool(asynctest.ClockedTestCase):
 
         await self.rp.stop()
 
+    async def test_equal_filters_are_applied_once(self):
+        await self.rp.start()
+        foo1 = Subscriber('name~foo', 'name')
+        foo2 = Subscriber('name~foo', 'rate-up')
+        bar = Subscriber('name~bar', 'name')
+        self.rp.register('foo1', foo1.callback, keys=foo1.keys, tfilter=foo1.tfilter)
+        self.rp.register('foo2', foo2.callback, keys=foo2.keys, tfilter=foo2.tfilter)
+        self.rp.register('bar', bar.callback, keys=bar.keys, tfilter=bar.tfilter)
+        with patch.object(TorrentFilter, 'apply', autospec=True,
+                          side_effect=TorrentFilter.apply) as apply:
+            await self.advance(0)
+        self.assertEqual(str(self.api.arg_torrents), '~foo|~bar')
+        self.assertEqual(apply.call_count, 2)
+        self.assertEqual(foo1.callback.args, (FAKE_TORRENTS[0],))
+        self.assertIs(foo1.callback.args, foo2.callback.args)
+        self.assertEqual(bar.callback.args, (FAKE_TORRENTS[1],))
+        await self.rp.stop()
+
+    async def test_background_subscriber(self):
+        self.rp.max_interval = 4
+        foo = Subscriber('name~foo', 'name')
+        bar = Subscriber('name~bar', 'rate-up')
+        self.rp.register('foo', foo.callback, keys=foo.keys, tfilter=foo.tfilter)
+        self.rp.register('bar', bar.callback, keys=bar.keys, tfilter=bar.tfilter)
+        self.rp.set_background('bar', True)
+        await self.rp.start()
+        await self.advance(0)
+        self.assertEqual((foo.callback.calls, bar.callback.calls), (1, 1))
+        self.assert_api_request(tfilter=(foo + bar).tfilter)
+
+        await self.advance(3)
+        self.assertEqual((foo.callback.calls, bar.callback.calls), (4, 1))
+        self.assert_api_request(tfilter=foo.tfilter, keys=foo.keys_needed)
+        await self.advance(1)
+        self.assertEqual((foo.callback.calls, bar.callback.calls), (5, 2))
+        self.assert_api_request(tfilter=(foo + bar).tfilter)
+
+        # Focusing a background subscriber polls immediately
+        self.rp.set_background('bar', False)
+        await self.advance(0)
+        self.assertEqual((foo.callback.calls, bar.callback.calls), (6, 3))
+        await self.advance(1)
+        self.assertEqual((foo.callback.calls, bar.callback.calls), (7, 4))
+        await self.rp.stop()
+
+    async def test_background_subscribers_without_max_interval(self):
+        foo = Subscriber('name~foo', 'name')
+        self.rp.register('foo', foo.callback, keys=foo.keys, tfilter=foo.tfilter)
+        self.rp.set_background('foo', True)
+        await self.rp.start()
+        await self.advance(2)
+        self.assertEqual(foo.callback.calls, 3)
+        await self.rp.stop()
+
     async def test_raising_fatal_exception(self):
         self.api.exc = RuntimeError('Something is wrong!')
         await self.rp.start()
@@ -231,3 +328,112 @@ class TestTorrentRequestPool(asynctest.ClockedTestCase):
         self.assertEqual(self.api.calls, apicalls + 1)
 
         await self.rp.stop()
+
+
+class TestPooledPoller(asynctest.ClockedTestCase):
+    async def setUp(self):
+        self.api = FakeTorrentAPI()
+        srvapi = SimpleNamespace(torrent=self.api)
+        self.rp = TorrentRequestPool(srvapi)
+
+    async def tearDown(self):
+        await self.rp.stop()
+
+    def rpc_requests(self):
+        return [r for r in self.api.requests if not r['from_cache']]
+
+    async def test_invalid_torrents_argument(self):
+        with self.assertRaises(ValueError):
+            self.rp.create_poller(('foo',), keys=('name',))
+
+    async def test_starting_poller_starts_pool(self):
+        poller = self.rp.create_poller((1,), keys=('name',))
+        self.assertEqual(poller.running, False)
+        await poller.start()
+        self.assertEqual(poller.running, True)
+        self.assertEqual(self.rp.running, True)
+
+    async def test_pollers_with_same_keys_are_merged(self):
+        poller1 = self.rp.create_poller((1,), keys=('name',))
+        poller2 = self.rp.create_poller((3,), keys=('name',))
+        cb1, cb2 = FakeCallback(), FakeCallback()
+        poller1.on_response(cb1)
+        poller2.on_response(cb2)
+        await poller1.start()
+        await poller2.start()
+        await self.advance(self.rp.interval)
+
+        self.assertEqual(self.rpc_requests()[-1], {'torrents': (1, 3), 'keys': ('name',),
+                                                   'from_cache': False})
+        self.assertEqual(cb1.args.torrents, (FAKE_TORRENTS[0],))
+        self.assertEqual(cb2.args.torrents, (FAKE_TORRENTS[2],))
+
+    async def test_pollers_with_different_keys_are_not_merged(self):
+        poller1 = self.rp.create_poller((1,), keys=('name',))
+        poller2 = self.rp.create_poller((3,), keys=('name', 'files'))
+        await poller1.start()
+        await poller2.start()
+        await self.advance(0)
+        self.api.requests.clear()
+        await self.advance(self.rp.interval)
+
+        self.assertEqual(sorted(self.rpc_requests(), key=lambda r: r['torrents']),
+                         [{'torrents': (1,), 'keys': ('name',), 'from_cache': False},
+                          {'torrents': (3,), 'keys': ('name', 'files'), 'from_cache': False}])
+
+    async def test_pollers_and_subscribers_are_polled_together(self):
+        sub = Subscriber('name~foo', 'name', 'rate-down')
+        self.rp.register('foo', sub.callback, keys=sub.keys, tfilter=sub.tfilter)
+        poller = self.rp.create_poller((2,), keys=('name',))
+        cb = FakeCallback()
+        poller.on_response(cb)
+        await poller.start()
+        await self.advance(0)
+        calls = sub.callback.calls
+        self.api.requests.clear()
+        await self.advance(self.rp.interval)
+
+        self.assertEqual(len(self.rpc_requests()), 2)
+        self.assertEqual(sub.callback.calls, calls + 1)
+        self.assertEqual(cb.args.torrents, (FAKE_TORRENTS[1],))
+
+    async def test_stopping_poller(self):
+        poller = self.rp.create_poller((1,), keys=('name',))
+        cb = FakeCallback()
+        poller.on_response(cb)
+        await poller.start()
+        await self.advance(0)
+        self.assertEqual(cb.args.torrents, (FAKE_TORRENTS[0],))
+
+        await poller.stop()
+        self.assertEqual(poller.running, False)
+        self.assertEqual(cb.args, None)
+        self.api.requests.clear()
+        await self.advance(self.rp.interval)
+        self.assertEqual(self.api.requests, [])
+
+    async def test_background_poller(self):
+        self.rp.max_interval = 4
+        poller1 = self.rp.create_poller((1,), keys=('name',))
+        poller2 = self.rp.create_poller((3,), keys=('files',))
+        cb1, cb2 = FakeCallback(), FakeCallback()
+        poller1.on_response(cb1)
+        poller2.on_response(cb2)
+        poller2.background = True
+        await poller1.start()
+        await poller2.start()
+        await self.advance(0)
+        self.assertEqual((cb1.calls, cb2.calls), (1, 1))
+
+        await self.advance(3)
+        self.assertEqual((cb1.calls, cb2.calls), (4, 1))
+        self.assertNotIn((3,), [r['torrents'] for r in self.api.requests[2:]])
+        await self.advance(1)
+        self.assertEqual((cb1.calls, cb2.calls), (5, 2))
+
+        # Focusing a background poller polls immediately
+        poller2.background = False
+        await self.advance(0)
+        self.assertEqual((cb1.calls, cb2.calls), (6, 3))
+        await self.advance(1)
+        self.assertEqual((cb1.calls, cb2.calls), (7, 4))
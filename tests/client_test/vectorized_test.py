@@ -0,0 +1,123 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from stig.client import vectorized
+from stig.client.filters.base import BoolFilterSpec, CmpFilterSpec, Filter, FilterChain
+from stig.client.sorters.torrent import TorrentSorter
+from stig.client.utils import Percent, SizeInBytes, Timestamp
+
+
+def make_items(count, seed=0):
+    rng = random.Random(seed)
+    return tuple({'id': i,
+                  'name': rng.choice(('foo', 'Foo', 'bar', 'baz', 'Bar')) + str(rng.randint(0, 9)),
+                  'size-final': SizeInBytes(rng.choice((0, 1e6, 5e6, rng.randint(0, 1e9)))),
+                  '%downloaded': Percent(rng.choice((0, 50, 100, rng.random() * 100))),
+                  '%metadata': Percent(100), '%verified': Percent(0),
+                  'rate-down': rng.choice((0, 0, rng.randint(0, 1e6))),
+                  'time-added': Timestamp(1500000000 + rng.randint(0, 1e7)),
+                  'tags': iter(())}
+                 for i in range(count))
+
+
+@unittest.skipIf(vectorized.numpy is None, 'NumPy is not installed')
+class TestVectorizedFilterChain(unittest.TestCase):
+    def setUp(self):
+        class FooFilter(Filter):
+            BOOLEAN_FILTERS = {'downloading': BoolFilterSpec(lambda i: i['rate-down'] > 0),
+                               'all': BoolFilterSpec(None, aliases=('*',))}
+            COMPARATIVE_FILTERS = {'name': CmpFilterSpec(value_type=str, value_getter=lambda i: i['name']),
+                                   'size': CmpFilterSpec(value_type=SizeInBytes,
+                                                         value_getter=lambda i: i['size-final']),
+                                   '%downloaded': CmpFilterSpec(value_type=Percent,
+                                                                value_getter=lambda i: i['%downloaded']),
+                                   'rate-down': CmpFilterSpec(value_type=int,
+                                                              value_getter=lambda i: i['rate-down']),
+                                   'mixed': CmpFilterSpec(value_type=int,
+                                                          value_getter=lambda i: i['tags'] if i['id'] % 2
+                                                          else i['rate-down'])}
+            DEFAULT_FILTER = 'name'
+
+        class FooFilterChain(FilterChain):
+            filterclass = FooFilter
+
+        self.f = FooFilterChain
+        self.items = make_items(1000)
+
+    def tearDown(self):
+        vectorized.use(True)
+
+    def test_same_results_as_pure_python(self):
+        for filter_str in ('size>1M', 'size<=1M', '%downloaded=100', '!%downloaded=100',
+                           'rate-down>100000&size>1M', 'size=0|%downloaded<50',
+                           'foo&size>1M|downloading&%downloaded!>=50', 'rate-down|size>1G',
+                           'mixed>0', 'name=~^b&size>1M', 'size>'):
+            vectorized.use(True)
+            with patch.object(vectorized, 'MIN_ITEMS', 0):
+                result = tuple(self.f(filter_str).apply(self.items))
+            vectorized.use(False)
+            exp = tuple(self.f(filter_str).apply(self.items))
+            self.assertEqual(result, exp, msg=filter_str)
+
+    def test_vectorized_comparison_is_only_used_for_plain_numbers(self):
+        fchain = self.f('size>1M&name=foo&%downloaded<50&downloading')
+        comparisons = [f._vector_comparison() for f in fchain._filterchains[0]]
+        self.assertEqual(comparisons[0][1:], (fchain._filterchains[0][0].OPERATORS['>'], 1e6))
+        self.assertIsNone(comparisons[1])
+        self.assertEqual(comparisons[2][2], 50)
+        self.assertIsNone(comparisons[3])
+
+    def test_short_lists_are_filtered_in_pure_python(self):
+        with patch.object(self.f, '_apply_vectorized') as mock_apply:
+            tuple(self.f('size>1M').apply(self.items[:vectorized.MIN_ITEMS - 1]))
+        mock_apply.assert_not_called()
+
+
+@unittest.skipIf(vectorized.numpy is None, 'NumPy is not installed')
+class TestVectorizedSorter(unittest.TestCase):
+    def setUp(self):
+        self.items = list(make_items(1000, seed=1))
+        random.Random(2).shuffle(self.items)
+
+    def tearDown(self):
+        vectorized.use(True)
+
+    def test_same_results_as_pure_python(self):
+        for sortstrings in (('name',), ('!name',), ('size',), ('!size',), ('%downloaded',),
+                            ('size', '!rate-down'), ('!%downloaded', 'name', '!size'),
+                            ('added',), ('!added', 'size')):
+            vectorized.use(True)
+            with patch.multiple(vectorized, MIN_ITEMS=0, MIN_SORT_KEYS=0), \
+                 patch.object(vectorized, 'sort_indexes', wraps=vectorized.sort_indexes) as sort_indexes:
+                result = [i['id'] for i in TorrentSorter(sortstrings).apply(self.items)]
+            self.assertTrue(sort_indexes.called, msg=sortstrings)
+            vectorized.use(False)
+            exp = [i['id'] for i in TorrentSorter(sortstrings).apply(self.items)]
+            self.assertEqual(result, exp, msg=sortstrings)
+
+    def test_inplace_and_item_getter(self):
+        widgets = [(item,) for item in self.items]
+        exp = [w[0]['id'] for w in TorrentSorter(('!size',)).apply(widgets, item_getter=lambda w: w[0])]
+        with patch.multiple(vectorized, MIN_ITEMS=0, MIN_SORT_KEYS=0):
+            TorrentSorter(('!size',)).apply(widgets, inplace=True, item_getter=lambda w: w[0])
+        self.assertEqual([w[0]['id'] for w in widgets], exp)
+
+    def test_unsupported_values_fall_back_to_pure_python(self):
+        self.assertIsNone(vectorized.sort_indexes([([1, 2, 3], False), ([(1,), (2,), (3,)], False)]))
+        self.assertIsNone(vectorized.sort_indexes([([Timestamp(1), Timestamp(2)], False)]))
+        self.assertEqual(vectorized.sort_indexes([([3, 1, 2], False)]), [1, 2, 0])
+        self.assertEqual(vectorized.sort_indexes([(['b', 'c', 'a'], True)]), [1, 0, 2])
+
+
+class TestUse(unittest.TestCase):
+    def tearDown(self):
+        vectorized.use(vectorized.numpy is not None)
+
+    def test_enabling_without_numpy(self):
+        with patch.object(vectorized, 'numpy', None):
+            with self.assertRaises(ValueError) as cm:
+                vectorized.use(True)
+            self.assertEqual(str(cm.exception), 'NumPy is not installed')
+            vectorized.use(False)
+            self.assertFalse(vectorized.enabled())
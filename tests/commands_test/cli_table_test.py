@@ -0,0 +1,138 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from stig.client.utils import SizeInBytes
+from stig.commands.cli import _table
+from stig.views import ColumnBase
+
+
+class Name(ColumnBase):
+    header = {'left': 'Name'}
+    needed_keys = ('name',)
+
+    def get_value(self):
+        return self.data['name']
+
+
+class Ratio(ColumnBase):
+    header = {'right': 'Ratio'}
+    needed_keys = ('ratio', 'name')
+
+    def get_value(self):
+        return self.data['ratio']
+
+
+COLUMNS = {'name': Name, 'ratio': Ratio}
+ITEMS = ({'name': 'foo', 'ratio': 1.5},
+         {'name': 'bar, baz', 'ratio': float('inf')})
+
+
+class Test_print_table_with_tty(unittest.TestCase):
+    def print_table(self, items, columns):
+        stdout = io.StringIO()
+        with patch.object(_table, 'TERMSIZE', SimpleNamespace(columns=columns, lines=50)):
+            with redirect_stdout(stdout):
+                _table.print_table(items, ['name', 'ratio'], COLUMNS)
+        return stdout.getvalue()
+
+    def test_columns_are_as_wide_as_widest_value(self):
+        self.assertEqual(self.print_table(ITEMS, columns=80),
+                         '\033[1;4mName    │Ratio\033[0m\n'
+                         '     foo│  1.5\n'
+                         'bar, baz│  inf\n')
+
+    def test_widest_column_is_shrunk_to_fit(self):
+        self.assertEqual(self.print_table(ITEMS, columns=12),
+                         '\033[1;4mName  │Ratio\033[0m\n'
+                         '   foo│  1.5\n'
+                         'r, baz│  inf\n')
+
+
+class Test_print_table_without_tty(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(_table, 'TERMSIZE', SimpleNamespace(columns=None, lines=None))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def print_table(self, items, **kwargs):
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            _table.print_table(items, ('name', 'ratio'), COLUMNS, **kwargs)
+        return stdout.getvalue()
+
+    def test_tsv(self):
+        self.assertEqual(self.print_table(ITEMS),
+                         'foo\t1.5\n'
+                         'bar, baz\tinf\n')
+
+    def test_csv(self):
+        self.assertEqual(self.print_table(ITEMS, format='csv'),
+                         'name,ratio\n'
+                         'foo,1.5\n'
+                         '"bar, baz",inf\n')
+
+    def test_jsonl(self):
+        lines = self.print_table(ITEMS, format='jsonl').splitlines()
+        self.assertEqual([json.loads(line) for line in lines],
+                         [{'name': 'foo', 'ratio': 1.5},
+                          {'name': 'bar, baz', 'ratio': None}])
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            self.print_table(ITEMS, format='xml')
+
+    def test_rows_are_printed_while_items_are_iterated(self):
+        stdout = io.StringIO()
+
+        def items():
+            yield ITEMS[0]
+            self.assertEqual(stdout.getvalue(), 'foo\t1.5\n')
+            yield ITEMS[1]
+
+        with redirect_stdout(stdout):
+            _table.print_table(items(), ('name', 'ratio'), COLUMNS)
+        self.assertEqual(stdout.getvalue(), 'foo\t1.5\nbar, baz\tinf\n')
+
+
+class Test_print_records(unittest.TestCase):
+    def print_records(self, items, format):
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            _table.print_records(items, ('ratio', 'name'), COLUMNS, format)
+        return stdout.getvalue()
+
+    def test_fields_are_needed_keys(self):
+        self.assertEqual(self.print_records(ITEMS, 'csv'),
+                         'ratio,name\n'
+                         '1.5,foo\n'
+                         'inf,"bar, baz"\n')
+
+    def test_cells_are_not_created(self):
+        with patch.object(Name, '__init__', side_effect=AssertionError('cell created')):
+            self.print_records(ITEMS, 'jsonl')
+
+    def test_numbers_are_written_without_unit(self):
+        items = ({'name': 'foo', 'ratio': SizeInBytes(1500)},)
+        self.assertEqual(self.print_records(items, 'csv'),
+                         'ratio,name\n'
+                         '1500,foo\n')
+
+    def test_json(self):
+        self.assertEqual(json.loads(self.print_records(ITEMS, 'json')),
+                         [{'ratio': 1.5, 'name': 'foo'},
+                          {'ratio': None, 'name': 'bar, baz'}])
+
+    def test_json_without_items(self):
+        self.assertEqual(json.loads(self.print_records((), 'json')), [])
+
+    def test_nested_values(self):
+        items = ({'name': ('a', 'b'), 'ratio': {'x': float('nan')}},)
+        self.assertEqual(json.loads(self.print_records(items, 'jsonl')),
+                         {'ratio': {'x': None}, 'name': ['a', 'b']})
+        self.assertEqual(self.print_records(items, 'csv'),
+                         'ratio,name\n'
+                         '"{""x"": null}","[""a"", ""b""]"\n')
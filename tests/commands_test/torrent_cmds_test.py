@@ -264,7 +264,7 @@ class TestListTorrentsCmd(CommandTestCase):
         from stig.commands.cli import torrent
         torrent.TERMSIZE = SimpleNamespace(columns=None, lines=None)
 
-    async def do(self, args, errors):
+    async def do(self, args, errors, stdout=('Some Torrent', 'Another Torrent')):
         tlist = (
             MockTorrent(id=1, name='Some Torrent'),
             MockTorrent(id=2, name='Another Torrent')
@@ -278,8 +278,7 @@ class TestListTorrentsCmd(CommandTestCase):
             self.assert_stdout()
             self.assert_stderr(*errors)
         else:
-            self.assert_stdout('Some Torrent',
-                               'Another Torrent')
+            self.assert_stdout(*stdout)
             self.assert_stderr()
             keys_exp = set(process.mock_tsorter.needed_keys +
                            process.mock_tfilter.needed_keys +
@@ -303,6 +302,17 @@ class TestListTorrentsCmd(CommandTestCase):
     async def test_sort_and_filter(self):
         await self.do(['-s', 'name,size', 'downloading', 'uploading'], errors=())
 
+    async def test_format_csv(self):
+        await self.do(['--format', 'csv'], errors=(),
+                      stdout=('name', 'Some Torrent', 'Another Torrent'))
+
+    async def test_format_jsonl(self):
+        await self.do(['-f', 'jsonl'], errors=(),
+                      stdout=('{"name": "Some Torrent"}', '{"name": "Another Torrent"}'))
+
+    async def test_invalid_format(self):
+        await self.do(['--format', 'xml'], errors=(r"%s: .*'xml'.*" % ListTorrentsCmd.name,))
+
     async def test_invalid_filter(self):
         def bad_select_torrents(self, *args, **kwargs):
             raise ValueError('Nope!')
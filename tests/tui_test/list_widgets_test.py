@@ -0,0 +1,367 @@
+import gc
+import unittest
+from unittest.mock import patch
+
+from stig.client.aiotransmission.torrent import Torrent
+from stig.client.sorters import TorrentSorter
+from stig.tui.keymap import KeyMap
+from stig.tui.table import Table
+from stig.tui.views import base, setting, torrent, torrent_list
+from stig.tui.views.setting_list import SettingItemWidget
+from stig.tui.views.torrent_list import TorrentItemWidget, TorrentListWidget
+
+from ._handle_urwidpatches import setUpModule, tearDownModule  # noqa: F401
+from .resources_tui import get_canvas_text
+
+SIZE = (80, 6)  # Header + 5 items
+
+
+class FakeBottombarItem():
+    def update(self, *args, **kwargs):
+        pass
+
+
+class FakeBottombar():
+    marked = FakeBottombarItem()
+
+
+class FakeRequestPool():
+    def requested_keys(self, *args, **kwargs):
+        return set()
+
+    def register(self, *args, **kwargs):
+        pass
+
+    def remove(self, *args, **kwargs):
+        pass
+
+    def poll(self):
+        pass
+
+
+class FakeAPI():
+    treqpool = FakeRequestPool()
+
+
+def make_torrents(*names, first_id=1):
+    # Raw values needed by the "name" column
+    return [Torrent({'id': tid, 'name': name, 'status': 0, 'percentDone': 0,
+                     'metadataPercentComplete': 1, 'recheckProgress': 0,
+                     'rateDownload': 0, 'rateUpload': 0, 'peersConnected': 0,
+                     'isPrivate': False, 'error': 0, 'errorString': ''})
+            for tid,name in enumerate(names, start=first_id)]
+
+
+def make_setting(name, value):
+    return {'id': name, 'value': value, 'default': 0, 'description': 'Some setting'}
+
+
+class TestItemWidgetBase(unittest.TestCase):
+    def make_item(self, ItemClass, tuicolumns, columns, data):
+        table = Table(**tuicolumns)
+        table.columns = columns
+        table.register(data['id'])
+        row = table.get_row(data['id'])
+        return ItemClass(data, row), row
+
+    def test_update_changes_cells_when_rendered(self):
+        t1, t2 = make_torrents('foo') + make_torrents('bar')
+        widget, cells = self.make_item(TorrentItemWidget, torrent.TUICOLUMNS, ('name',), t1)
+        self.assertEqual(cells.name.status[0], 'foo')
+        widget.update(t2)
+        self.assertEqual(cells.name.status[0], 'foo')
+        self.assertIs(widget.data, t2)
+        canv = widget.render((80,))
+        self.assertEqual(cells.name.status[0], 'bar')
+        self.assertIn('bar', get_canvas_text(list(canv.content())))
+
+    def test_update_changes_cells_when_rows_are_counted(self):
+        t1, t2 = make_torrents('foo') + make_torrents('bar')
+        widget, cells = self.make_item(TorrentItemWidget, torrent.TUICOLUMNS, ('name',), t1)
+        widget.update(t2)
+        self.assertEqual(cells.name.status[0], 'foo')
+        self.assertEqual(widget.rows((80,)), 1)
+        self.assertEqual(cells.name.status[0], 'bar')
+
+    def test_setting_item_widget_properties_get_current_data(self):
+        widget, _ = self.make_item(SettingItemWidget, setting.TUICOLUMNS, ('name', 'value'),
+                                   make_setting('foo', 10))
+        self.assertEqual(widget.name, 'foo')
+        self.assertEqual(widget.value_widget.text.text, '10')
+        widget.update(make_setting('foo', 20))
+        self.assertEqual(widget.value_widget.text.text, '20')
+        widget.recycle(make_setting('bar', 30))
+        self.assertEqual(widget.name, 'bar')
+        self.assertEqual(widget.value_widget.text.text, '30')
+
+
+class TestListWidgetBase(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(base, 'bottombar', FakeBottombar())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(base.ListWidgetBase, 'widget_pool', base.ItemWidgetPool())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Lists only share widgets if they use the same keymap
+        self.keymap = KeyMap()
+
+    def make_list(self, columns=('marked', 'name')):
+        return TorrentListWidget(FakeAPI(), self.keymap, sort=TorrentSorter(('name',)),
+                                 columns=columns)
+
+    def make_names(self, count):
+        return ['torrent %03d' % i for i in range(count)]
+
+    def get_names(self, tlist):
+        return [w.data['name'] for w in tlist._listbox.body]
+
+    def get_widget(self, tlist, name):
+        for w in tlist._existing_widgets:
+            if w.data['name'] == name:
+                return w
+        raise AssertionError('No widget for %r' % (name,))
+
+    def test_only_displayed_items_are_built(self):
+        tlist = self.make_list()
+        tlist._handle_torrents(make_torrents(*self.make_names(50)))
+        tlist.render(SIZE)
+        self.assertEqual(tlist.count, 50)
+        self.assertEqual([w.is_built for w in tlist._listbox.body],
+                         [True] * 5 + [False] * 45)
+
+    def test_rows_does_not_build_item(self):
+        tlist = self.make_list()
+        tlist._handle_torrents(make_torrents(*self.make_names(50)))
+        tlist.render(SIZE)
+        widget = tlist._listbox.body[-1]
+        self.assertEqual(widget.rows((80,)), 1)
+        self.assertFalse(widget.is_built)
+
+    def test_mark_all_with_unbuilt_items(self):
+        tlist = self.make_list()
+        tlist._handle_torrents(make_torrents(*self.make_names(50)))
+        tlist.render(SIZE)
+        tlist.mark(all=True)
+        self.assertEqual(tlist.marked_count, 50)
+        self.assertTrue(all(w.is_marked for w in tlist._listbox.body))
+
+        # Items that are built later display the mark
+        widget = tlist._listbox.body[-1]
+        self.assertFalse(widget.is_built)
+        tlist.focus_position = 49
+        tlist.render(SIZE)
+        self.assertTrue(widget.is_built)
+        self.assertTrue(widget._cells.marked.is_marked)
+
+        tlist.unmark(all=True)
+        self.assertEqual(tlist.marked_count, 0)
+        self.assertFalse(any(w.is_marked for w in tlist._listbox.body))
+
+    def test_is_marked_without_marked_column(self):
+        tlist = self.make_list(columns=('name',))
+        tlist._handle_torrents(make_torrents(*self.make_names(50)))
+        tlist.render(SIZE)
+        tlist.focus_position = 49
+        widget = tlist.focused_widget
+        self.assertFalse(widget.is_built)
+        self.assertFalse(widget.is_marked)
+
+        tlist.mark()
+        self.assertFalse(widget.is_built)
+        self.assertTrue(widget.is_marked)
+        tlist.render(SIZE)
+        self.assertTrue(widget.is_built)
+        self.assertTrue(widget.is_marked)
+
+        tlist.mark(toggle=True)
+        self.assertFalse(widget.is_marked)
+        self.assertEqual(tlist.marked_count, 0)
+
+    def test_focused_id(self):
+        tlist = self.make_list()
+        self.assertEqual(tlist.focused_id, None)
+        self.assertEqual(tlist.focused_torrent_id, None)
+
+        # IDs are in reverse order of names
+        names = self.make_names(50)
+        torrents = make_torrents(*reversed(names))
+        tlist._handle_torrents(torrents)
+        tlist.render(SIZE)
+        tlist.focus_position = 30
+        self.assertFalse(tlist.focused_widget.is_built)
+        self.assertEqual(tlist.focused_id, 20)
+        self.assertEqual(tlist.focused_torrent_id, 20)
+
+        # Focus stays on the same torrent when other torrents are added
+        tlist._handle_torrents(torrents + make_torrents('a', 'b', first_id=51))
+        tlist.render(SIZE)
+        self.assertEqual(tlist.focus_position, 32)
+        self.assertEqual(tlist.focused_id, 20)
+        self.assertEqual(tlist.focused_torrent_id, 20)
+
+    def test_secondary_filter_hides_and_unhides_items(self):
+        names = self.make_names(30)
+        tlist = self.make_list()
+        tlist._handle_torrents(make_torrents(*reversed(names)))
+        tlist.render(SIZE)
+        self.assertEqual(self.get_names(tlist), names)
+
+        tlist.secondary_filter = 'name~5'
+        tlist.render(SIZE)
+        self.assertEqual(self.get_names(tlist), ['torrent 005', 'torrent 015', 'torrent 025'])
+        self.assertEqual(tlist.count, 3)
+        self.assertEqual(len(tlist._hidden_widgets), 27)
+
+        tlist.secondary_filter = 'name~1'
+        tlist.render(SIZE)
+        self.assertEqual(self.get_names(tlist), [n for n in names if '1' in n])
+        self.assertEqual(tlist.count, 12)
+        self.assertEqual(len(tlist._hidden_widgets), 18)
+
+        tlist.secondary_filter = None
+        tlist.render(SIZE)
+        self.assertEqual(self.get_names(tlist), names)
+        self.assertEqual(tlist.count, 30)
+        self.assertEqual(len(tlist._hidden_widgets), 0)
+
+    def test_first_item_is_focused_when_empty_list_is_filled(self):
+        tlist = self.make_list()
+        tlist.render(SIZE)
+        self.assertEqual(tlist.focused_widget, None)
+        tlist._handle_torrents(make_torrents(*self.make_names(10)))
+        tlist.render(SIZE)
+        self.assertEqual(tlist.focus_position, 0)
+        self.assertEqual(tlist.focused_widget.data['name'], 'torrent 000')
+
+        # Same when all items were hidden
+        tlist.secondary_filter = 'name~nothing'
+        tlist.render(SIZE)
+        self.assertEqual(tlist.focused_widget, None)
+        tlist.secondary_filter = None
+        tlist.render(SIZE)
+        self.assertEqual(tlist.focus_position, 0)
+        self.assertEqual(tlist.focused_widget.data['name'], 'torrent 000')
+
+    def test_removed_items_are_forgotten(self):
+        names = self.make_names(10)
+        torrents = make_torrents(*names)
+        tlist = self.make_list()
+        tlist._handle_torrents(torrents)
+        tlist.secondary_filter = '!name~1'
+        tlist.render(SIZE)
+        tlist.mark(all=True)
+        hidden = self.get_widget(tlist, 'torrent 001')
+        marked = self.get_widget(tlist, 'torrent 002')
+        self.assertIn(hidden, tlist._hidden_widgets)
+        self.assertIn(marked, tlist._marked)
+        self.assertIn(marked, tlist._sort_keys)
+
+        # Remove one hidden and one marked torrent
+        tlist._handle_torrents(torrents[:1] + torrents[3:])
+        tlist.render(SIZE)
+        for w in (hidden, marked):
+            self.assertNotIn(w, tlist._existing_widgets)
+            self.assertNotIn(w, tlist._visible_widgets)
+            self.assertNotIn(w, tlist._hidden_widgets)
+            self.assertNotIn(w, tlist._marked)
+            self.assertNotIn(w, tlist._sort_keys)
+        self.assertEqual(len(tlist._existing_widgets), 8)
+        self.assertEqual(len(tlist._hidden_widgets), 0)
+        self.assertEqual(tlist.marked_count, 8)
+        self.assertEqual(self.get_names(tlist), names[:1] + names[3:])
+
+    def test_only_items_with_new_sort_values_are_repositioned(self):
+        names = self.make_names(10)
+        torrents = make_torrents(*names)
+        tlist = self.make_list()
+        tlist._handle_torrents(torrents)
+        tlist.render(SIZE)
+
+        # Values that the sort order doesn't depend on change
+        for t in torrents:
+            t.update({'rateDownload': 100})
+        tlist._handle_torrents(torrents)
+        with patch.object(tlist._sort, 'keys', wraps=tlist._sort.keys) as keys:
+            tlist.render(SIZE)
+        self.assertEqual(keys.call_args_list, [])
+        self.assertEqual(self.get_names(tlist), names)
+
+        # Only the renamed torrent gets a new sort key
+        torrents[1].update({'name': 'torrent 999'})
+        tlist._handle_torrents(torrents)
+        with patch.object(tlist._sort, 'keys', wraps=tlist._sort.keys) as keys:
+            tlist.render(SIZE)
+        self.assertEqual([[t['name'] for t in args[0]] for args, _ in keys.call_args_list],
+                         [['torrent 999']])
+        self.assertEqual(self.get_names(tlist), names[:1] + names[2:] + ['torrent 999'])
+
+    def test_removed_items_are_recycled(self):
+        tlist = self.make_list()
+        tlist._handle_torrents(make_torrents(*self.make_names(10)))
+        tlist.render(SIZE)
+        tlist.mark(all=True)
+        built = set(w for w in tlist._existing_widgets if w.is_built)
+        self.assertEqual(len(built), 5)
+
+        new_names = ['new %d' % i for i in range(5)]
+        tlist._handle_torrents(make_torrents(*new_names, first_id=11))
+        tlist.render(SIZE)
+        self.assertEqual(tlist._existing_widgets, built)
+        self.assertEqual(len(tlist.widget_pool), 0)
+        self.assertEqual(self.get_names(tlist), new_names)
+        self.assertEqual(tlist.marked_count, 0)
+        for w in tlist._listbox.body:
+            self.assertFalse(w.is_marked)
+            self.assertFalse(w._cells.marked.is_marked)
+            self.assertEqual(w._cells.name.status[0], w.data['name'])
+            self.assertIs(tlist._table.get_row(w.id), w._cells)
+
+    def test_widgets_are_given_to_pool_when_list_is_garbage_collected(self):
+        # Captured log records would keep the list alive
+        with patch.object(torrent_list, 'log'):
+            tlist = self.make_list()
+            tlist._handle_torrents(make_torrents(*self.make_names(10)))
+            tlist.render(SIZE)
+            del tlist
+        gc.collect()
+        # Only displayed items are recycled
+        self.assertEqual(len(base.ListWidgetBase.widget_pool), 5)
+
+        # Lists with other columns can't use them
+        tlist = self.make_list(columns=('name',))
+        tlist._handle_torrents(make_torrents(*self.make_names(10)))
+        tlist.render(SIZE)
+        self.assertEqual(len(base.ListWidgetBase.widget_pool), 5)
+
+        tlist = self.make_list()
+        tlist._handle_torrents(make_torrents(*self.make_names(10)))
+        self.assertEqual(len(base.ListWidgetBase.widget_pool), 5)
+        tlist.render(SIZE)
+        self.assertEqual(len(base.ListWidgetBase.widget_pool), 0)
+        self.assertEqual(sum(w.is_built for w in tlist._listbox.body), 5)
+
+
+class TestItemWidgetPool(unittest.TestCase):
+    def test_widgets_are_stored_per_class_and_columns(self):
+        pool = base.ItemWidgetPool()
+        pool.put(TorrentItemWidget, ('name', 'size'), 'widget1')
+        pool.put(TorrentItemWidget, ('name',), 'widget2')
+        pool.put(SettingItemWidget, ('name',), 'widget3')
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(pool.get(TorrentItemWidget, ('size', 'name')), None)
+        self.assertEqual(pool.get(TorrentItemWidget, ('name',)), 'widget2')
+        self.assertEqual(pool.get(TorrentItemWidget, ('name',)), None)
+        self.assertEqual(pool.get(TorrentItemWidget, ('name', 'size')), 'widget1')
+        self.assertEqual(pool.get(SettingItemWidget, ('name',)), 'widget3')
+        self.assertEqual(len(pool), 0)
+
+    def test_maxsize(self):
+        pool = base.ItemWidgetPool(maxsize=2)
+        for i in range(3):
+            pool.put(TorrentItemWidget, ('name',), 'widget%d' % i)
+            pool.put(TorrentItemWidget, ('size',), 'widget%d' % i)
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(pool.get(TorrentItemWidget, ('name',)), 'widget1')
+        self.assertEqual(pool.get(TorrentItemWidget, ('name',)), 'widget0')
+        self.assertEqual(pool.get(TorrentItemWidget, ('name',)), None)
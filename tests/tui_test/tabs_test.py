@@ -227,6 +227,36 @@ class TestTabs(unittest.TestCase):
         self.tabs.remove(1)
         self.assertEqual(self.tabs.prev_focus.text, 'Tab three')
 
+    def test_on_focus_change(self):
+        focused = []
+
+        def cb(tabs, focus):
+            self.assertIs(tabs, self.tabs)
+            focused.append(focus.text)
+        self.tabs.on_focus_change(cb)
+        self.tabs.focus_position = 0
+        self.assertEqual(focused, ['Tab one'])
+        self.tabs.insert(urwid.Text('Tab 3'), urwid.Text('Tab three'))
+        self.assertEqual(focused, ['Tab one', 'Tab three'])
+        self.tabs.remove(2)
+        self.assertEqual(focused[-1], self.tabs.focus.text)
+
+    def test_on_contents_change(self):
+        focused = []
+
+        def cb(tabs):
+            self.assertIs(tabs, self.tabs)
+            focused.append(tabs.focus.text)
+        self.tabs.on_contents_change(cb)
+        self.tabs.focus_position = 0
+        self.assertEqual(focused, [])
+        self.tabs.insert(urwid.Text('Tab 3'), urwid.Text('Tab three'), focus=False)
+        self.assertEqual(focused, ['Tab one'])
+        self.tabs.insert(urwid.Text('Tab 4'), urwid.Text('Tab four'))
+        self.assertEqual(focused, ['Tab one', 'Tab four'])
+        self.tabs.set_content(urwid.Text('Tab 1'), position=0)
+        self.assertEqual(focused, ['Tab one', 'Tab four', 'Tab four'])
+
     def test_contents_property(self):
         self.assertEqual(tuple(w.text for w in self.tabs.contents),
                          ('Tab one', 'Tab two'))
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from stig.utils import cliparser
@@ -941,6 +942,66 @@ class Test_tokenize(unittest.TestCase):
         self.do(r'::foo bar!!!!:: baz', [r'::foo bar!!!!::', ' ', 'baz'], quotes=('::',), escapes=('!!',))
 
 
+def tokenize_chars(cmdline, maxdelims=None, **kwargs):
+    # Previous implementation of tokenize() that uses Char attributes
+    tokens = []
+    token = []
+    chars = tuple(cliparser._parse(cmdline, **kwargs))
+    maxdelims = float('inf') if maxdelims is None else maxdelims
+    for i,char in enumerate(chars):
+        curdelims = int(len(tokens) / 2)
+        if char.is_delim and char.is_special and curdelims < maxdelims:
+            prev_char = chars[i - 1] if i > 0 else cliparser.Char('')
+            if not prev_char.is_delim or not prev_char.is_special:
+                if token:
+                    tokens.append(''.join(token))
+                token.clear()
+                token[:] = char
+            else:
+                token.append(char)
+            if ''.join(token) == char.delim:
+                if token:
+                    tokens.append(''.join(token))
+                    token.clear()
+            continue
+        token.append(char)
+    if token or not tokens:
+        tokens.append(''.join(token))
+    return tokens
+
+
+class Test_tokenize_against_tokenize_chars(unittest.TestCase):
+    def do(self, alphabet, count=2000, **kwargs):
+        rng = random.Random(alphabet)
+        for _ in range(count):
+            cmdline = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            self.assertEqual(cliparser.tokenize(cmdline, **kwargs),
+                             tokenize_chars(cmdline, **kwargs),
+                             msg='cmdline=%r, kwargs=%r' % (cmdline, kwargs))
+
+    def test_default_special_strings(self):
+        self.do('ab \\"\'')
+
+    def test_filter_chain_operators(self):
+        self.do('a&| \\"\'', delims=('&', '|'))
+
+    def test_filter_operators(self):
+        self.do('a=~<>! \\"\'', maxdelims=1, delims=('=', '~', '>', '<', '>=', '<=', '=~'),
+                escapes=('\\',))
+
+    def test_no_quotes(self):
+        self.do('a! \\"', delims=('!',), escapes=('\\',), quotes=())
+
+    def test_maxdelims(self):
+        self.do('a: \\"\'', maxdelims=2, delims=(':', ' '))
+
+    def test_multichar_special_strings(self):
+        self.do(':! .\'a', delims=('::', ' '), escapes=('!!',), quotes=('..', "'"))
+
+    def test_overlapping_special_strings(self):
+        self.do('abc\\', delims=('abc', 'b'), escapes=('\\', 'c'), quotes=('ab',))
+
+
 class Test_get_position(unittest.TestCase):
     def do(self, input, output):
         self.assertEqual(cliparser.get_position(*input), output)
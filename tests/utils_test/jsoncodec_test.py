@@ -0,0 +1,104 @@
+import importlib
+import json
+import unittest
+
+from stig.utils import jsoncodec
+
+
+def available_backends():
+    for name in jsoncodec.BACKENDS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+        else:
+            yield name
+
+
+class TestJSONCodec(unittest.TestCase):
+    def setUp(self):
+        self.orig_backend = jsoncodec.backend()
+
+    def tearDown(self):
+        jsoncodec.use(self.orig_backend)
+
+    def test_stdlib_is_always_available(self):
+        self.assertEqual(jsoncodec.use('json'), 'json')
+        self.assertEqual(jsoncodec.backend(), 'json')
+
+    def test_unsupported_backend(self):
+        with self.assertRaises(ValueError) as cm:
+            jsoncodec.use('foo', 'json')
+        self.assertEqual(str(cm.exception), "Unsupported JSON library: 'foo'")
+        self.assertEqual(jsoncodec.backend(), self.orig_backend)
+
+    def test_roundtrip(self):
+        data = {'method': 'torrent-get',
+                'arguments': {'fields': ['id', 'name'], 'ids': [1, 2, 3]},
+                'tag': 'ÄÖÜ'}
+        for name in available_backends():
+            jsoncodec.use(name)
+            self.assertEqual(jsoncodec.loads(jsoncodec.dumps(data)), data)
+
+    def test_dumping_subclasses_of_builtin_types(self):
+        class Fields(tuple): pass
+        class Size(float): pass
+        data = {'fields': Fields(('id', 'name')), 'limit': Size(1.5)}
+        for name in available_backends():
+            jsoncodec.use(name)
+            self.assertEqual(json.loads(jsoncodec.dumps(data)),
+                             {'fields': ['id', 'name'], 'limit': 1.5})
+
+    def test_dumping_unserializable_object(self):
+        for name in available_backends():
+            jsoncodec.use(name)
+            with self.assertRaises(TypeError):
+                jsoncodec.dumps({'foo': object()})
+
+    def test_loading_malformed_json(self):
+        for name in available_backends():
+            jsoncodec.use(name)
+            for data in ('{"foo": ', b'{"foo": '):
+                with self.assertRaises(ValueError):
+                    jsoncodec.loads(data)
+
+
+class TestIterloads(unittest.TestCase):
+    def iterloads(self, data, **kwargs):
+        decoder = jsoncodec.iterloads(data, **kwargs)
+        chunks = 0
+        while True:
+            try:
+                next(decoder)
+            except StopIteration as e:
+                return e.value, chunks
+            chunks += 1
+
+    def test_same_result_as_loads(self):
+        for data in ('[]', '{}', '"foo"', '-1.5', 'null',
+                     ' { "a" : [ 1 , 2 , {"b": []} ] , "c": {} } ',
+                     '[[[[1, {"ä": "ü"}]]]]'):
+            for depth in (0, 1, 3, 10):
+                self.assertEqual(self.iterloads(data, depth=depth)[0], json.loads(data))
+                self.assertEqual(self.iterloads(data.encode('utf-8'), depth=depth)[0],
+                                 json.loads(data))
+
+    def test_yielding_after_chunk_size(self):
+        data = json.dumps({'arguments': {'torrents': [{'id': i, 'name': 'Torrent %d' % i}
+                                                      for i in range(1000)]}})
+        value, chunks = self.iterloads(data, chunk_size=1000)
+        self.assertEqual(value, json.loads(data))
+        self.assertGreaterEqual(chunks, len(data) // 1000 - 1)
+        self.assertLessEqual(chunks, len(data) // 1000)
+
+    def test_values_deeper_than_depth_are_not_split(self):
+        data = json.dumps([[list(range(1000))]])
+        self.assertEqual(self.iterloads(data, chunk_size=10, depth=2)[1], 1)
+        self.assertGreater(self.iterloads(data, chunk_size=10, depth=3)[1], 100)
+
+    def test_loading_malformed_json(self):
+        for data in ('', '{"foo": ', '[1,]', '[1 2]', '[', '{"a" 1}', '{1: 2}',
+                     '{"a": 1,}', '[1] 2'):
+            for depth in (0, 3):
+                with self.assertRaises(ValueError):
+                    self.iterloads(data, depth=depth)